@@ -0,0 +1,23 @@
+// Generated by scripts/render_share_cards.py; do not edit.
+
+/// A pre-rendered share card: bundled asset, content hash and size in bytes.
+class ShareCard {
+  const ShareCard(this.asset, this.hash, this.bytes);
+
+  final String asset;
+  final String hash;
+  final int bytes;
+}
+
+const Map<String, ShareCard> shareCards = {
+  'en-AU': ShareCard('assets/images/share/en-US.png', 'f10157bcef082a48b482c72f6abb4ac2', 216450),
+  'en-CA': ShareCard('assets/images/share/en-US.png', 'f10157bcef082a48b482c72f6abb4ac2', 216450),
+  'en-GB': ShareCard('assets/images/share/en-US.png', 'f10157bcef082a48b482c72f6abb4ac2', 216450),
+  'en-US': ShareCard('assets/images/share/en-US.png', 'f10157bcef082a48b482c72f6abb4ac2', 216450),
+  'es-AR': ShareCard('assets/images/share/es-AR.png', 'c83ec55eae34dbbe7fec0c19541b96ff', 215486),
+  'es-ES': ShareCard('assets/images/share/es-AR.png', 'c83ec55eae34dbbe7fec0c19541b96ff', 215486),
+  'es-MX': ShareCard('assets/images/share/es-AR.png', 'c83ec55eae34dbbe7fec0c19541b96ff', 215486),
+  'es-UY': ShareCard('assets/images/share/es-AR.png', 'c83ec55eae34dbbe7fec0c19541b96ff', 215486),
+  'pt-BR': ShareCard('assets/images/share/pt-BR.png', '20a888305dfe8e0f076192808ab5873c', 215613),
+  'pt-PT': ShareCard('assets/images/share/pt-PT.png', '072e3d4b2a6bb3bb294dcc05903b22a2', 216414),
+};
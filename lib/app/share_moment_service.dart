@@ -5,6 +5,7 @@ import 'package:flutter/services.dart';
 import 'package:path_provider/path_provider.dart';
 import 'package:share_plus/share_plus.dart';
 
+import 'share_cards.dart';
 import 'strings.dart';
 
 class ShareMomentService {
@@ -13,8 +14,22 @@ class ShareMomentService {
   static const String _iosStoreUrl =
       'https://apps.apple.com/ar/app/impostor-words-party-game/id6757995242';
 
+  static const String _tempFilePrefix = 'impostor_words_share_';
+
+  // Same defaults as WordPackRepository._languageFallback.
+  static const Map<String, String> _languageFallback = {
+    'es': 'es-AR',
+    'en': 'en-US',
+    'pt': 'pt-BR',
+  };
+
+  /// Cards being written to the temp directory, by content hash, so
+  /// overlapping shares of the same card write it once.
+  static final Map<String, Future<File>> _pendingFiles = {};
+
   static Future<bool> shareMoment({
     required Strings strings,
+    required String locale,
     required int players,
   }) async {
     final storeUrl = _storeUrlForCurrentPlatform();
@@ -24,7 +39,7 @@ class ShareMomentService {
 
     // Share an image to improve compatibility with Instagram.
     // Many Instagram targets don't appear for text/plain, but they do for images.
-    final imageFile = await _writeShareImageToTempFile(strings);
+    final imageFile = await _shareImageFile(locale);
     final files = <XFile>[
       XFile(
         imageFile.path,
@@ -50,26 +65,61 @@ class ShareMomentService {
         'iOS: $_iosStoreUrl';
   }
 
-  static Future<File> _writeShareImageToTempFile(Strings strings) async {
-    final assetPath = _shareImageAssetPath(strings);
-    final bytes = (await rootBundle.load(assetPath))
-        .buffer
-        .asUint8List();
+  static ShareCard _shareCardFor(String locale) {
+    final language = locale.split('-').first.toLowerCase();
+    return shareCards[locale] ??
+        shareCards[_languageFallback[language]] ??
+        shareCards['en-US']!;
+  }
+
+  /// The card of [locale] as a file in the temp directory.
+  ///
+  /// The file is named after the card's content hash, so a copy written by an
+  /// earlier share (or launch) is reused as long as it is intact; the asset is
+  /// only loaded and written when it is missing or the card changed. The
+  /// check runs on every share, so a copy removed by the OS is written again.
+  static Future<File> _shareImageFile(String locale) {
+    final card = _shareCardFor(locale);
+    return _pendingFiles[card.hash] ??= _materializeCard(card)
+        .whenComplete(() => _pendingFiles.remove(card.hash));
+  }
+
+  static Future<File> _materializeCard(ShareCard card) async {
     final dir = await getTemporaryDirectory();
-    final extension = assetPath.toLowerCase().endsWith('.jpeg')
-        ? 'jpeg'
-        : assetPath.toLowerCase().endsWith('.jpg')
-            ? 'jpg'
-            : 'png';
-    final file = File('${dir.path}/impostor_words_share.$extension');
-    await file.writeAsBytes(bytes, flush: true);
-    return file;
+    final file = File('${dir.path}/$_tempFilePrefix${card.hash}.png');
+    if (await file.exists() && await file.length() == card.bytes) {
+      return file;
+    }
+    final bytes = (await rootBundle.load(card.asset)).buffer.asUint8List();
+    // Write next to it and rename, so a half-written file is never shared.
+    final partial = File('${file.path}.partial');
+    await partial.writeAsBytes(bytes, flush: true);
+    final written = await partial.rename(file.path);
+    await _deleteStaleCards(dir);
+    return written;
   }
 
-  static String _shareImageAssetPath(Strings strings) {
-    if (strings.isEs) return 'assets/images/sharing/sharing_spanish.png';
-    if (strings.isPt) return 'assets/images/sharing/sharing_portuguez.png';
-    return 'assets/images/sharing/sharing_english.png';
+  /// Deletes copies of cards this build no longer ships (earlier versions of
+  /// the app); the current cards of every locale are kept.
+  static Future<void> _deleteStaleCards(Directory dir) async {
+    final current = {
+      for (final card in shareCards.values) '$_tempFilePrefix${card.hash}.png',
+    };
+    try {
+      await for (final entity in dir.list()) {
+        final name = entity.uri.pathSegments.last;
+        final card = name.endsWith('.partial')
+            ? name.substring(0, name.length - '.partial'.length)
+            : name;
+        if (entity is File &&
+            name.startsWith(_tempFilePrefix) &&
+            !current.contains(card)) {
+          await entity.delete();
+        }
+      }
+    } on FileSystemException {
+      // Best effort: the OS clears the temp directory eventually.
+    }
   }
 
   static String _shareFilenameFor(Strings strings) {
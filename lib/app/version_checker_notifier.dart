@@ -21,7 +21,10 @@ class VersionCheckerNotifier extends StateNotifier<AsyncValue<void>> {
     }
     state = const AsyncValue.loading();
     try {
-      final updateType = await VersionCheckerService.checkForUpdate();
+      // La verificación manual (settings) no usa la info guardada.
+      final updateType = await VersionCheckerService.checkForUpdate(
+        forceRefresh: showNoUpdateMessage,
+      );
       if (updateType != null) {
         final storeUrl = await VersionCheckerService.getStoreUrl();
         if (updateType == 'hard') {
@@ -2,32 +2,140 @@ import 'dart:convert';
 import 'dart:io';
 import 'package:http/http.dart' as http;
 import 'package:package_info_plus/package_info_plus.dart';
+import 'package:shared_preferences/shared_preferences.dart';
 
 import '../domain/models/app_version_info.dart';
 
 class VersionCheckerService {
-  static const String _versionUrl =
-      'https://raw.githubusercontent.com/ramirogioia/dolar_argentina_back/main/versions/impostor.json';
+  /// Se puede apuntar al servidor local de `tools/version_info.py serve` con
+  /// `--dart-define=VERSION_INFO_URL=http://127.0.0.1:8766/impostor.json`.
+  static const String _versionUrl = String.fromEnvironment(
+    'VERSION_INFO_URL',
+    defaultValue:
+        'https://raw.githubusercontent.com/ramirogioia/dolar_argentina_back/main/versions/impostor.json',
+  );
+
+  /// Durante este tiempo se usa la info guardada sin consultar la red.
+  static const Duration _ttl = Duration(hours: 6);
+
+  /// Sin red, la última info descargada se sigue usando hasta esta edad.
+  static const Duration _maxStale = Duration(days: 7);
+
+  /// Tras un error de red no se reintenta antes de este tiempo.
+  static const Duration _retryDelay = Duration(minutes: 1);
+  static const Duration _timeout = Duration(seconds: 5);
+
+  static const _keyBody = 'version_info_body';
+  static const _keyEtag = 'version_info_etag';
+  static const _keyFetchedAt = 'version_info_fetched_at';
+
+  static _CachedVersionInfo? _memory;
+
+  /// Consultas en curso, una normal y una forzada: una forzada no se une a
+  /// una normal, que puede responder con la info guardada sin ir a la red.
+  static Future<AppVersionInfo?>? _inFlight;
+  static Future<AppVersionInfo?>? _inFlightForced;
+  static DateTime? _retryAfter;
+
+  /// Info de versión: de memoria o disco mientras no pasó [_ttl], si no
+  /// desde la red con `If-None-Match` (un 304 sólo renueva la fecha).
+  /// Las llamadas simultáneas con el mismo [forceRefresh] comparten una
+  /// misma consulta.
+  /// [forceRefresh] ignora [_ttl] (p. ej. el botón "buscar actualizaciones").
+  static Future<AppVersionInfo?> fetchVersionInfo({bool forceRefresh = false}) {
+    final cached = _memory;
+    if (!forceRefresh && cached != null && cached.isFresh) {
+      return Future.value(cached.info);
+    }
+    if (forceRefresh) {
+      return _inFlightForced ??=
+          _refresh(true).whenComplete(() => _inFlightForced = null);
+    }
+    return _inFlight ??=
+        _refresh(false).whenComplete(() => _inFlight = null);
+  }
+
+  static Future<AppVersionInfo?> _refresh(bool forceRefresh) async {
+    final prefs = await SharedPreferences.getInstance();
+    final cached = _memory ?? _readCache(prefs);
+    _memory = cached;
+    if (cached != null && !forceRefresh && cached.isFresh) {
+      return cached.info;
+    }
+    final retryAfter = _retryAfter;
+    if (!forceRefresh &&
+        retryAfter != null &&
+        DateTime.now().isBefore(retryAfter)) {
+      return cached?.usable == true ? cached!.info : null;
+    }
 
-  /// Consulta el JSON de versión desde GitHub
-  static Future<AppVersionInfo?> fetchVersionInfo() async {
     try {
-      final response = await http.get(Uri.parse(_versionUrl));
+      final etag = cached?.etag;
+      final response = await http.get(
+        Uri.parse(_versionUrl),
+        headers: {if (etag != null) 'If-None-Match': etag},
+      ).timeout(_timeout);
+      if (response.statusCode == 304 && cached != null) {
+        return (await _store(prefs, cached.body, etag)).info;
+      }
       if (response.statusCode == 200) {
-        final Map<String, dynamic> data =
-            jsonDecode(response.body) as Map<String, dynamic>;
-        return AppVersionInfo.fromJson(data);
+        return (await _store(prefs, response.body, response.headers['etag']))
+            .info;
       }
-      return null;
+    } catch (e) {
+      // Sin red, timeout o JSON inválido: se sigue con lo guardado.
+    }
+    _retryAfter = DateTime.now().add(_retryDelay);
+    return cached?.usable == true ? cached!.info : null;
+  }
+
+  static _CachedVersionInfo? _readCache(SharedPreferences prefs) {
+    final body = prefs.getString(_keyBody);
+    final fetchedAt = prefs.getInt(_keyFetchedAt);
+    if (body == null || fetchedAt == null) return null;
+    try {
+      return _CachedVersionInfo(
+        info: _parse(body),
+        body: body,
+        etag: prefs.getString(_keyEtag),
+        fetchedAt: DateTime.fromMillisecondsSinceEpoch(fetchedAt),
+      );
     } catch (e) {
       return null;
     }
   }
 
+  static Future<_CachedVersionInfo> _store(
+    SharedPreferences prefs,
+    String body,
+    String? etag,
+  ) async {
+    final entry = _CachedVersionInfo(
+      info: _parse(body),
+      body: body,
+      etag: etag,
+      fetchedAt: DateTime.now(),
+    );
+    _memory = entry;
+    _retryAfter = null;
+    await prefs.setString(_keyBody, body);
+    if (etag == null) {
+      await prefs.remove(_keyEtag);
+    } else {
+      await prefs.setString(_keyEtag, etag);
+    }
+    await prefs.setInt(_keyFetchedAt, entry.fetchedAt.millisecondsSinceEpoch);
+    return entry;
+  }
+
+  static AppVersionInfo _parse(String body) {
+    return AppVersionInfo.fromJson(jsonDecode(body) as Map<String, dynamic>);
+  }
+
   /// Compara la versión actual con la disponible
   /// Retorna: null si no hay actualización, 'soft' si es opcional, 'hard' si es forzada
-  static Future<String?> checkForUpdate() async {
-    final versionInfo = await fetchVersionInfo();
+  static Future<String?> checkForUpdate({bool forceRefresh = false}) async {
+    final versionInfo = await fetchVersionInfo(forceRefresh: forceRefresh);
     if (versionInfo == null) return null;
 
     final packageInfo = await PackageInfo.fromPlatform();
@@ -50,7 +158,8 @@ class VersionCheckerService {
     return null;
   }
 
-  /// Obtiene la URL de la tienda según la plataforma
+  /// Obtiene la URL de la tienda según la plataforma (de la info ya
+  /// descargada por [checkForUpdate], sin otra consulta).
   static Future<String> getStoreUrl() async {
     final versionInfo = await fetchVersionInfo();
     if (versionInfo == null) {
@@ -80,3 +189,23 @@ class VersionCheckerService {
     return 0;
   }
 }
+
+class _CachedVersionInfo {
+  const _CachedVersionInfo({
+    required this.info,
+    required this.body,
+    required this.etag,
+    required this.fetchedAt,
+  });
+
+  final AppVersionInfo info;
+  final String body;
+  final String? etag;
+  final DateTime fetchedAt;
+
+  Duration get age => DateTime.now().difference(fetchedAt);
+
+  bool get isFresh => age < VersionCheckerService._ttl;
+
+  bool get usable => age < VersionCheckerService._maxStale;
+}
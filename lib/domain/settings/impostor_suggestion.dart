@@ -4,15 +4,19 @@ import 'settings_state.dart';
 ///
 /// Algorithm (keep in sync with product spec):
 /// 1) baseRatio by difficulty:
-///    - easy:   0.12
-///    - medium: 0.18
-///    - hard:   0.25
+///    - easy:   0.14
+///    - medium: 0.20
+///    - hard:   0.27
 /// 2) recommended = round(players * baseRatio)
 /// 3) Clamp: recommended = clamp(recommended, 1, min(6, players - 1))
 /// 4) For players <= 4, force recommended = 1 (all difficulties)
 /// 5) For players 5-7:
 ///    - easy max 1, medium max 2, hard max 2 (still respecting clamp)
-/// 6) For players >= 15 and difficulty hard, ensure recommended >= 3 (still clamped)
+/// 6) For players >= 8 and difficulty medium/hard, ensure recommended >= 2 (still clamped)
+/// 7) For players >= 15 and difficulty hard, ensure recommended >= 3 (still clamped)
+///
+/// tools/impostor_balance.py models this function and fails when this list
+/// and the code below disagree.
 int suggestImpostors({
   required int players,
   required Difficulty difficulty,
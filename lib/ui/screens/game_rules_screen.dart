@@ -100,14 +100,14 @@ class _GameRulesScreenState extends ConsumerState<GameRulesScreen> {
                                 ? Container(
                                     color: Colors.white,
                                     child: Image.asset(
-                                      'assets/images/icon_square_foreground.png',
+                                      'assets/images/logo/icon_square_foreground.png',
                                       fit: BoxFit.contain,
                                       errorBuilder: (_, __, ___) =>
                                           const LogoMark(size: 100, isLight: true),
                                     ),
                                   )
                                 : Image.asset(
-                                    'assets/images/icon_square.png',
+                                    'assets/images/logo/icon_square.png',
                                     fit: BoxFit.contain,
                                     errorBuilder: (_, __, ___) =>
                                         const LogoMark(size: 100),
@@ -405,8 +405,11 @@ class _GameScreenState extends ConsumerState<GameScreen> {
       );
     } else if (result == 'share') {
       final players = _session?.players ?? settings.players;
-      final didShare =
-          await ShareMomentService.shareMoment(strings: strings, players: players);
+      final didShare = await ShareMomentService.shareMoment(
+        strings: strings,
+        locale: settings.locale,
+        players: players,
+      );
       if (didShare) {
         ref.read(shareMomentNotifierProvider.notifier).onShared();
       } else if (showShareOption) {
@@ -608,7 +611,7 @@ class _GameScreenState extends ConsumerState<GameScreen> {
       for (final category in categories) {
         if (category.id == SettingsState.randomCategory) continue;
         final filtered = category.words
-            .where((w) => w.difficulty == effectiveDifficulty)
+            .where((w) => w.difficulty.name == effectiveDifficulty.name)
             .toList();
         final pool = filtered.isNotEmpty ? filtered : category.words;
         for (final w in pool) {
@@ -645,7 +648,7 @@ class _GameScreenState extends ConsumerState<GameScreen> {
         orElse: () => categories.first,
       );
       final filtered = category.words
-          .where((w) => w.difficulty == effectiveDifficulty)
+          .where((w) => w.difficulty.name == effectiveDifficulty.name)
           .toList();
       final pool = filtered.isNotEmpty ? filtered : category.words;
       entry = pool[rand.nextInt(pool.length)];
@@ -138,14 +138,14 @@ class _PlayerRevealScreenState extends ConsumerState<PlayerRevealScreen>
                           ? Container(
                               color: Colors.white,
                               child: Image.asset(
-                                'assets/images/icon_square_foreground.png',
+                                'assets/images/logo/icon_square_foreground.png',
                                 fit: BoxFit.contain,
                                 errorBuilder: (_, __, ___) =>
                                     const LogoMark(size: 120, isLight: true),
                               ),
                             )
                           : Image.asset(
-                              'assets/images/icon_square.png',
+                              'assets/images/logo/icon_square.png',
                               fit: BoxFit.contain,
                               errorBuilder: (_, __, ___) =>
                                   const LogoMark(size: 120),
@@ -378,7 +378,7 @@ class _SetupContentState extends ConsumerState<_SetupContent> {
                       ? Container(
                           color: Colors.white,
                           child: Image.asset(
-                            'assets/images/icon_square_foreground.png',
+                            'assets/images/logo/icon_square_foreground.png',
                             fit: BoxFit.contain,
                             errorBuilder: (_, __, ___) => LogoMark(
                               size: isTablet ? 160 : 120,
@@ -387,7 +387,7 @@ class _SetupContentState extends ConsumerState<_SetupContent> {
                           ),
                         )
                       : Image.asset(
-                          'assets/images/icon_square.png',
+                          'assets/images/logo/icon_square.png',
                           fit: BoxFit.contain,
                           errorBuilder: (_, __, ___) => LogoMark(
                             size: isTablet ? 160 : 120,
@@ -0,0 +1,145 @@
+"""The share card template ("Now Available", app name, icon, store badges).
+
+One layout for every locale, after the hand-made cards in
+assets/images/sharing/: a radial grey-to-black background, the headline and
+store title, the iOS icon in a rounded frame with a soft glow, and two
+store badges. ``base`` draws everything that does not depend on the text
+once; ``render`` adds the text of one ``CardText``.
+
+Text is set in Lato (fonts/, SIL Open Font License; the heavier lines get a
+1 px stroke) unless another TrueType file is given. Shipping the font with
+the scripts keeps the cards byte-for-byte the same on every machine, and
+Pillow's own default font has no accented letters. Fonts are loaded once
+per (path, size) and process (``font``).
+"""
+
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+from .mipchain import RESAMPLE
+from .stamps import file_digest
+
+DEFAULT_FONT = Path(__file__).resolve().parent / "fonts" / "Lato-Regular.ttf"
+SIZE = (1024, 1536)
+# Bump when the layout below changes.
+TEMPLATE_VERSION = 1
+
+BACKGROUND_CENTER = (512, 860)
+BACKGROUND_INNER = 92  # grey at the centre
+BACKGROUND_OUTER = 10  # grey at the far corners
+ICON_BOX = (240, 515, 784, 1059)
+ICON_RADIUS = 0.21  # of the icon side
+BADGE_SIZE = (316, 92)
+BADGE_GAP = 44
+BADGE_TOP = 1196
+HEADLINE_Y = 310
+SUBTITLE_Y = 405
+
+
+@dataclass(frozen=True)
+class CardText:
+    headline: str
+    subtitle: str
+    app_store: tuple[str, str]  # small line, large line
+    google_play: tuple[str, str]
+
+
+APP_NAME = "Impostor Words: Party Game"  # the store listing title, not translated
+LANGUAGE_TEXT = {
+    "en": CardText("Now Available", APP_NAME, ("Download on the", "App Store"), ("Get it on", "Google Play")),
+    "es": CardText("Ya disponible", APP_NAME, ("Disponible en el", "App Store"), ("Disponible en", "Google Play")),
+    "pt": CardText("Já disponível", APP_NAME, ("Disponível na", "App Store"), ("Disponível no", "Google Play")),
+}
+# Regional wording, applied over the language's (same fields as CardText).
+REGION_TEXT = {
+    "pt-PT": {"app_store": ("Descarregar na", "App Store")},
+}
+
+
+def card_text(locale: str) -> CardText:
+    base = LANGUAGE_TEXT.get(locale.split("-")[0], LANGUAGE_TEXT["en"])
+    overrides = REGION_TEXT.get(locale)
+    if not overrides:
+        return base
+    return CardText(**{**base.__dict__, **overrides})
+
+
+@functools.lru_cache(maxsize=None)
+def font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(path, size)
+
+
+def _rounded_mask(size: int, radius: float, supersample: int = 4) -> Image.Image:
+    big = Image.new("L", (size * supersample, size * supersample), 0)
+    ImageDraw.Draw(big).rounded_rectangle((0, 0, big.width - 1, big.height - 1), radius=radius * supersample, fill=255)
+    return big.resize((size, size), Image.Resampling.LANCZOS)
+
+
+def _background() -> Image.Image:
+    w, h = SIZE
+    cx, cy = BACKGROUND_CENTER
+    reach = max(((x - cx) ** 2 + (y - cy) ** 2) ** 0.5 for x in (0, w) for y in (0, h))
+    # radial_gradient is 256x256, 0 at the centre and 255 at radius 128.
+    side = round(reach * 2)
+    gradient = Image.radial_gradient("L").resize((side, side), Image.Resampling.BICUBIC)
+    scale = 255 / 128
+    lut = [round(BACKGROUND_INNER + (BACKGROUND_OUTER - BACKGROUND_INNER) * min(1.0, v / scale / 128)) for v in range(256)]
+    gradient = gradient.point(lut)
+    left, top = side // 2 - cx, side // 2 - cy
+    return gradient.crop((left, top, left + w, top + h)).convert("RGB")
+
+
+def _badge_boxes() -> list[tuple[int, int, int, int]]:
+    bw, bh = BADGE_SIZE
+    left = (SIZE[0] - 2 * bw - BADGE_GAP) // 2
+    return [(x, BADGE_TOP, x + bw, BADGE_TOP + bh) for x in (left, left + bw + BADGE_GAP)]
+
+
+def base(icon: Image.Image) -> Image.Image:
+    """Background, framed icon and empty badges: the part shared by every locale."""
+    card = _background()
+    x0, y0, x1, y1 = ICON_BOX
+    side = x1 - x0
+    radius = side * ICON_RADIUS
+    mask = _rounded_mask(side, radius)
+
+    glow = Image.new("L", SIZE, 0)
+    glow.paste(mask, (x0, y0))
+    glow = glow.filter(ImageFilter.GaussianBlur(22)).point(lambda v: v * 45 // 100)
+    card.paste((235, 235, 235), (0, 0), glow)
+
+    framed = icon.convert("RGB").resize((side, side), RESAMPLE)
+    card.paste(framed, (x0, y0), mask)
+    rim = Image.new("L", (side * 4, side * 4), 0)
+    ImageDraw.Draw(rim).rounded_rectangle((0, 0, side * 4 - 1, side * 4 - 1), radius=radius * 4, outline=255, width=12)
+    card.paste((170, 170, 170), (x0, y0), rim.resize((side, side), Image.Resampling.LANCZOS))
+
+    draw = ImageDraw.Draw(card)
+    for box in _badge_boxes():
+        draw.rounded_rectangle(box, radius=16, fill=(0, 0, 0), outline=(150, 150, 150), width=2)
+    return card
+
+
+def render(base_card: Image.Image, text: CardText, font_path: str = str(DEFAULT_FONT)) -> Image.Image:
+    card = base_card.copy()
+    draw = ImageDraw.Draw(card)
+    cx = SIZE[0] // 2
+    draw.text((cx, HEADLINE_Y), text.headline, font=font(font_path, 68), fill=(255, 255, 255), anchor="mm",
+              stroke_width=1, stroke_fill=(255, 255, 255))
+    draw.text((cx, SUBTITLE_Y), text.subtitle, font=font(font_path, 44), fill=(226, 226, 226), anchor="mm")
+    for (x0, y0, x1, y1), (small, large) in zip(_badge_boxes(), (text.app_store, text.google_play)):
+        mid = (x0 + x1) // 2
+        draw.text((mid, y0 + 27), small, font=font(font_path, 22), fill=(235, 235, 235), anchor="mm")
+        draw.text((mid, y0 + 61), large, font=font(font_path, 38), fill=(255, 255, 255), anchor="mm",
+                  stroke_width=1, stroke_fill=(255, 255, 255))
+    return card
+
+
+def font_key(font_path: Path) -> str:
+    """What the rendered text depends on, for the stamps."""
+    return f"{file_digest(font_path)}:freetype {ImageFont.core.freetype2_version}"
@@ -0,0 +1,126 @@
+"""Flutter resolution variants (1.0x/2.0x/3.0x) of the logos drawn by the screens.
+
+The screens draw the logo with ``Image.asset('assets/images/<logo>.png')``
+inside a ``SizedBox(height: ...)`` and ``BoxFit.contain``, so the logo is a
+square with that side in logical pixels. ``logo_uses`` reads those heights
+from the Dart sources (every number of the expression, so ``isTablet ? 160 :
+120`` counts as 160), and ``variant_sizes`` turns the largest one into a pixel
+size per scale. Flutter picks a variant from assets/images/logo/ and its
+``2.0x``/``3.0x`` subdirectories by device pixel ratio (``choose_scale``).
+
+Without variants the 1024x1024 master is decoded in full, 4 MiB of RGBA per
+logo, whatever its size on screen; ``memory_report`` compares that with the
+bitmap of the chosen variant for each screen and common pixel ratio.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+SCREENS = (
+    "lib/ui/screens/player_reveal_screen.dart",
+    "lib/ui/screens/game_rules_screen.dart",
+    "lib/ui/screens/setup_screen.dart",
+)
+VARIANT_DIR = "assets/images/logo"
+SCALES = (1.0, 2.0, 3.0)
+# mdpi, hdpi, xhdpi / iOS @2x, common 1080p Android, xxhdpi / iOS @3x, 1440p Android.
+DEVICE_RATIOS = (1.0, 1.5, 2.0, 2.625, 3.0, 3.5)
+# AssetImage always rounds up below this ratio (_kLowDprLimit in Flutter).
+LOW_DPR_LIMIT = 2.0
+BYTES_PER_PIXEL = 4  # decoded RGBA
+
+_LOGO = re.compile(r"Image\.asset\(\s*'assets/images/(?:logo/)?(?P<name>[\w-]+)\.png'")
+_BOX = re.compile(r"SizedBox\(\s*height:\s*(?P<expr>[^,]+),")
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+
+
+@dataclass(frozen=True)
+class LogoUse:
+    screen: str  # file stem
+    logo: str  # asset name without extension
+    logical: float  # largest height of the enclosing SizedBox
+    line: int
+
+
+def logo_uses(root: Path, screens: tuple[str, ...] = SCREENS) -> list[LogoUse]:
+    uses = []
+    for rel in screens:
+        source = (root / rel).read_text(encoding="utf-8")
+        for match in _LOGO.finditer(source):
+            boxes = list(_BOX.finditer(source, 0, match.start()))
+            if not boxes:
+                raise ValueError(f"{rel}: no SizedBox(height: ...) around the logo at offset {match.start()}")
+            sizes = [float(n) for n in _NUMBER.findall(boxes[-1]["expr"])]
+            if not sizes:
+                raise ValueError(f"{rel}: no logical height in {boxes[-1]['expr']!r}")
+            line = source.count("\n", 0, match.start()) + 1
+            uses.append(LogoUse(Path(rel).stem, match["name"], max(sizes), line))
+    return uses
+
+
+def variant_path(logo: str, scale: float) -> str:
+    """Asset path of one variant, relative to the project root."""
+    sub = "" if scale == 1.0 else f"{scale:.1f}x/"
+    return f"{VARIANT_DIR}/{sub}{logo}.png"
+
+
+def variant_sizes(uses: list[LogoUse], scales: tuple[float, ...] = SCALES) -> dict[str, dict[float, int]]:
+    """``{logo: {scale: pixel side}}`` covering the largest use of each logo."""
+    largest: dict[str, float] = {}
+    for use in uses:
+        largest[use.logo] = max(largest.get(use.logo, 0.0), use.logical)
+    return {logo: {s: math.ceil(px * s) for s in scales} for logo, px in sorted(largest.items())}
+
+
+def choose_scale(scales: tuple[float, ...], ratio: float) -> float:
+    """The variant ``AssetImage`` loads at ``ratio`` (``_findBestVariant``)."""
+    if ratio in scales:
+        return ratio
+    lower = max((s for s in scales if s < ratio), default=None)
+    upper = min((s for s in scales if s > ratio), default=None)
+    if lower is None:
+        return upper
+    if upper is None:
+        return lower
+    return upper if ratio < LOW_DPR_LIMIT or ratio > (upper + lower) / 2 else lower
+
+
+def memory_report(uses: list[LogoUse], variants: dict[str, dict[float, int]],
+                  master_sizes: dict[str, tuple[int, int]]) -> dict:
+    """Decoded bytes per screen and pixel ratio, master vs the chosen variant."""
+    rows = []
+    for use in uses:
+        w, h = master_sizes[use.logo]
+        scales = tuple(sorted(variants[use.logo]))
+        after = {}
+        for ratio in DEVICE_RATIOS:
+            scale = choose_scale(scales, ratio)
+            px = variants[use.logo][scale]
+            after[str(ratio)] = {"variant": f"{scale:.1f}x", "px": px, "bytes": px * px * BYTES_PER_PIXEL}
+        rows.append({
+            "screen": use.screen,
+            "line": use.line,
+            "logo": use.logo,
+            "logical": use.logical,
+            "before": {"px": [w, h], "bytes": w * h * BYTES_PER_PIXEL},
+            "after": after,
+        })
+    return {
+        "device_ratios": list(DEVICE_RATIOS),
+        "variants": {logo: {f"{s:.1f}x": px for s, px in sizes.items()} for logo, sizes in variants.items()},
+        "screens": rows,
+    }
+
+
+def format_report(report: dict) -> list[str]:
+    ratios = report["device_ratios"]
+    lines = [f"{'decoded logo KiB':46} {'before':>7}  " + " ".join(f"{r:>6g}x" for r in ratios)]
+    for row in report["screens"]:
+        after = " ".join(f"{row['after'][str(r)]['bytes'] // 1024:>7}" for r in ratios)
+        label = f"{row['screen']}:{row['line']} {row['logo']}"
+        lines.append(f"{label[:46]:46} {row['before']['bytes'] // 1024:>7}  {after}")
+    return lines
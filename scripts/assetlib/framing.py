@@ -0,0 +1,131 @@
+"""Logo framing: find the subject of an image and re-frame it on a canvas (NumPy).
+
+The subject mask is alpha-aware: for an image with any transparency a pixel
+belongs to the subject when its alpha is at least ``threshold``; for an
+opaque image, when its luminance (Pillow's ``L``) differs from the
+background's by at least ``threshold``. The background is the median of the
+four corner pixels unless the spec gives one. From the mask:
+
+* ``bbox``     rows and columns with any subject pixel (``np.any`` per axis);
+* ``centroid`` mean of the subject's coordinates, weighted by alpha (or by
+  the mask for opaque images), from the row and column sums.
+
+``frame`` pads the bbox, scales the crop so it fits ``frac`` of the canvas
+(the longest side touches it, as resize_ios_icon.py always did) and centres
+either the bbox or the centroid, clamped so the subject stays on the canvas.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from PIL import Image
+
+from .mipchain import RESAMPLE
+
+
+@dataclass(frozen=True)
+class FrameSpec:
+    name: str
+    source: str  # relative to assets/images
+    frac: float = 0.85  # subject fits in this share of the canvas
+    pad: int = 8  # source pixels kept around the detected subject
+    threshold: int = 25  # alpha, or luminance distance from the background
+    anchor: str = "bbox"  # "bbox" or "centroid" goes to the canvas centre
+    canvas: tuple[int, int] | None = None  # default: the source size
+    background: tuple[int, int, int] | None = None  # opaque images; default: corners
+
+    def key(self) -> str:
+        return repr(self)
+
+
+@dataclass
+class Subject:
+    size: tuple[int, int]  # source image size
+    has_alpha: bool
+    background: tuple[int, int, int]
+    bbox: tuple[int, int, int, int]  # x0, y0, x1, y1 (exclusive)
+    centroid: tuple[float, float]  # x, y
+    coverage: float  # share of the image that is subject
+
+
+def corner_background(rgb: np.ndarray) -> tuple[int, int, int]:
+    corners = rgb[[0, 0, -1, -1], [0, -1, 0, -1]]
+    return tuple(int(c) for c in np.median(corners, axis=0))
+
+
+def _luma(rgb: np.ndarray) -> np.ndarray:
+    """Pillow's ``convert("L")``: ITU-R 601-2 with 16-bit fixed point rounding."""
+    r, g, b = (rgb[..., i].astype(np.uint32) for i in range(3))
+    return ((r * 19595 + g * 38470 + b * 7471 + 0x8000) >> 16).astype(np.int16)
+
+
+def analyze(rgba: np.ndarray, threshold: int, background: tuple[int, int, int] | None = None) -> Subject:
+    """Mask, bbox and centroid of the subject of an ``(h, w, 4)`` uint8 array."""
+    h, w = rgba.shape[:2]
+    alpha = rgba[..., 3]
+    has_alpha = bool((alpha < 255).any())
+    rgb = rgba[..., :3]
+    bg = background or corner_background(rgb)
+    if has_alpha:
+        mask = alpha >= threshold
+        weights = np.where(mask, alpha, 0).astype(np.float64)
+    else:
+        bg_luma = _luma(np.array(bg, dtype=np.uint8))
+        mask = np.abs(_luma(rgb) - bg_luma) >= threshold
+        weights = mask.astype(np.float64)
+    rows = np.flatnonzero(mask.any(axis=1))
+    cols = np.flatnonzero(mask.any(axis=0))
+    if rows.size == 0:
+        raise ValueError("no subject found (everything matches the background)")
+    total = weights.sum()
+    cx = float(weights.sum(axis=0) @ np.arange(w)) / total
+    cy = float(weights.sum(axis=1) @ np.arange(h)) / total
+    return Subject(
+        size=(w, h),
+        has_alpha=has_alpha,
+        background=bg,
+        bbox=(int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1),
+        centroid=(cx, cy),
+        coverage=float(mask.mean()),
+    )
+
+
+def padded_box(subject: Subject, pad: int) -> tuple[int, int, int, int]:
+    x0, y0, x1, y1 = subject.bbox
+    w, h = subject.size
+    return (max(0, x0 - pad), max(0, y0 - pad), min(w, x1 + pad), min(h, y1 + pad))
+
+
+def fit(crop_size: tuple[int, int], target: tuple[int, int]) -> tuple[int, int]:
+    """Scale ``crop_size`` so its limiting side equals ``target``'s, keeping the aspect ratio."""
+    cw, ch = crop_size
+    tw, th = target
+    if cw * th >= ch * tw:
+        return tw, max(1, int(ch * tw / cw))
+    return max(1, int(cw * th / ch)), th
+
+
+def frame(crop: Image.Image, box: tuple[int, int, int, int], subject: Subject, spec: FrameSpec) -> Image.Image:
+    """Compose ``crop`` (the source cut to ``box``) on a new canvas according to ``spec``."""
+    width, height = canvas = spec.canvas or subject.size
+    nw, nh = fit(crop.size, (int(width * spec.frac), int(height * spec.frac)))
+    scaled = crop if crop.size == (nw, nh) else crop.resize((nw, nh), RESAMPLE)
+    if spec.anchor == "centroid":
+        sx, sy = nw / crop.width, nh / crop.height
+        px = round(width / 2 - (subject.centroid[0] - box[0]) * sx)
+        py = round(height / 2 - (subject.centroid[1] - box[1]) * sy)
+        px = min(max(px, min(0, width - nw)), max(0, width - nw))
+        py = min(max(py, min(0, height - nh)), max(0, height - nh))
+    elif spec.anchor == "bbox":
+        px, py = (width - nw) // 2, (height - nh) // 2
+    else:
+        raise ValueError(f"unknown anchor {spec.anchor!r}")
+    if subject.has_alpha:
+        out = Image.new("RGBA", canvas, (0, 0, 0, 0))
+        out.paste(scaled, (px, py))
+    else:
+        out = Image.new("RGB", canvas, subject.background)
+        out.paste(scaled.convert("RGB"), (px, py))
+    return out
@@ -0,0 +1,98 @@
+"""Mip chain of a decoded master image.
+
+Each level is half the previous one (LANCZOS). A target size is resampled
+from the smallest level that is still at least twice as large, so small icons
+no longer run a full 1024 px LANCZOS kernel while keeping the same quality
+(``generate_assets.py --check-quality`` measures it with SSIM against a
+direct resize of the master).
+
+``MipChain.cached`` keeps the levels on disk (.cache/mipchain/<key>/), keyed
+by the caller's source key (master hash plus whatever shaped the master),
+the filter and ``min_size``. A hit skips decoding the master PNG and building
+the chain: the levels are read back as raw pixel buffers.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+from PIL import Image
+
+from .stamps import CACHE_DIR, bytes_digest
+
+RESAMPLE = Image.Resampling.LANCZOS
+MIPCHAIN_DIR = CACHE_DIR / "mipchain"
+# Bump when the way levels are built changes.
+MIP_VERSION = 1
+
+
+class MipChain:
+    def __init__(self, master: Image.Image, min_size: int = 16, levels: list[Image.Image] | None = None) -> None:
+        if levels is not None:
+            self.levels = levels
+            return
+        self.levels = [master]
+        level = master
+        while min(level.size) // 2 >= min_size:
+            level = level.resize((level.width // 2, level.height // 2), RESAMPLE)
+            self.levels.append(level)
+
+    @classmethod
+    def cached(
+        cls,
+        source_key: str,
+        load: Callable[[], Image.Image],
+        min_size: int = 16,
+        cache_dir: Path = MIPCHAIN_DIR,
+    ) -> "MipChain":
+        """Chain for ``source_key`` from disk, or built from ``load()`` and stored."""
+        entry = cache_dir / bytes_digest(f"{source_key}:{RESAMPLE.name}:{min_size}:v{MIP_VERSION}".encode())
+        try:
+            meta = json.loads((entry / "levels.json").read_text(encoding="utf-8"))
+            levels = [
+                Image.frombytes(m["mode"], tuple(m["size"]), (entry / f"{i}.raw").read_bytes())
+                for i, m in enumerate(meta)
+            ]
+            return cls(levels[0], min_size, levels)
+        except (FileNotFoundError, ValueError, KeyError):
+            pass
+        chain = cls(load(), min_size)
+        chain._store(entry)
+        return chain
+
+    def _store(self, entry: Path) -> None:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(prefix=f".{entry.name}.", dir=entry.parent))
+        for i, level in enumerate(self.levels):
+            (tmp / f"{i}.raw").write_bytes(level.tobytes())
+        meta = [{"mode": level.mode, "size": list(level.size)} for level in self.levels]
+        (tmp / "levels.json").write_text(json.dumps(meta) + "\n", encoding="utf-8")
+        shutil.rmtree(entry, ignore_errors=True)
+        try:
+            os.replace(tmp, entry)
+        except OSError:  # another process stored the same chain first
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    @property
+    def master(self) -> Image.Image:
+        return self.levels[0]
+
+    def level_for(self, width: int, height: int) -> Image.Image:
+        """Smallest level with at least 2x the target resolution (the master if none)."""
+        best = self.levels[0]
+        for level in self.levels[1:]:
+            if level.width >= 2 * width and level.height >= 2 * height:
+                best = level
+            else:
+                break
+        return best
+
+    def resize(self, width: int, height: int) -> Image.Image:
+        if (width, height) == self.master.size:
+            return self.master.copy()
+        return self.level_for(width, height).resize((width, height), RESAMPLE)
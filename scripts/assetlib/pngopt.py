@@ -0,0 +1,174 @@
+"""Lossless PNG recompression.
+
+``optimize_png`` returns the smallest PNG that decodes to exactly the same
+RGBA pixels as its input. The candidates are:
+
+* the input with metadata stripped at the chunk level (text, EXIF, time,
+  physical size ...); chunks that change how pixels are displayed (tRNS and
+  the colour-management chunks gAMA/cHRM/sRGB/iCCP/cICP) are kept;
+* re-encodes in the smallest lossless colour type: RGB when alpha is always
+  opaque, L/LA when every pixel is grey, and an exact palette (with tRNS
+  alpha) when there are at most 256 colours (needs NumPy);
+* each re-encode tried with every zlib strategy (default, filtered,
+  Huffman-only, RLE). Pillow's adaptive filtering is on (``optimize``).
+
+Colour-management chunks of the input are copied into every re-encode, and
+every candidate is decoded and compared with the input before it can win.
+16-bit and animated PNGs are only stripped.
+
+``optimize_cached`` memoizes results by content hash in .cache/pngopt/. Each
+entry is a file named after the input hash, written atomically, so worker
+processes can share the cache without locking. The output is stored under
+its own hash as well, so optimizing an optimized file is a cache hit.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import struct
+import tempfile
+import zlib
+from pathlib import Path
+
+from PIL import Image, ImageChops
+
+from .stamps import CACHE_DIR, bytes_digest
+
+# Bump when the candidates or the encoder settings change.
+OPTIMIZER_VERSION = 1
+CACHE_PATH = CACHE_DIR / "pngopt" / f"v{OPTIMIZER_VERSION}"
+
+SIGNATURE = b"\x89PNG\r\n\x1a\n"
+CRITICAL = {b"IHDR", b"PLTE", b"IDAT", b"IEND"}
+# Ancillary chunks that change the decoded or displayed pixels.
+COLOR_CHUNKS = (b"iCCP", b"sRGB", b"gAMA", b"cHRM", b"cICP")
+KEEP = CRITICAL | {b"tRNS", *COLOR_CHUNKS}
+# zlib strategies (Pillow's ``compress_type``); Z_FIXED never wins on real images.
+STRATEGIES = (zlib.Z_DEFAULT_STRATEGY, zlib.Z_FILTERED, zlib.Z_HUFFMAN_ONLY, zlib.Z_RLE)
+
+
+def chunks(data: bytes) -> list[tuple[bytes, bytes]]:
+    """``(type, raw chunk bytes including length and CRC)`` for every chunk."""
+    if not data.startswith(SIGNATURE):
+        raise ValueError("not a PNG file")
+    out = []
+    pos = len(SIGNATURE)
+    while pos < len(data):
+        (length,) = struct.unpack(">I", data[pos : pos + 4])
+        end = pos + 12 + length
+        out.append((data[pos + 4 : pos + 8], data[pos:end]))
+        pos = end
+    return out
+
+
+def strip(data: bytes) -> bytes:
+    """Drop every chunk that does not affect the pixels (text, EXIF, time, pHYs ...)."""
+    return SIGNATURE + b"".join(raw for kind, raw in chunks(data) if kind in KEEP)
+
+
+def _with_color_chunks(data: bytes, color: list[bytes]) -> bytes:
+    """Insert the input's colour-management chunks right after IHDR."""
+    if not color:
+        return data
+    parts = chunks(data)
+    return SIGNATURE + parts[0][1] + b"".join(color) + b"".join(raw for _, raw in parts[1:])
+
+
+def _palette(rgba: Image.Image) -> tuple[Image.Image, bytes] | None:
+    """Exact palette version of ``rgba`` and its tRNS alpha, or None above 256 colours."""
+    if rgba.getcolors(256) is None:
+        return None
+    try:
+        import numpy as np
+    except ImportError:  # palette reduction is skipped without NumPy
+        return None
+    arr = np.asarray(rgba)
+    packed = np.ascontiguousarray(arr).view(np.uint32).ravel()
+    colors, inverse = np.unique(packed, return_inverse=True)
+    rgba_colors = colors.view(np.uint8).reshape(-1, 4)
+    # Translucent entries first, so tRNS can stop at the last of them.
+    order = np.argsort(rgba_colors[:, 3] == 255, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size)
+    indices = rank[inverse].astype(np.uint8).reshape(arr.shape[:2])
+    image = Image.frombytes("P", rgba.size, indices.tobytes())
+    image.putpalette(rgba_colors[order, :3].tobytes(), "RGB")
+    alpha = rgba_colors[order, 3]
+    return image, alpha[alpha < 255].tobytes()
+
+
+def _reductions(rgba: Image.Image) -> list[tuple[Image.Image, dict]]:
+    """Lossless re-encodings to try, with their extra ``save`` options."""
+    opaque = rgba.getchannel("A").getextrema() == (255, 255)
+    r, g, b, _ = rgba.split()
+    gray = ImageChops.difference(r, g).getbbox() is None and ImageChops.difference(g, b).getbbox() is None
+    if gray:
+        base = rgba.convert("L") if opaque else Image.merge("LA", (r, rgba.getchannel("A")))
+    else:
+        base = rgba.convert("RGB") if opaque else rgba
+    candidates = [(base, {})]
+    palette = _palette(rgba)
+    if palette is not None:
+        image, alpha = palette
+        candidates.append((image, {"transparency": alpha} if alpha else {}))
+    return candidates
+
+
+def _encode(image: Image.Image, options: dict, strategy: int) -> bytes:
+    buf = io.BytesIO()
+    image.save(buf, "PNG", optimize=True, compress_type=strategy, **options)
+    return buf.getvalue()
+
+
+def _pixels(data: bytes) -> bytes:
+    with Image.open(io.BytesIO(data)) as im:
+        return im.convert("RGBA").tobytes()
+
+
+def optimize_png(data: bytes) -> bytes:
+    """Smallest lossless version of ``data`` (``data`` itself if nothing is smaller)."""
+    parts = chunks(data)
+    stripped = strip(data)
+    ihdr = parts[0][1]
+    bit_depth = ihdr[16]
+    animated = any(kind == b"acTL" for kind, _ in parts)
+    if bit_depth > 8 or animated:
+        # Pillow decodes 16-bit channels to 8 bits and keeps one APNG frame.
+        return stripped if len(stripped) < len(data) else data
+
+    with Image.open(io.BytesIO(data)) as im:
+        rgba = im.convert("RGBA")
+    color = [raw for kind, raw in parts if kind in COLOR_CHUNKS]
+    best = stripped if len(stripped) < len(data) else data
+    expected = None
+    for image, options in _reductions(rgba):
+        for strategy in STRATEGIES:
+            candidate = _with_color_chunks(_encode(image, options, strategy), color)
+            if len(candidate) >= len(best):
+                continue
+            if expected is None:
+                expected = rgba.tobytes()
+            if _pixels(candidate) == expected:
+                best = candidate
+    return best
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def optimize_cached(data: bytes, cache_dir: Path = CACHE_PATH) -> tuple[bytes, bool]:
+    """``optimize_png`` memoized by content hash. Returns ``(bytes, cache_hit)``."""
+    entry = cache_dir / f"{bytes_digest(data)}.png"
+    if entry.exists():
+        return entry.read_bytes(), True
+    out = optimize_png(data)
+    _write_atomic(entry, out)
+    if out != data:
+        _write_atomic(cache_dir / f"{bytes_digest(out)}.png", out)
+    return out, False
@@ -0,0 +1,49 @@
+"""Source-hash stamps for generated files (.cache/<name>.json).
+
+A generated file is up to date when it still exists, its bytes hash to what
+we last wrote, and the stamp's key (source hash + generation parameters)
+matches. Anything else, including a hand-edited output, is regenerated.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+CACHE_DIR = ROOT / ".cache"
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+def bytes_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class Stamps:
+    def __init__(self, name: str) -> None:
+        self.path = CACHE_DIR / f"{name}.json"
+        try:
+            self.entries: dict[str, dict[str, str]] = json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            self.entries = {}
+
+    def fresh(self, output: Path, key: str) -> bool:
+        entry = self.entries.get(str(output.relative_to(ROOT)))
+        if not entry or entry["key"] != key or not output.exists():
+            return False
+        return file_digest(output) == entry["output"]
+
+    def record(self, output: Path, key: str, output_hash: str) -> None:
+        self.entries[str(output.relative_to(ROOT))] = {"key": key, "output": output_hash}
+
+    def output_hash(self, output: Path) -> str | None:
+        entry = self.entries.get(str(output.relative_to(ROOT)))
+        return entry["output"] if entry else None
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.entries, indent=2, sort_keys=True) + "\n", encoding="utf-8")
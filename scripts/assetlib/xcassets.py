@@ -0,0 +1,25 @@
+"""Asset catalog (``*.appiconset/Contents.json``) helpers."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+
+def appiconset_targets(contents_path: Path) -> dict[str, int]:
+    """``{filename: pixel size}`` for every referenced image; shared filenames appear once.
+
+    The pixel size is points x scale (``83.5x83.5`` @2x -> 167), so iOS
+    ``20x20@2x`` and ``40x40@1x`` or macOS ``16x16@2x`` and ``32x32@1x``
+    resolve to the same file and size.
+    """
+    contents = json.loads(contents_path.read_text(encoding="utf-8"))
+    targets: dict[str, int] = {}
+    for image in contents.get("images", []):
+        filename = image.get("filename")
+        if not filename:
+            continue
+        points = float(image["size"].split("x")[0])
+        scale = int(image.get("scale", "1x").rstrip("x"))
+        targets[filename] = round(points * scale)
+    return targets
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Re-frame every master image (logo size and position) into build/framed/.
+
+Generalizes resize_ios_icon.py: each entry of JOBS names a master under
+assets/images and how to frame it (see assetlib/framing.py). Masters are
+never modified; results go to build/framed/<same relative path>, with the
+detected bbox, centroid and scale of each image in build/framed/report.json.
+Copy a result over its master to adopt it.
+
+Iterating on a design is cheap: the subject analysis and the padded crop of
+each master are cached by source hash (.cache/framing/*.npz), so a tweak to
+``frac``, ``anchor`` or ``canvas`` only resizes and re-encodes, and outputs
+whose master and spec are unchanged are skipped (.cache/framing.json).
+Images run in a thread pool (resize and encode release the GIL).
+IMPOSTOR_TRACE=1 times analysis, framing and encoding per image
+(tools/instrument.py).
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:
+    raise SystemExit("Install Pillow and NumPy: pip install Pillow numpy")
+
+from assetlib.framing import FrameSpec, Subject, analyze, frame, padded_box  # noqa: E402
+from assetlib.stamps import CACHE_DIR, ROOT, Stamps, bytes_digest, file_digest  # noqa: E402
+import instrument  # noqa: E402
+
+IMAGES = ROOT / "assets" / "images"
+OUT_DIR = ROOT / "build" / "framed"
+ANALYSIS_DIR = CACHE_DIR / "framing"
+# Bump to invalidate the cached analyses and stamps when assetlib/framing.py changes.
+ENGINE_VERSION = 1
+SHARING_CANVAS = (1024, 1536)
+
+JOBS = (
+    # resize_ios_icon.py's settings: logo at 85% of the 1024 canvas, on black.
+    FrameSpec("icon_square_ios", "icon_square_ios.png", frac=0.85),
+    FrameSpec("icon_square", "icon_square.png", frac=0.75),
+    FrameSpec("icon_square_scaled", "icon_square_scaled.png", frac=0.75),
+    # Android masks the adaptive foreground to a circle: keep the logo inside
+    # the 66/108 dp safe zone and centre it optically.
+    FrameSpec("icon_square_foreground", "icon_square_foreground.png", frac=0.61, anchor="centroid"),
+    # Share cards: trim the empty bands and bring all locales to one canvas.
+    FrameSpec("sharing_english", "sharing/sharing_english.png", frac=1.0, pad=0, threshold=12, canvas=SHARING_CANVAS),
+    FrameSpec("sharing_portuguez", "sharing/sharing_portuguez.png", frac=1.0, pad=0, threshold=12,
+              canvas=SHARING_CANVAS),
+    FrameSpec("sharing_spanish", "sharing/sharing_spanish.png", frac=1.0, pad=0, threshold=12, canvas=SHARING_CANVAS),
+    FrameSpec("app_icon_store", "store/app_icon_store.png", frac=0.75),
+    FrameSpec("banner_store", "store/banner store.png", frac=1.0, pad=0, threshold=12),
+)
+
+
+def output_path(spec: FrameSpec) -> Path:
+    return (OUT_DIR / spec.source).with_suffix(".png")
+
+
+def load_subject(spec: FrameSpec, source_hash: str) -> tuple[np.ndarray, tuple[int, int, int, int], Subject]:
+    """Padded crop, its box in the source and the analysis; cached per source and detection settings."""
+    cache_key = bytes_digest(f"{source_hash}:{spec.threshold}:{spec.background}:{spec.pad}:v{ENGINE_VERSION}".encode())
+    cached = ANALYSIS_DIR / f"{cache_key}.npz"
+    if cached.exists():
+        instrument.count("analysis cache hits")
+        with np.load(cached) as data:
+            meta = json.loads(data["meta"].tobytes())
+            subject = Subject(**{k: tuple(v) if isinstance(v, list) else v for k, v in meta["subject"].items()})
+            return data["crop"], tuple(meta["box"]), subject
+
+    with instrument.span("decode", image=spec.name), Image.open(IMAGES / spec.source) as im:
+        rgba = np.asarray(im.convert("RGBA"))
+    with instrument.span("analyze", image=spec.name):
+        subject = analyze(rgba, spec.threshold, spec.background)
+    box = padded_box(subject, spec.pad)
+    x0, y0, x1, y1 = box
+    crop = rgba[y0:y1, x0:x1] if subject.has_alpha else rgba[y0:y1, x0:x1, :3]
+    meta = json.dumps({"box": box, "subject": dataclasses.asdict(subject)}).encode()
+    ANALYSIS_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = cached.with_suffix(f".{os.getpid()}.tmp.npz")
+    np.savez(tmp, crop=np.ascontiguousarray(crop), meta=np.frombuffer(meta, dtype=np.uint8))
+    os.replace(tmp, cached)
+    return crop, box, subject
+
+
+def run_job(spec: FrameSpec, stamps: Stamps, force: bool) -> dict:
+    started = time.perf_counter()
+    source = IMAGES / spec.source
+    source_hash = file_digest(source)
+    key = f"{source_hash}:{spec.key()}:v{ENGINE_VERSION}"
+    out = output_path(spec)
+    with instrument.span("subject", image=spec.name):
+        crop, box, subject = load_subject(spec, source_hash)
+    entry = {
+        "source": spec.source,
+        "output": str(out.relative_to(ROOT)),
+        "bbox": list(subject.bbox),
+        "centroid": [round(c, 1) for c in subject.centroid],
+        "coverage": round(subject.coverage, 4),
+        "spec": {k: v for k, v in dataclasses.asdict(spec).items() if k not in ("name", "source")},
+    }
+    if not force and stamps.fresh(out, key):
+        entry["written"] = False
+    else:
+        with instrument.span("frame", image=spec.name):
+            image = frame(Image.fromarray(crop), box, subject, spec)
+        buf = io.BytesIO()
+        with instrument.span("encode", image=spec.name):
+            # build/ output is a preview; optimize_images.py recompresses adopted masters.
+            image.save(buf, "PNG", compress_level=1)
+        data = buf.getvalue()
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_bytes(data)
+        stamps.record(out, key, bytes_digest(data))
+        instrument.event("written", path=str(out.relative_to(ROOT)), bytes=len(data))
+        entry["written"] = True
+    instrument.count("images written" if entry["written"] else "images up to date")
+    entry["ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return entry
+
+
+def parse_names(value: str) -> list[str]:
+    names = [n.strip() for n in value.split(",") if n.strip()]
+    known = {spec.name for spec in JOBS}
+    unknown = [n for n in names if n not in known]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown image(s): {', '.join(unknown)}")
+    return names
+
+
+@instrument.entrypoint
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", type=parse_names, help="comma-separated job names (default: all)")
+    parser.add_argument("--frac", type=float, help="override the subject size for the selected jobs")
+    parser.add_argument("--anchor", choices=("bbox", "centroid"), help="override the anchor for the selected jobs")
+    parser.add_argument("--force", action="store_true", help="ignore .cache/framing.json and write everything")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--list", action="store_true", help="print the jobs and exit")
+    args = parser.parse_args(argv)
+
+    specs = [s for s in JOBS if not args.only or s.name in args.only]
+    overrides = {k: v for k, v in (("frac", args.frac), ("anchor", args.anchor)) if v is not None}
+    specs = [dataclasses.replace(s, **overrides) for s in specs]
+    if args.list:
+        for s in specs:
+            print(f"{s.name:24} frac {s.frac:<5} {s.anchor:9} {s.source}")
+        return 0
+    missing = [str(IMAGES / s.source) for s in specs if not (IMAGES / s.source).exists()]
+    if missing:
+        raise SystemExit(f"Master image not found: {', '.join(missing)}")
+
+    started = time.perf_counter()
+    stamps = Stamps("framing")
+    with ThreadPoolExecutor(max_workers=max(1, min(args.jobs, len(specs)))) as pool:
+        entries = list(pool.map(lambda s: run_job(s, stamps, args.force), specs))
+    stamps.save()
+
+    report_path = OUT_DIR / "report.json"
+    report = json.loads(report_path.read_text(encoding="utf-8")) if report_path.exists() else {}
+    for spec, entry in zip(specs, entries):
+        report[spec.name] = {k: v for k, v in entry.items() if k not in ("written", "ms")}
+        x0, y0, x1, y1 = entry["bbox"]
+        state = "written" if entry["written"] else "up to date"
+        print(f"{spec.name:24} bbox {x0},{y0}-{x1},{y1}  coverage {entry['coverage']:6.1%}  "
+              f"{state:10} {entry['ms']:7.1f} ms")
+    text = json.dumps(dict(sorted(report.items())), indent=2) + "\n"
+    if not report_path.exists() or report_path.read_text(encoding="utf-8") != text:
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(text, encoding="utf-8")
+    written = sum(e["written"] for e in entries)
+    print(f"Done: {written} of {len(specs)} images written in {time.perf_counter() - started:.2f}s"
+          f" ({OUT_DIR.relative_to(ROOT)})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""Generate every app icon and splash image from the master PNGs in one run.
+
+Targets (``--only`` takes a comma-separated subset):
+
+  ios       ios/Runner/Assets.xcassets/AppIcon.appiconset (sizes from Contents.json)
+  splash    ios/Runner/Assets.xcassets/LaunchImage.imageset @1x/@2x/@3x
+  android   mipmap-*/ic_launcher.png and drawable-*/ic_launcher_foreground.png
+  web       web/favicon.png and web/icons/*
+  macos     macos/Runner/Assets.xcassets/AppIcon.appiconset (sizes from Contents.json)
+  windows   windows/runner/resources/app_icon.ico
+  flutter   assets/images/logo/{,2.0x/,3.0x/}<logo>.png, the in-app logos at the
+            sizes the screens draw them (see assetlib/flutter_variants.py)
+
+Masters follow the flutter_launcher_icons config in pubspec.yaml:
+icon_square_ios.png (flattened on black) for iOS, the splash and the
+maskable web icons, icon_square.png for the other icons and
+icon_square_foreground.png for the Android adaptive foreground.
+
+Each master is decoded once into a mip chain, kept on disk by master hash
+(.cache/mipchain/), so later runs do not decode or downsample it again;
+``--check-quality`` compares every resize from the chain with a direct
+resize of the master (SSIM) and reports the CPU time of both. Targets that
+resolve to the same
+(master, kind, size) node are rendered once and the bytes written to every
+path. Nodes are rendered in a process pool. Outputs whose master hash and node
+are unchanged are skipped (.cache/assets.json). PNG outputs are losslessly
+recompressed by assetlib/pngopt.py before they are written (cached by content
+hash, see optimize_images.py). The hash of every output is written to
+build/assets/manifest.json. With ``flutter``, the decoded bitmap size of each
+screen's logo, master vs variant, goes to build/assets/logo_memory.json
+(``--memory-report`` prints it).
+
+Set IMPOSTOR_TRACE=1 to time decode, resize, encode and optimize per node
+and log every file written (tools/instrument.py; trace in build/trace/).
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+
+try:
+    from PIL import Image
+except ImportError:
+    raise SystemExit("Install Pillow: pip install Pillow")
+
+from assetlib.flutter_variants import format_report, logo_uses, memory_report, variant_path, variant_sizes  # noqa: E402
+from assetlib.mipchain import RESAMPLE, MipChain  # noqa: E402
+from assetlib.pngopt import optimize_cached  # noqa: E402
+from assetlib.stamps import ROOT, Stamps, bytes_digest, file_digest  # noqa: E402
+from assetlib.xcassets import appiconset_targets  # noqa: E402
+import instrument  # noqa: E402
+
+IMAGES = ROOT / "assets" / "images"
+MASTERS = {
+    "ios": IMAGES / "icon_square_ios.png",
+    "icon": IMAGES / "icon_square.png",
+    "foreground": IMAGES / "icon_square_foreground.png",
+}
+# Masters flattened onto a solid background (remove_alpha_ios / background_color_ios).
+BACKGROUNDS = {"ios": (0, 0, 0)}
+IOS_MASTER_SIZE = 1024
+
+IOS_ICONS = ROOT / "ios" / "Runner" / "Assets.xcassets" / "AppIcon.appiconset"
+IOS_SPLASH = ROOT / "ios" / "Runner" / "Assets.xcassets" / "LaunchImage.imageset"
+MACOS_ICONS = ROOT / "macos" / "Runner" / "Assets.xcassets" / "AppIcon.appiconset"
+ANDROID_RES = ROOT / "android" / "app" / "src" / "main" / "res"
+WEB = ROOT / "web"
+WINDOWS_ICO = ROOT / "windows" / "runner" / "resources" / "app_icon.ico"
+
+# Portrait aspect ~1:2 (typical phone splash), icon fit to width.
+SPLASH_1X = (400, 800)
+ANDROID_DENSITIES = {"mdpi": 1, "hdpi": 1.5, "xhdpi": 2, "xxhdpi": 3, "xxxhdpi": 4}
+ANDROID_LAUNCHER_DP = 48
+ANDROID_FOREGROUND_DP = 108
+ICO_SIZES = (16, 24, 32, 48, 64, 128, 256)
+
+PLATFORMS = ("ios", "splash", "android", "web", "macos", "windows", "flutter")
+MANIFEST_PATH = ROOT / "build" / "assets" / "manifest.json"
+MEMORY_REPORT_PATH = ROOT / "build" / "assets" / "logo_memory.json"
+# Bump to invalidate the stamps when the rendering below changes.
+PIPELINE_VERSION = 2
+# Lowest SSIM a resize from the mip chain may have against a direct resize.
+MIN_SSIM = 0.99
+
+
+@dataclass(frozen=True)
+class Target:
+    platform: str
+    path: Path
+    master: str
+    kind: str  # "png", "splash" or "ico"
+    size: tuple[int, int]
+
+    @property
+    def node(self) -> tuple[str, str, tuple[int, int]]:
+        return (self.master, self.kind, self.size)
+
+    @property
+    def source_size(self) -> tuple[int, int]:
+        """Size the master is resampled to before composition."""
+        if self.kind == "splash":
+            return (self.size[0], self.size[0])
+        if self.kind == "ico":
+            return (max(ICO_SIZES), max(ICO_SIZES))
+        return self.size
+
+
+def collect_targets(platforms: set[str]) -> list[Target]:
+    targets: list[Target] = []
+
+    def square(platform: str, path: Path, master: str, px: int) -> None:
+        targets.append(Target(platform, path, master, "png", (px, px)))
+
+    if "ios" in platforms:
+        for filename, px in appiconset_targets(IOS_ICONS / "Contents.json").items():
+            square("ios", IOS_ICONS / filename, "ios", px)
+    if "splash" in platforms:
+        for scale, suffix in [(1, ""), (2, "@2x"), (3, "@3x")]:
+            size = (SPLASH_1X[0] * scale, SPLASH_1X[1] * scale)
+            targets.append(Target("splash", IOS_SPLASH / f"LaunchImage{suffix}.png", "ios", "splash", size))
+    if "android" in platforms:
+        for density, factor in ANDROID_DENSITIES.items():
+            square("android", ANDROID_RES / f"mipmap-{density}" / "ic_launcher.png", "icon",
+                   round(ANDROID_LAUNCHER_DP * factor))
+            square("android", ANDROID_RES / f"drawable-{density}" / "ic_launcher_foreground.png", "foreground",
+                   round(ANDROID_FOREGROUND_DP * factor))
+    if "web" in platforms:
+        square("web", WEB / "favicon.png", "icon", 16)
+        for px in (192, 512):
+            square("web", WEB / "icons" / f"Icon-{px}.png", "icon", px)
+            square("web", WEB / "icons" / f"Icon-maskable-{px}.png", "ios", px)
+    if "macos" in platforms:
+        for filename, px in appiconset_targets(MACOS_ICONS / "Contents.json").items():
+            square("macos", MACOS_ICONS / filename, "icon", px)
+    if "windows" in platforms:
+        targets.append(Target("windows", WINDOWS_ICO, "icon", "ico", (max(ICO_SIZES), max(ICO_SIZES))))
+    if "flutter" in platforms:
+        by_stem = {path.stem: name for name, path in MASTERS.items()}
+        for logo, sizes in variant_sizes(logo_uses(ROOT)).items():
+            for scale, px in sizes.items():
+                square("flutter", ROOT / variant_path(logo, scale), by_stem[logo], px)
+    return targets
+
+
+def load_master(name: str) -> Image.Image:
+    with instrument.span("decode", master=name):
+        im = Image.open(MASTERS[name]).convert("RGBA")
+    background = BACKGROUNDS.get(name)
+    if background is not None:
+        with instrument.span("flatten", master=name):
+            flat = Image.new("RGB", im.size, background)
+            flat.paste(im, mask=im.getchannel("A"))
+            im = flat
+            if im.size != (IOS_MASTER_SIZE, IOS_MASTER_SIZE):
+                im = im.resize((IOS_MASTER_SIZE, IOS_MASTER_SIZE), RESAMPLE)
+    return im
+
+
+def master_key(name: str, master_hash: str) -> str:
+    """Everything ``load_master`` output depends on, for the mip chain cache."""
+    return f"{name}:{master_hash}:{BACKGROUNDS.get(name)}:{IOS_MASTER_SIZE}"
+
+
+def load_chains(names: set[str], master_hashes: dict[str, str]) -> dict[str, MipChain]:
+    chains = {}
+    for m in sorted(names):
+        with instrument.span("mip chain", master=m):
+            chains[m] = MipChain.cached(master_key(m, master_hashes[m]), lambda m=m: load_master(m))
+    return chains
+
+
+def check_quality(targets: list[Target], master_hashes: dict[str, str]) -> int:
+    """SSIM and CPU time of every distinct resize, from the chain vs straight from the master."""
+    try:
+        from assetlib.quality import ssim
+    except ImportError:
+        raise SystemExit("Install NumPy for --check-quality: pip install numpy")
+    started = time.process_time()
+    chains = load_chains({t.master for t in targets}, master_hashes)
+    chain_cpu = time.process_time() - started
+    resizes = sorted({(t.master, t.source_size) for t in targets}, key=lambda r: (r[0], -r[1][0]))
+    worst = 1.0
+    mip_cpu = direct_cpu = 0.0
+    for master, size in resizes:
+        chain = chains[master]
+        t0 = time.process_time()
+        via_chain = chain.resize(*size)
+        t1 = time.process_time()
+        direct = chain.master.resize(size, RESAMPLE)
+        t2 = time.process_time()
+        mip_cpu += t1 - t0
+        direct_cpu += t2 - t1
+        score = ssim(via_chain, direct)
+        worst = min(worst, score)
+        level = chain.level_for(*size).size
+        flag = "" if score >= MIN_SSIM else "  BELOW MIN_SSIM"
+        print(f"{master:10} {size[0]:>4}x{size[1]:<4} from {level[0]:>4}px  SSIM {score:.5f}  "
+              f"{(t1 - t0) * 1000:7.1f} ms vs {(t2 - t1) * 1000:7.1f} ms direct{flag}")
+    print(f"{len(resizes)} resizes: worst SSIM {worst:.5f} (min {MIN_SSIM}), CPU {mip_cpu * 1000:.0f} ms from the chain"
+          f" (+{chain_cpu * 1000:.0f} ms to load or build it) vs {direct_cpu * 1000:.0f} ms direct")
+    return 0 if worst >= MIN_SSIM else 1
+
+
+def render(kind: str, level: Image.Image, size: tuple[int, int]) -> bytes:
+    """Render one node from a mip level; runs in a worker process."""
+    label = f"{size[0]}x{size[1]}"
+    with instrument.span("resize", kind=kind, size=label):
+        if kind in ("png", "ico"):
+            img = level if level.size == size else level.resize(size, RESAMPLE)
+        elif kind == "splash":
+            w, h = size
+            icon = level if level.size == (w, w) else level.resize((w, w), RESAMPLE)
+            img = Image.new("RGB", (w, h), (0, 0, 0))
+            img.paste(icon, (0, (h - w) // 2), icon if icon.mode == "RGBA" else None)
+        else:
+            raise ValueError(f"unknown target kind {kind!r}")
+    buf = io.BytesIO()
+    with instrument.span("encode", kind=kind, size=label):
+        if kind == "ico":
+            img.save(buf, "ICO", sizes=[(s, s) for s in ICO_SIZES])
+            return buf.getvalue()
+        img.save(buf, "PNG", optimize=True)
+    with instrument.span("optimize", size=label):
+        data, hit = optimize_cached(buf.getvalue())
+    instrument.count("pngopt cache hits" if hit else "pngopt cache misses")
+    return data
+
+
+def write_manifest(targets: list[Target], stamps: Stamps, master_hashes: dict[str, str]) -> bool:
+    """Update the entries of ``targets``; entries of platforms not built this run are kept."""
+    old_text = MANIFEST_PATH.read_text(encoding="utf-8") if MANIFEST_PATH.exists() else ""
+    previous = json.loads(old_text) if old_text else {}
+    if previous.get("version") != PIPELINE_VERSION:
+        previous = {}
+    masters = previous.get("masters", {})
+    outputs = previous.get("outputs", {})
+    for name, h in master_hashes.items():
+        masters[name] = {"path": str(MASTERS[name].relative_to(ROOT)), "hash": h}
+    for t in targets:
+        outputs[str(t.path.relative_to(ROOT))] = {
+            "platform": t.platform,
+            "master": t.master,
+            "size": f"{t.size[0]}x{t.size[1]}",
+            "hash": stamps.output_hash(t.path),
+        }
+    manifest = {
+        "version": PIPELINE_VERSION,
+        "masters": dict(sorted(masters.items())),
+        "outputs": dict(sorted(outputs.items())),
+    }
+    text = json.dumps(manifest, indent=2) + "\n"
+    if text == old_text:
+        return False
+    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    MANIFEST_PATH.write_text(text, encoding="utf-8")
+    return True
+
+
+def write_memory_report() -> dict:
+    uses = logo_uses(ROOT)
+    master_sizes = {}
+    for path in MASTERS.values():
+        with Image.open(path) as im:
+            master_sizes[path.stem] = im.size
+    report = memory_report(uses, variant_sizes(uses), master_sizes)
+    text = json.dumps(report, indent=2) + "\n"
+    if not MEMORY_REPORT_PATH.exists() or MEMORY_REPORT_PATH.read_text(encoding="utf-8") != text:
+        MEMORY_REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        MEMORY_REPORT_PATH.write_text(text, encoding="utf-8")
+    return report
+
+
+def parse_platforms(value: str) -> set[str]:
+    names = {p.strip() for p in value.split(",") if p.strip()}
+    unknown = names - set(PLATFORMS)
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown platform(s): {', '.join(sorted(unknown))}")
+    return names
+
+
+@instrument.entrypoint
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", type=parse_platforms, default=set(PLATFORMS),
+                        help=f"comma-separated platforms ({','.join(PLATFORMS)})")
+    parser.add_argument("--force", action="store_true", help="ignore .cache/assets.json and render everything")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--list", action="store_true", help="print the targets and exit")
+    parser.add_argument("--check-quality", action="store_true",
+                        help="compare resizes from the mip chain with direct ones (SSIM) and exit")
+    parser.add_argument("--memory-report", action="store_true",
+                        help="print the decoded logo memory per screen (with the flutter platform)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    targets = collect_targets(args.only)
+    if args.list:
+        for t in targets:
+            print(f"{t.platform:8} {t.master:10} {t.kind:6} {t.size[0]}x{t.size[1]:<5} {t.path.relative_to(ROOT)}")
+        return 0
+
+    used = sorted({t.master for t in targets})
+    missing = [MASTERS[m] for m in used if not MASTERS[m].exists()]
+    if missing:
+        raise SystemExit(f"Master image not found: {', '.join(str(p) for p in missing)}")
+    with instrument.span("hash masters"):
+        master_hashes = {m: file_digest(MASTERS[m]) for m in used}
+    if args.check_quality:
+        return check_quality(targets, master_hashes)
+
+    def key(t: Target) -> str:
+        return f"{master_hashes[t.master]}:{t.kind}:{t.size[0]}x{t.size[1]}:v{PIPELINE_VERSION}"
+
+    stamps = Stamps("assets")
+    with instrument.span("stamps"):
+        stale = [t for t in targets if args.force or not stamps.fresh(t.path, key(t))]
+    nodes: dict[tuple, list[Target]] = {}
+    for t in stale:
+        nodes.setdefault(t.node, []).append(t)
+
+    if nodes:
+        chains = load_chains({t.master for t in stale}, master_hashes)
+        with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(nodes)))) as pool:
+            futures = {}
+            # Largest renders first so the long splash/1024 encodes do not trail the pool.
+            for node, group in sorted(nodes.items(), key=lambda item: -item[0][2][0] * item[0][2][1]):
+                master, kind, size = node
+                level = chains[master].level_for(*group[0].source_size)
+                futures[node] = pool.submit(instrument.call, render, kind, level, size)
+            for node, future in futures.items():
+                data = instrument.result(future.result())
+                digest = bytes_digest(data)
+                with instrument.span("write", files=len(nodes[node])):
+                    for t in nodes[node]:
+                        t.path.parent.mkdir(parents=True, exist_ok=True)
+                        t.path.write_bytes(data)
+                        stamps.record(t.path, key(t), digest)
+                        instrument.event("written", path=str(t.path.relative_to(ROOT)), bytes=len(data))
+        stamps.save()
+    instrument.count("files written", len(stale))
+    instrument.count("files up to date", len(targets) - len(stale))
+
+    with instrument.span("manifest"):
+        manifest_changed = write_manifest(targets, stamps, master_hashes)
+    report = write_memory_report() if "flutter" in args.only else None
+    elapsed = time.perf_counter() - started
+    for platform in PLATFORMS:
+        mine = [t for t in targets if t.platform == platform]
+        if mine:
+            written = sum(1 for t in stale if t.platform == platform)
+            print(f"{platform:8} {written:3} written, {len(mine) - written:3} up to date")
+    print(f"Done: {len(stale)} files from {len(nodes)} renders in {elapsed:.2f}s"
+          f"{'; manifest updated' if manifest_changed else ''} ({MANIFEST_PATH.relative_to(ROOT)})")
+    if report and args.memory_report:
+        print("\n".join(format_report(report)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Losslessly recompress the app's PNGs and enforce byte budgets.
+
+Covers every PNG under assets/images and the platform icon and splash
+folders (iOS, macOS, Android res, web). Files are optimized in a process pool
+(palette/grey/RGB reduction, zlib strategy search, metadata stripping; see
+assetlib/pngopt.py) and rewritten only when the result is smaller. Results
+are cached by content hash in .cache/pngopt/, so a second run only hashes.
+
+Then every file is checked against its per-file budget (first matching
+pattern in FILE_BUDGETS) and every bundle against its total (TOTAL_BUDGETS);
+the run fails when any is exceeded. ``--check`` reports what would shrink and
+checks the budgets on the files as they are, without writing.
+IMPOSTOR_TRACE=1 times every file in its worker (tools/instrument.py).
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path, PurePosixPath
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+
+try:
+    from PIL import Image  # noqa: F401
+except ImportError:
+    raise SystemExit("Install Pillow: pip install Pillow")
+
+from assetlib.pngopt import optimize_cached  # noqa: E402
+from assetlib.stamps import ROOT  # noqa: E402
+import instrument  # noqa: E402
+
+ROOTS = (
+    ROOT / "assets" / "images",
+    ROOT / "ios" / "Runner" / "Assets.xcassets",
+    ROOT / "macos" / "Runner" / "Assets.xcassets",
+    ROOT / "android" / "app" / "src" / "main" / "res",
+    ROOT / "web",
+)
+KB = 1000
+# Per file, first match wins (patterns match the repo-relative path from the right).
+FILE_BUDGETS = (
+    ("assets/images/store/*.png", 950 * KB),  # store listing art, not bundled
+    ("assets/images/sharing/*.png", 950 * KB),  # hand-made cards, no longer bundled
+    ("assets/images/share/*.png", 300 * KB),  # render_share_cards.py
+    ("assets/images/*.png", 1200 * KB),
+    ("ios/Runner/Assets.xcassets/LaunchImage.imageset/*.png", 500 * KB),
+    # generate_assets.py copies icon_square.png (1024px, transparent) as is.
+    ("macos/Runner/Assets.xcassets/AppIcon.appiconset/app_icon_1024.png", 1270 * KB),
+    ("*.png", 400 * KB),
+)
+# Per bundle: what each platform ships, about 10% over what generate_assets.py
+# and render_share_cards.py produce once optimized.
+TOTAL_BUDGETS = {
+    "flutter assets": (("assets/images/*.png", "assets/images/logo/*.png", "assets/images/logo/*/*.png",
+                        "assets/images/share/*.png"), 3050 * KB),
+    "ios": (("ios/Runner/Assets.xcassets/*/*.png",), 1400 * KB),
+    "macos": (("macos/Runner/Assets.xcassets/*/*.png",), 1350 * KB),
+    "android": (("android/app/src/main/res/*/*.png",), 105 * KB),
+    "web": (("web/*.png", "web/icons/*.png"), 220 * KB),
+}
+
+
+def collect() -> list[Path]:
+    return sorted(p for root in ROOTS if root.exists() for p in root.rglob("*.png"))
+
+
+def file_budget(rel: PurePosixPath) -> int | None:
+    for pattern, budget in FILE_BUDGETS:
+        if rel.match(pattern):
+            return budget
+    return None
+
+
+def optimize(path: Path) -> tuple[bytes | None, bool, str | None]:
+    """Optimized bytes (None if not smaller), cache hit, problem; runs in a worker process."""
+    data = path.read_bytes()
+    try:
+        with instrument.span("optimize", path=str(path.relative_to(ROOT)), bytes=len(data)):
+            out, hit = optimize_cached(data)
+    except ValueError as e:
+        return None, False, str(e)
+    instrument.count("cache hits" if hit else "cache misses")
+    return (out if len(out) < len(data) else None), hit, None
+
+
+def check_budgets(sizes: dict[PurePosixPath, int]) -> list[str]:
+    problems = []
+    for rel, size in sizes.items():
+        budget = file_budget(rel)
+        if budget is not None and size > budget:
+            problems.append(f"{rel}: {size:,} bytes, budget {budget:,}")
+    for name, (patterns, budget) in TOTAL_BUDGETS.items():
+        total = sum(size for rel, size in sizes.items() if any(rel.match(p) for p in patterns))
+        if total > budget:
+            problems.append(f"{name}: {total:,} bytes in total, budget {budget:,}")
+    return problems
+
+
+@instrument.entrypoint
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="report and check budgets without writing")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    paths = collect()
+    before = {p: p.stat().st_size for p in paths}
+    sizes: dict[PurePosixPath, int] = {}  # on disk after this run
+    optimized = 0  # total once every file is optimized
+    hits = 0
+    with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(paths)))) as pool:
+        # Largest first so the slow encodes do not trail the pool.
+        ordered = sorted(paths, key=lambda p: -before[p])
+        results = pool.map(instrument.call, itertools.repeat(optimize), ordered)
+        for path, (out, hit, problem) in zip(ordered, map(instrument.result, results)):
+            rel = PurePosixPath(path.relative_to(ROOT).as_posix())
+            hits += hit
+            size = before[path]
+            if problem:
+                print(f"skip {rel}: {problem}")
+            elif out is not None:
+                verb = "would shrink" if args.check else "shrank"
+                print(f"{verb} {rel}: {size:,} -> {len(out):,} bytes")
+                if not args.check:
+                    path.write_bytes(out)
+                    size = len(out)
+                    instrument.event("written", path=str(rel), bytes=size)
+            sizes[rel] = size
+            optimized += size if out is None else len(out)
+
+    total = sum(before.values())
+    print(f"{len(paths)} PNGs, {total:,} -> {optimized:,} bytes"
+          f" ({(total - optimized) / total if total else 0:.1%} smaller), {hits} cache hits,"
+          f" {time.perf_counter() - started:.2f}s")
+
+    problems = check_budgets(sizes)
+    for p in problems:
+        print(f"OVER BUDGET {p}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
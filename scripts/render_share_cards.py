@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Render the share card of every locale into assets/images/share/.
+
+Every locale with a word pack (assets/words/<locale>.json) gets a card built
+from the one template in assetlib/cards.py, with its language's text and any
+regional wording (cards.REGION_TEXT). Locales whose text is the same share a
+single image, named after the language's default locale (es-AR, en-US,
+pt-BR) or else the first of them. The base layer (background, icon, badges)
+is drawn once; the text and the PNG encode of each card run in a process
+pool, and PNGs go through assetlib/pngopt.py. Cards whose icon, font, text
+and template are unchanged are skipped (.cache/share_cards.json).
+
+Each card must fit its budget in optimize_images.py (FILE_BUDGETS). The
+locale -> (asset, content hash, size) table the app uses to reuse its
+temporary share file goes to lib/app/share_cards.dart. ``--check`` verifies
+the cards, the table and the budgets without writing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path, PurePosixPath
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+
+try:
+    from PIL import Image
+except ImportError:
+    raise SystemExit("Install Pillow: pip install Pillow")
+
+from assetlib import cards  # noqa: E402
+from assetlib.pngopt import optimize_cached  # noqa: E402
+from assetlib.stamps import ROOT, Stamps, bytes_digest, file_digest  # noqa: E402
+from optimize_images import file_budget  # noqa: E402
+import instrument  # noqa: E402
+
+WORDS = ROOT / "assets" / "words"
+ICON = ROOT / "assets" / "images" / "icon_square_ios.png"
+SHARE_DIR = ROOT / "assets" / "images" / "share"
+DART_TABLE = ROOT / "lib" / "app" / "share_cards.dart"
+# Same defaults as WordPackRepository._languageFallback.
+LANGUAGE_DEFAULTS = {"es": "es-AR", "en": "en-US", "pt": "pt-BR"}
+
+
+def supported_locales() -> list[str]:
+    return sorted(p.stem for p in WORDS.glob("*.json"))
+
+
+def group_cards(locales: list[str]) -> dict[str, tuple[cards.CardText, list[str]]]:
+    """``{file stem: (text, locales)}``, one entry per distinct card."""
+    by_text: dict[cards.CardText, list[str]] = {}
+    for locale in locales:
+        by_text.setdefault(cards.card_text(locale), []).append(locale)
+    groups = {}
+    for text, members in by_text.items():
+        defaults = [m for m in members if LANGUAGE_DEFAULTS.get(m.split("-")[0]) == m]
+        groups[(defaults or members)[0]] = (text, members)
+    return dict(sorted(groups.items()))
+
+
+def render_card(base: Image.Image, text: cards.CardText, font_path: str) -> bytes:
+    """Draw and encode one card; runs in a worker process."""
+    with instrument.span("text"):
+        card = cards.render(base, text, font_path)
+    buf = io.BytesIO()
+    with instrument.span("encode"):
+        card.save(buf, "PNG", optimize=True)
+    with instrument.span("optimize"):
+        data, hit = optimize_cached(buf.getvalue())
+    instrument.count("pngopt cache hits" if hit else "pngopt cache misses")
+    return data
+
+
+def dart_table(entries: dict[str, tuple[str, str, int]]) -> str:
+    lines = [
+        "// Generated by scripts/render_share_cards.py; do not edit.",
+        "",
+        "/// A pre-rendered share card: bundled asset, content hash and size in bytes.",
+        "class ShareCard {",
+        "  const ShareCard(this.asset, this.hash, this.bytes);",
+        "",
+        "  final String asset;",
+        "  final String hash;",
+        "  final int bytes;",
+        "}",
+        "",
+        "const Map<String, ShareCard> shareCards = {",
+    ]
+    for locale, (asset, digest, size) in sorted(entries.items()):
+        lines.append(f"  '{locale}': ShareCard('{asset}', '{digest}', {size}),")
+    lines.append("};")
+    return "\n".join(lines) + "\n"
+
+
+def check_budget(path: Path, size: int) -> str | None:
+    rel = PurePosixPath(path.relative_to(ROOT).as_posix())
+    budget = file_budget(rel)
+    if budget is not None and size > budget:
+        return f"{rel}: {size:,} bytes, budget {budget:,}"
+    return None
+
+
+@instrument.entrypoint
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--font", type=Path, default=cards.DEFAULT_FONT, help="TrueType font for the text")
+    parser.add_argument("--force", action="store_true", help="ignore .cache/share_cards.json and render everything")
+    parser.add_argument("--check", action="store_true", help="verify the cards, table and budgets without writing")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--list", action="store_true", help="print the cards and their locales and exit")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    groups = group_cards(supported_locales())
+    outputs = {stem: SHARE_DIR / f"{stem}.png" for stem in groups}
+    if args.list:
+        for stem, (text, members) in groups.items():
+            print(f"{outputs[stem].relative_to(ROOT)}  {text.headline!r}  {', '.join(members)}")
+        return 0
+    if not ICON.exists():
+        raise SystemExit(f"Master image not found: {ICON}")
+    if not args.font.exists():
+        raise SystemExit(f"Font not found: {args.font}")
+
+    stem_key = f"{file_digest(ICON)}:{cards.font_key(args.font)}:v{cards.TEMPLATE_VERSION}"
+    stamps = Stamps("share_cards")
+    keys = {stem: f"{stem_key}:{text!r}" for stem, (text, _) in groups.items()}
+    force = args.force and not args.check
+    stale = [stem for stem in groups if force or not stamps.fresh(outputs[stem], keys[stem])]
+    problems = []
+
+    if args.check:
+        for stem in stale:
+            out = outputs[stem]
+            if not out.exists():
+                problems.append(f"{out.relative_to(ROOT)} is missing")
+            else:
+                problems.append(f"{out.relative_to(ROOT)} is stale (icon, font, text or template changed);"
+                                " run render_share_cards.py")
+    elif stale:
+        with instrument.span("base"), Image.open(ICON) as icon:
+            base = cards.base(icon)
+        with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(stale)))) as pool:
+            futures = {
+                stem: pool.submit(instrument.call, render_card, base, groups[stem][0], str(args.font))
+                for stem in stale
+            }
+            for stem, future in futures.items():
+                data = instrument.result(future.result())
+                out = outputs[stem]
+                out.parent.mkdir(parents=True, exist_ok=True)
+                out.write_bytes(data)
+                stamps.record(out, keys[stem], bytes_digest(data))
+                instrument.event("written", path=str(out.relative_to(ROOT)), bytes=len(data))
+        stamps.save()
+        for leftover in sorted(set(SHARE_DIR.glob("*.png")) - set(outputs.values())):
+            leftover.unlink()
+            print(f"removed {leftover.relative_to(ROOT)}")
+
+    entries = {}
+    for stem, (_, members) in groups.items():
+        out = outputs[stem]
+        if not out.exists():
+            continue
+        data = out.read_bytes()
+        problem = check_budget(out, len(data))
+        if problem:
+            problems.append(problem)
+        for locale in members:
+            entries[locale] = (out.relative_to(ROOT).as_posix(), bytes_digest(data), len(data))
+    table = dart_table(entries)
+    current = DART_TABLE.read_text(encoding="utf-8") if DART_TABLE.exists() else ""
+    if table != current:
+        if args.check:
+            problems.append(f"{DART_TABLE.relative_to(ROOT)} is out of date")
+        else:
+            DART_TABLE.write_text(table, encoding="utf-8", newline="\n")
+
+    for stem, (_, members) in groups.items():
+        size = outputs[stem].stat().st_size if outputs[stem].exists() else 0
+        if stem not in stale:
+            state = "up to date"
+        elif not args.check:
+            state = "written"
+        else:
+            state = "stale" if outputs[stem].exists() else "missing"
+        print(f"{outputs[stem].relative_to(ROOT)}  {size:>9,} bytes  {state:10}  {', '.join(members)}")
+    for p in problems:
+        print(f"PROBLEM {p}")
+    written = 0 if args.check else len(stale)
+    print(f"Done: {written} of {len(groups)} cards written for {len(entries)} locales"
+          f" in {time.perf_counter() - started:.2f}s")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
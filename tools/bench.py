@@ -0,0 +1,343 @@
+"""Benchmarks for the asset and word pack tooling.
+
+    python3 tools/bench.py [--scales 1,10,100] [--stage words.apply] [--repeat 3] [--threshold 0.25]
+    python3 tools/bench.py --update-baseline
+
+Every stage runs the real command line in a throwaway fixture tree (a copy of
+tools/ and scripts/ next to generated inputs), so nothing in the checkout is
+touched:
+
+* word stages run once per scale against packs holding every category of
+  assets/words with ``scale`` times as many words (made-up words of similar length),
+  plus a manifest for every category with one word changed, so ``apply`` has
+  real work to do;
+* image stages run on synthetic 1024x1024 masters (no scale).
+
+Per stage it records wall time, peak RSS of the process tree (``wait4``) and
+bytes written (files created or modified in the fixture), keeping the best
+of ``--repeat`` runs (3 by default). Results are compared with
+tools/bench_baseline.json and the run fails when a stage is slower, bigger or
+writes more than ``--threshold`` over its baseline and by more than a fixed
+slack (``MIN_WALL_S`` and friends), so sub-second stages do not fail on
+process startup jitter.
+Baselines are machine-specific; refresh them with ``--update-baseline`` on
+the machine that runs the comparison.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from wordpack import load_packs
+from wordpack.manifest import category_manifest, dump_manifest
+
+ROOT = Path(__file__).resolve().parents[1]
+BASELINE_PATH = Path(__file__).with_name("bench_baseline.json")
+SCALES = (1, 10, 100)
+# Best of this many runs per stage, both for the baseline and the comparison.
+REPEAT = 3
+
+# Ignore differences below these; they are noise at this size. Starting the
+# interpreter alone varies by ~0.1 s between runs on a loaded machine.
+MIN_WALL_S = 0.25
+MIN_RSS_MB = 5.0
+MIN_WRITTEN_MB = 0.01
+# Stages are measured untraced even when this run is (tools/instrument.py).
+STAGE_ENV = {k: v for k, v in os.environ.items() if k != "IMPOSTOR_TRACE"}
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    argv: tuple[str, ...]
+    words: bool  # runs once per scale against the scaled packs
+    images: bool = False  # needs Pillow
+
+
+WP = "tools/wordpacks.py"
+STAGES = (
+    Stage("words.apply", (WP, "apply", "--no-cache"), words=True),
+    Stage("words.apply.noop", (WP, "apply"), words=True),
+    Stage("words.validate", (WP, "validate", "--output", "validate.json"), words=True),
+    Stage("words.near-dups", (WP, "near-dups", "--scope", "category"), words=True),
+    Stage("words.pack", (WP, "pack"), words=True),
+    Stage("words.release", (WP, "release"), words=True),
+    Stage("words.shard", (WP, "shard"), words=True),
+    Stage("words.draws", (WP, "draws"), words=True),
+    Stage("words.catalog", (WP, "catalog"), words=True),
+    Stage("words.overlay", (WP, "overlay"), words=True),
+    Stage("icons.ios", ("fix_ios_icons.py", "--force"), words=False, images=True),
+    Stage("assets.all", ("scripts/generate_assets.py", "--force"), words=False, images=True),
+    Stage("assets.noop", ("scripts/generate_assets.py",), words=False, images=True),
+    Stage("splash", ("scripts/generate_splash.py", "--force"), words=False, images=True),
+    Stage("icons.resize", ("scripts/resize_ios_icon.py",), words=False, images=True),
+    # A design tweak right after: served from the cached analysis.
+    Stage("icons.reframe", ("scripts/frame_logos.py", "--only", "icon_square_ios", "--frac", "0.8"),
+          words=False, images=True),
+    Stage("cards", ("scripts/render_share_cards.py", "--force"), words=False, images=True),
+)
+
+
+@dataclass
+class Measurement:
+    wall_s: float
+    peak_rss_mb: float
+    written_mb: float
+
+
+# --- fixtures ----------------------------------------------------------------
+
+
+def _copy_tooling(dest: Path) -> None:
+    ignore = shutil.ignore_patterns("__pycache__", "manifests")
+    shutil.copytree(ROOT / "tools", dest / "tools", ignore=ignore)
+    shutil.copytree(ROOT / "scripts", dest / "scripts", ignore=ignore)
+    shutil.copy2(ROOT / "fix_ios_icons.py", dest / "fix_ios_icons.py")
+
+
+def _touch_first_word(manifest: dict) -> None:
+    lists = [manifest["words"]] if "words" in manifest else [manifest[d] for d in ("easy", "medium", "hard") if manifest.get(d)]
+    if not lists:
+        return
+    first = lists[0][0]
+    if isinstance(first, str):
+        lists[0][0] = first + " (bench)"
+    else:
+        first["text"] += " (bench)"
+
+
+_SYLLABLES = [c + v for c in "bcdfglmnprstvz" for v in "aeiou"] + ["qu", "ch", "ll", "rr", "ñ"]
+
+
+def _synthetic_word(text: str, copy: int) -> str:
+    """Deterministic made-up word about as long as ``text``.
+
+    Suffixed copies ("Obelisco 2", "Obelisco 3") would all be near-duplicates
+    of each other and make the near-dup stage quadratic in ``scale``.
+    """
+    rng = random.Random(f"{text}\0{copy}")
+    parts = []
+    while sum(map(len, parts)) + len(parts) < len(text):
+        word = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(1, 4)))
+        parts.append(word.capitalize())
+    return " ".join(parts) or _SYLLABLES[copy % len(_SYLLABLES)]
+
+
+def build_word_fixture(dest: Path, scale: int) -> None:
+    """Packs with ``scale`` times the words of every category, plus a changed manifest per category."""
+    _copy_tooling(dest)
+    words_dir = dest / "assets" / "words"
+    words_dir.mkdir(parents=True)
+    for locale, pack in load_packs().items():
+        categories = []
+        for cat in pack.categories.values():
+            data = cat.to_json()
+            base = data["words"]
+            data["words"] = base + [
+                {**w, "text": _synthetic_word(w["text"], copy)} for copy in range(2, scale + 1) for w in base
+            ]
+            categories.append(data)
+            manifest = category_manifest(type(cat).from_json(data), None)
+            _touch_first_word(manifest)
+            path = dest / "tools" / "manifests" / locale / f"{cat.id}.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(dump_manifest(manifest), encoding="utf-8", newline="\n")
+        out = {"locale": pack.locale, "version": pack.version, "categories": categories}
+        (words_dir / f"{locale}.json").write_text(
+            json.dumps(out, ensure_ascii=False, indent=2) + "\n", encoding="utf-8", newline="\n"
+        )
+
+
+def build_image_fixture(dest: Path) -> None:
+    """Synthetic masters (gradient, rings, transparent margin), the asset catalog JSON, the logo screens
+    and the locale list the share cards are rendered for."""
+    from PIL import Image, ImageDraw
+
+    _copy_tooling(dest)
+    images = dest / "assets" / "images"
+    images.mkdir(parents=True)
+    size = 1024
+    icon = Image.linear_gradient("L").resize((size, size)).convert("RGBA")
+    draw = ImageDraw.Draw(icon)
+    for i in range(12):
+        r = 40 + i * 36
+        draw.ellipse((size // 2 - r, size // 2 - r, size // 2 + r, size // 2 + r), outline=(255, 60 * (i % 4), 20 * i, 255), width=9)
+    alpha = Image.new("L", (size, size), 0)
+    ImageDraw.Draw(alpha).rounded_rectangle((64, 64, size - 64, size - 64), radius=180, fill=255)
+    icon.putalpha(alpha)
+    icon.save(images / "icon_square.png")
+    icon.save(images / "icon_square_foreground.png")
+    ios = Image.new("RGB", (size, size), (0, 0, 0))
+    ios.paste(icon, mask=icon.getchannel("A"))
+    ios.save(images / "icon_square_ios.png")
+    for catalog in (
+        "ios/Runner/Assets.xcassets/AppIcon.appiconset",
+        "macos/Runner/Assets.xcassets/AppIcon.appiconset",
+    ):
+        (dest / catalog).mkdir(parents=True)
+        shutil.copy2(ROOT / catalog / "Contents.json", dest / catalog / "Contents.json")
+    (dest / "ios/Runner/Assets.xcassets/LaunchImage.imageset").mkdir(parents=True)
+    # generate_assets.py sizes the in-app logo variants from these.
+    shutil.copytree(ROOT / "lib" / "ui" / "screens", dest / "lib" / "ui" / "screens")
+    (dest / "lib" / "app").mkdir()
+    (dest / "assets" / "words").mkdir()
+    for pack in (ROOT / "assets" / "words").glob("*.json"):
+        (dest / "assets" / "words" / pack.name).write_text("{}\n", encoding="utf-8")
+
+
+# --- measurement ---------------------------------------------------------------
+
+
+def _snapshot(root: Path) -> dict[str, tuple[int, int]]:
+    files = {}
+    for dirpath, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(dirpath, name)
+            st = os.stat(path)
+            files[path] = (st.st_size, st.st_mtime_ns)
+    return files
+
+
+def _rss_mb(maxrss: int) -> float:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+
+
+def run_stage(stage: Stage, cwd: Path, log: Path) -> Measurement:
+    before = _snapshot(cwd)
+    with log.open("ab") as out:
+        started = time.perf_counter()
+        proc = subprocess.Popen([sys.executable, *stage.argv], cwd=cwd, stdout=out, stderr=subprocess.STDOUT,
+                                env=STAGE_ENV)
+        _, status, usage = os.wait4(proc.pid, 0)
+        wall = time.perf_counter() - started
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode:
+        raise RuntimeError(f"{stage.name} exited with {proc.returncode}, see {log}")
+    after = _snapshot(cwd)
+    written = sum(size for path, (size, mtime) in after.items() if before.get(path) != (size, mtime))
+    return Measurement(wall, _rss_mb(usage.ru_maxrss), written / (1024 * 1024))
+
+
+def build_fixture(dest: Path, scale: int | None) -> None:
+    """Build a fixture in a spawned child so this process stays small.
+
+    Linux carries a process's RSS high-water mark across fork and exec, so a
+    stage started from a parent that just generated 100x packs would report
+    the parent's peak instead of its own.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    target, args = (build_word_fixture, (dest, scale)) if scale else (build_image_fixture, (dest,))
+    proc = ctx.Process(target=target, args=args)
+    proc.start()
+    proc.join()
+    if proc.exitcode:
+        raise RuntimeError(f"building the fixture in {dest} failed with exit code {proc.exitcode}")
+
+
+def run(stages: list[Stage], scales: list[int], repeat: int, log: Path) -> dict[str, Measurement]:
+    results: dict[str, Measurement] = {}
+    jobs: list[tuple[int | None, list[Stage]]] = [(s, [st for st in stages if st.words]) for s in scales]
+    jobs.append((None, [st for st in stages if not st.words]))
+    for scale, group in jobs:
+        if not group:
+            continue
+        for _ in range(repeat):
+            # Stages build on each other (apply, then apply again from cache), so
+            # every repetition gets a fresh fixture.
+            with tempfile.TemporaryDirectory(prefix="wordpacks-bench-") as tmp:
+                fixture = Path(tmp)
+                build_fixture(fixture, scale)
+                for stage in group:
+                    key = f"{stage.name}@{scale}x" if scale else stage.name
+                    m = run_stage(stage, fixture, log)
+                    best = results.get(key)
+                    results[key] = m if best is None else Measurement(
+                        min(best.wall_s, m.wall_s), min(best.peak_rss_mb, m.peak_rss_mb), min(best.written_mb, m.written_mb)
+                    )
+                    print(f"  {key:<28}{m.wall_s:>9.3f}s{m.peak_rss_mb:>9.1f} MB{m.written_mb:>10.2f} MB written", flush=True)
+    return results
+
+
+def compare(results: dict[str, Measurement], baseline: dict[str, dict], threshold: float) -> list[str]:
+    regressions = []
+    for key, m in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for field, slack in (("wall_s", MIN_WALL_S), ("peak_rss_mb", MIN_RSS_MB), ("written_mb", MIN_WRITTEN_MB)):
+            limit = max(base[field] * (1 + threshold), base[field] + slack)
+            value = getattr(m, field)
+            if value > limit:
+                regressions.append(f"{key}: {field} {value:.3f} > {base[field]:.3f} baseline (+{threshold:.0%})")
+    return regressions
+
+
+def machine() -> dict[str, str | int]:
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count() or 1,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", default=",".join(map(str, SCALES)), help="word pack scale factors")
+    parser.add_argument("--stage", action="append", help="run only stages starting with this name (repeatable)")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="best of N runs per stage")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed regression over the baseline")
+    parser.add_argument("--update-baseline", action="store_true", help=f"write results to {BASELINE_PATH.name}")
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scales.split(",") if s]
+    stages = [s for s in STAGES if not args.stage or any(s.name.startswith(p) for p in args.stage)]
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        skipped = [s.name for s in stages if s.images]
+        if skipped:
+            print(f"Pillow not installed, skipping {', '.join(skipped)}")
+        stages = [s for s in stages if not s.images]
+
+    log = Path(tempfile.gettempdir()) / "wordpacks-bench.log"
+    log.write_bytes(b"")
+    print(f"{'stage':<30}{'wall':>10}{'peak RSS':>12}{'written':>18}")
+    results = run(stages, scales, args.repeat, log)
+
+    stored = json.loads(BASELINE_PATH.read_text(encoding="utf-8")) if BASELINE_PATH.exists() else {}
+    if args.update_baseline:
+        merged = {**stored.get("results", {}), **{k: asdict(v) for k, v in results.items()}}
+        rounded = {k: {f: round(v, 3) for f, v in m.items()} for k, m in sorted(merged.items())}
+        BASELINE_PATH.write_text(
+            json.dumps({"machine": machine(), "results": rounded}, indent=2) + "\n", encoding="utf-8", newline="\n"
+        )
+        print(f"baseline updated: {BASELINE_PATH.relative_to(ROOT)}")
+        return 0
+
+    if not stored:
+        print(f"no baseline yet; run with --update-baseline to create {BASELINE_PATH.relative_to(ROOT)}")
+        return 0
+    if stored.get("machine") != machine():
+        print(f"note: baseline recorded on {stored.get('machine')}, this is {machine()}")
+    regressions = compare(results, stored["results"], args.threshold)
+    for r in regressions:
+        print(f"REGRESSION {r}")
+    print(f"{len(results)} measurements, {len(regressions)} regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
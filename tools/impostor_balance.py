@@ -0,0 +1,319 @@
+"""Impostor balance model and Monte Carlo simulator (requires NumPy).
+
+    python3 tools/impostor_balance.py [--players 3-30] [--rounds 200000] [--seed 0]
+    python3 tools/impostor_balance.py --spec-only
+
+Models two pieces of Dart:
+
+* ``suggestImpostors`` (lib/domain/settings/impostor_suggestion.dart): a
+  scalar port, ``suggest_impostors``, and a NumPy port over whole player
+  ranges, ``suggest_impostors_np``; both must agree for every player count.
+* The impostor draw in game_screen.dart ``_createSession``:
+  ``while (impostorIndexes.length < impostors) add(rand.nextInt(players))``,
+  then the starting player, uniform over everyone or, with
+  preventImpostorFirst, over the non-impostors.
+
+For every player count, difficulty and preventImpostorFirst setting the
+simulator plays ``--rounds`` rounds at the suggested impostor count, batched
+as arrays, and reports the suggested counts, rejection-loop iterations (mean,
+expected, worst observed), the chance an impostor starts and chi-square
+p-values for per-seat impostor and starting-player uniformity.
+
+Before simulating it reads the doc comment and the code of
+impostor_suggestion.dart and fails if the ratios, the 5-7 player maxima or
+the minimum-impostor rules differ between the comment, the code and this
+model.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import re
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # only the simulator needs it; --spec-only works without
+    np = None
+
+ROOT = Path(__file__).resolve().parents[1]
+SUGGESTION_DART = ROOT / "lib" / "domain" / "settings" / "impostor_suggestion.dart"
+
+DIFFICULTIES = ("easy", "medium", "hard")
+RATIOS = {"easy": 0.14, "medium": 0.20, "hard": 0.27}
+MAX_IMPOSTORS = 6
+SMALL_GROUP = 4  # players <= SMALL_GROUP always get one impostor
+BRACKET = (5, 7)
+BRACKET_MAX = {"easy": 1, "medium": 2, "hard": 2}
+# (players >=, difficulties, at least this many impostors)
+FLOORS = ((8, frozenset({"medium", "hard"}), 2), (15, frozenset({"hard"}), 3))
+
+
+# --- Dart spec -------------------------------------------------------------
+
+
+Floor = tuple[int, frozenset, int]
+
+
+@dataclass
+class Spec:
+    ratios: dict[str, float]
+    bracket_max: dict[str, int]
+    floors: set[Floor]
+
+
+def _switch(code: str, name: str) -> dict[str, float]:
+    match = re.search(rf"final {name} = switch \(difficulty\) \{{(.*?)\}};", code, re.S)
+    if not match:
+        raise ValueError(f"{SUGGESTION_DART.name}: no `{name}` switch")
+    return {d: float(v) for d, v in re.findall(r"Difficulty\.(\w+) => ([0-9.]+)", match.group(1))}
+
+
+def parse_dart(text: str) -> tuple[Spec, Spec]:
+    """``(doc comment spec, code spec)`` of impostor_suggestion.dart."""
+    doc = "\n".join(line[3:].strip() for line in text.splitlines() if line.startswith("///"))
+    code = text.split("int suggestImpostors(", 1)[1]
+
+    doc_spec = Spec(
+        ratios={d: float(v) for d, v in re.findall(r"- (easy|medium|hard):\s*([0-9.]+)", doc)},
+        bracket_max={d: int(v) for d, v in re.findall(r"(easy|medium|hard) max (\d+)", doc)},
+        floors={
+            (int(p), frozenset(ds.split("/")), int(n))
+            for p, ds, n in re.findall(r"players >= (\d+) and difficulty ([a-z/]+), ensure recommended >= (\d+)", doc)
+        },
+    )
+
+    floors = set()
+    pattern = r"if \(players >= (\d+) && difficulty (==|!=) Difficulty\.(\w+)\) \{\s*recommended = _clamp\(recommended, (\d+),"
+    for p, op, d, n in re.findall(pattern, code):
+        ds = frozenset({d}) if op == "==" else frozenset(DIFFICULTIES) - {d}
+        floors.add((int(p), ds, int(n)))
+    code_spec = Spec(
+        ratios=_switch(code, "baseRatio"),
+        bracket_max={d: int(v) for d, v in _switch(code, "maxByBracket").items()},
+        floors=floors,
+    )
+    return doc_spec, code_spec
+
+
+def spec_problems(text: str) -> list[str]:
+    doc, code = parse_dart(text)
+    model = Spec(dict(RATIOS), dict(BRACKET_MAX), set(FLOORS))
+    problems = []
+    for field in ("ratios", "bracket_max", "floors"):
+        values = {"doc comment": getattr(doc, field), "code": getattr(code, field), "model": getattr(model, field)}
+        if not values["doc comment"] or not values["code"]:
+            problems.append(f"{field}: could not parse {[k for k, v in values.items() if not v]}")
+        elif len({repr(sorted(v.items()) if isinstance(v, dict) else sorted(v, key=repr)) for v in values.values()}) > 1:
+            problems.append(f"{field} drifted: " + "; ".join(f"{k} {_show(v)}" for k, v in values.items()))
+    return problems
+
+
+def _show(value: dict | set) -> str:
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{k}: {v}" for k, v in sorted(value.items())) + "}"
+    return "[" + ", ".join(f">={p} {'/'.join(sorted(ds))} -> {n}" for p, ds, n in sorted(value, key=repr)) + "]"
+
+
+# --- suggestImpostors ------------------------------------------------------
+
+
+def dart_round(x: float) -> int:
+    """``double.round()``: halves away from zero (Python's round() is half-even)."""
+    return math.floor(x + 0.5) if x >= 0 else -math.floor(-x + 0.5)
+
+
+def _clamp(value: int, lo: int, hi: int) -> int:
+    return lo if value < lo else hi if value > hi else value
+
+
+def suggest_impostors(players: int, difficulty: str) -> int:
+    recommended = dart_round(players * RATIOS[difficulty])
+    recommended = _clamp(recommended, 1, min(MAX_IMPOSTORS, players - 1))
+    if players <= SMALL_GROUP:
+        return 1
+    if BRACKET[0] <= players <= BRACKET[1]:
+        recommended = _clamp(recommended, 1, BRACKET_MAX[difficulty])
+    for min_players, difficulties, floor in FLOORS:
+        if players >= min_players and difficulty in difficulties:
+            recommended = _clamp(recommended, floor, min(MAX_IMPOSTORS, players - 1))
+    return recommended
+
+
+def suggest_impostors_np(players: np.ndarray, difficulty: str) -> np.ndarray:
+    """``suggest_impostors`` over an integer array of player counts."""
+    cap = np.minimum(MAX_IMPOSTORS, players - 1)
+    recommended = np.floor(players * RATIOS[difficulty] + 0.5).astype(np.int64)
+    recommended = np.clip(recommended, 1, cap)
+    bracket = (players >= BRACKET[0]) & (players <= BRACKET[1])
+    recommended = np.where(bracket, np.clip(recommended, 1, BRACKET_MAX[difficulty]), recommended)
+    for min_players, difficulties, floor in FLOORS:
+        if difficulty in difficulties:
+            recommended = np.where(players >= min_players, np.clip(recommended, floor, cap), recommended)
+    return np.where(players <= SMALL_GROUP, 1, recommended)
+
+
+# --- impostor draw ---------------------------------------------------------
+
+
+@dataclass
+class RoundStats:
+    rounds: int
+    iterations_mean: float
+    iterations_max: int
+    impostor_starts: float
+    seat_p: float
+    start_p: float
+    exact_count: bool
+
+
+def expected_iterations(players: int, impostors: int) -> float:
+    """Expected ``rand.nextInt(players)`` calls to collect ``impostors`` distinct seats."""
+    return sum(players / (players - i) for i in range(impostors))
+
+
+def simulate_rounds(
+    rng: np.random.Generator, players: int, impostors: int, rounds: int, prevent_impostor_first: bool
+) -> RoundStats:
+    member = np.zeros((rounds, players), dtype=bool)
+    count = np.zeros(rounds, dtype=np.int64)
+    iterations = np.zeros(rounds, dtype=np.int64)
+    active = np.arange(rounds)
+    while active.size:
+        picks = rng.integers(0, players, size=active.size)
+        iterations[active] += 1
+        new = ~member[active, picks]
+        member[active[new], picks[new]] = True
+        count[active[new]] += 1
+        active = active[count[active] < impostors]
+
+    if prevent_impostor_first:
+        # r-th non-impostor seat: the number of seats whose running count of
+        # non-impostors is still <= r.
+        r = rng.integers(0, players - impostors, size=rounds)
+        start = (np.cumsum(~member, axis=1) <= r[:, None]).sum(axis=1)
+    else:
+        start = rng.integers(0, players, size=rounds)
+
+    return RoundStats(
+        rounds=rounds,
+        iterations_mean=float(iterations.mean()),
+        iterations_max=int(iterations.max()),
+        impostor_starts=float(member[np.arange(rounds), start].mean()),
+        seat_p=chi_square_p(member.sum(axis=0)),
+        start_p=chi_square_p(np.bincount(start, minlength=players)),
+        exact_count=bool((member.sum(axis=1) == impostors).all()),
+    )
+
+
+def chi_square_p(counts: np.ndarray) -> float:
+    """Upper-tail p-value against uniform (Wilson-Hilferty approximation)."""
+    k = counts.size
+    if k < 2:
+        return 1.0
+    expected = counts.sum() / k
+    stat = float(((counts - expected) ** 2).sum() / expected)
+    df = k - 1
+    z = ((stat / df) ** (1 / 3) - (1 - 2 / (9 * df))) / math.sqrt(2 / (9 * df))
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+# --- CLI -------------------------------------------------------------------
+
+
+def parse_range(value: str) -> range:
+    lo, _, hi = value.partition("-")
+    lo, hi = int(lo), int(hi or lo)
+    if not 2 <= lo <= hi:
+        raise argparse.ArgumentTypeError(f"bad player range {value!r}")
+    return range(lo, hi + 1)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=parse_range, default=range(3, 31), help="player counts, e.g. 3-30")
+    parser.add_argument("--rounds", type=int, default=200_000, help="simulated rounds per configuration")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--alpha", type=float, default=1e-6, help="chi-square failure threshold (hundreds of tests run)")
+    parser.add_argument("--spec-only", action="store_true", help="only check the Dart comment, code and model agree")
+    args = parser.parse_args(argv)
+
+    problems = spec_problems(SUGGESTION_DART.read_text(encoding="utf-8"))
+    for problem in problems:
+        print(f"FAIL {problem}")
+    if args.spec_only or problems:
+        if not problems:
+            print(f"{SUGGESTION_DART.relative_to(ROOT)}: comment, code and model agree")
+        return 1 if problems else 0
+
+    if np is None:
+        print("the simulator needs NumPy: pip install numpy", file=sys.stderr)
+        return 1
+
+    started = time.perf_counter()
+    players = np.array(list(args.players))
+    suggested = {}
+    for d in DIFFICULTIES:
+        scalar = [suggest_impostors(int(p), d) for p in players]
+        vector = suggest_impostors_np(players, d).tolist()
+        if scalar != vector:
+            bad = [int(p) for p, a, b in zip(players, scalar, vector) if a != b]
+            problems.append(f"{d}: scalar and NumPy models disagree for players {bad}")
+        suggested[d] = dict(zip(players.tolist(), scalar))
+
+    print("suggested impostors")
+    print(f"{'players':<8}" + "".join(f"{p:>3}" for p in players))
+    for d in DIFFICULTIES:
+        print(f"{d:<8}" + "".join(f"{suggested[d][p]:>3}" for p in players.tolist()))
+    for d in DIFFICULTIES:
+        hist = {}
+        for k in suggested[d].values():
+            hist[k] = hist.get(k, 0) + 1
+        print(f"{d}: " + ", ".join(f"{k} impostor{'s' if k > 1 else ''} x{n}" for k, n in sorted(hist.items())))
+
+    rng = np.random.default_rng(args.seed)
+    total = 0
+    cache = {}
+    print()
+    print(f"{'diff':<7}{'pl':>3}{'imp':>4}{'iter':>7}{'expect':>8}{'worst':>6}"
+          f"{'imp starts':>12}{'(prevent)':>10}{'seat p':>9}{'start p':>9}")
+    for d in DIFFICULTIES:
+        for p in players.tolist():
+            k = suggested[d][p]
+            for prevent in (False, True):
+                if (p, k, prevent) not in cache:
+                    cache[p, k, prevent] = simulate_rounds(rng, p, k, args.rounds, prevent)
+                    total += args.rounds
+            free, guarded = cache[p, k, False], cache[p, k, True]
+            print(
+                f"{d:<7}{p:>3}{k:>4}{free.iterations_mean:>7.3f}{expected_iterations(p, k):>8.3f}"
+                f"{max(free.iterations_max, guarded.iterations_max):>6}"
+                f"{free.impostor_starts:>12.2%}{guarded.impostor_starts:>10.2%}"
+                f"{min(free.seat_p, guarded.seat_p):>9.3f}{min(free.start_p, guarded.start_p):>9.3f}"
+            )
+            for label, stats in (("", free), (" preventImpostorFirst", guarded)):
+                where = f"{d} players={p} impostors={k}{label}"
+                if not stats.exact_count:
+                    problems.append(f"{where}: a round did not get exactly {k} impostors")
+                if stats.seat_p < args.alpha:
+                    problems.append(f"{where}: impostor seats not uniform (p={stats.seat_p:.2e})")
+                if stats.start_p < args.alpha:
+                    problems.append(f"{where}: starting player not uniform (p={stats.start_p:.2e})")
+            if guarded.impostor_starts:
+                problems.append(f"{d} players={p}: an impostor started with preventImpostorFirst")
+            se = math.sqrt(k / p * (1 - k / p) / args.rounds)
+            if abs(free.impostor_starts - k / p) > 5 * se:
+                problems.append(f"{d} players={p}: impostor starts {free.impostor_starts:.3%}, expected {k / p:.3%}")
+
+    for problem in problems:
+        print(f"FAIL {problem}")
+    print(f"{total:,} rounds simulated in {time.perf_counter() - started:.1f}s, {'FAILED' if problems else 'ok'}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,262 @@
+"""Opt-in instrumentation for the Python tools: stage timers, counters, profiles and a trace.
+
+Everything is off unless ``IMPOSTOR_TRACE`` is set, so normal and release
+runs pay nothing; to diagnose a slow step, rerun the same command with it:
+
+    IMPOSTOR_TRACE=1 ./regenerate_ipa_clean.sh
+    IMPOSTOR_TRACE=profile,memory python3 tools/wordpacks.py apply
+
+The value is a comma-separated list. Any value other than ``0`` turns on the
+timers, counters and trace; ``profile`` adds cProfile and ``memory`` adds
+tracemalloc (both cover the main process only). Output goes to build/trace/
+unless ``IMPOSTOR_TRACE_DIR`` names another directory.
+
+* ``span(name, **args)`` times a block: a complete ("X") event in the trace
+  and a row of the summary (calls, total, max).
+* ``count(name, n)`` adds to a counter, also traced as a counter ("C") event.
+* ``event(name, **args)`` marks an instant ("i"), e.g. a file written.
+* ``entrypoint`` wraps a tool's ``main``. On exit it writes
+  ``<tool>-<time>-<pid>.trace.json`` (Chrome trace event format: open it in
+  chrome://tracing or ui.perfetto.dev), plus ``.prof``/``.profile.txt`` and
+  ``.memory.txt`` when asked, and prints the summary to stderr.
+* ``call(fn, *args)`` is what to submit to a process pool: it runs ``fn`` and
+  returns its result with the events recorded in the worker; ``result()``
+  unwraps it in the parent and merges the events, so worker spans show up on
+  their own process track.
+
+Timestamps come from ``perf_counter_ns``, a system-wide monotonic clock on
+Linux and macOS, so events of worker processes line up with the parent's.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+TRACE_ENV = "IMPOSTOR_TRACE"
+DIR_ENV = "IMPOSTOR_TRACE_DIR"
+DEFAULT_DIR = Path(__file__).resolve().parents[1] / "build" / "trace"
+
+T = TypeVar("T")
+
+
+def _parse(value: str) -> frozenset[str] | None:
+    flags = frozenset(f.strip().lower() for f in value.split(",") if f.strip())
+    return None if not flags or flags == {"0"} else flags
+
+
+FLAGS = _parse(os.environ.get(TRACE_ENV, ""))
+ENABLED = FLAGS is not None
+
+_NULL = contextlib.nullcontext()
+_lock = threading.Lock()
+_events: list[dict] = []
+_counters: dict[str, float] = {}
+_session: str | None = None
+
+
+def _us(ns: int) -> float:
+    return ns / 1000
+
+
+def _record(ev: dict) -> None:
+    with _lock:
+        _events.append(ev)
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name: str, args: dict) -> None:
+        self.name = name
+        self.args = args
+
+    def __enter__(self) -> _Span:
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        end = time.perf_counter_ns()
+        ev = {"name": self.name, "ph": "X", "ts": _us(self.start), "dur": _us(end - self.start),
+              "pid": os.getpid(), "tid": threading.get_native_id()}
+        if self.args:
+            ev["args"] = self.args
+        _record(ev)
+
+
+def span(name: str, **args: Any) -> contextlib.AbstractContextManager:
+    """Time the ``with`` block as stage ``name``; ``args`` are shown on the event."""
+    return _Span(name, args) if ENABLED else _NULL
+
+
+def count(name: str, n: float = 1) -> None:
+    if not ENABLED:
+        return
+    with _lock:
+        value = _counters[name] = _counters.get(name, 0) + n
+        _events.append({"name": name, "ph": "C", "ts": _us(time.perf_counter_ns()), "pid": os.getpid(),
+                        "args": {"value": value}})
+
+
+def event(name: str, **args: Any) -> None:
+    if ENABLED:
+        _record({"name": name, "ph": "i", "s": "t", "ts": _us(time.perf_counter_ns()), "pid": os.getpid(),
+                 "tid": threading.get_native_id(), "args": args})
+
+
+# --- process pools -------------------------------------------------------------
+
+
+def call(fn: Callable[..., T], *args: Any) -> tuple[T, list[dict], dict[str, float]]:
+    """Run ``fn(*args)`` in a pool worker; pass what it returns to ``result``."""
+    if not ENABLED:
+        return fn(*args), [], {}
+    # A forked worker starts with a copy of the parent's buffers: send only what is new.
+    with _lock:
+        mark = len(_events)
+        before = dict(_counters)
+    out = fn(*args)
+    with _lock:
+        events = _events[mark:]
+        del _events[mark:]
+        deltas = {k: v - before.get(k, 0) for k, v in _counters.items() if v != before.get(k, 0)}
+        _counters.clear()
+        _counters.update(before)
+    return out, events, deltas
+
+
+def result(value: tuple[T, list[dict], dict[str, float]]) -> T:
+    """Unwrap the return value of ``call`` and merge the worker's events."""
+    out, events, deltas = value
+    if events or deltas:
+        with _lock:
+            known = {ev["pid"] for ev in _events if ev["ph"] == "M"}
+            for pid in {ev["pid"] for ev in events} - known:
+                _events.append({"name": "process_name", "ph": "M", "pid": pid,
+                                "args": {"name": f"{_session or 'tool'} worker {pid}"}})
+            _events.extend(events)
+            for k, v in deltas.items():
+                _counters[k] = _counters.get(k, 0) + v
+    return out
+
+
+# --- sessions ------------------------------------------------------------------
+
+
+def entrypoint(main: Callable[..., T]) -> Callable[..., T]:
+    """Decorate a tool's ``main`` to capture a session around it when tracing is on."""
+    if not ENABLED:
+        return main
+
+    @functools.wraps(main)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        with session(Path(sys.argv[0]).stem or main.__module__):
+            return main(*args, **kwargs)
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def session(tool: str) -> Iterator[None]:
+    """Capture everything until the block exits, then write the outputs (nested sessions are no-ops)."""
+    global _session
+    if not ENABLED or _session is not None:
+        yield
+        return
+    _session = tool
+    flags = FLAGS or frozenset()
+    profiler = None
+    if "memory" in flags:
+        import tracemalloc
+
+        tracemalloc.start()
+    if "profile" in flags:
+        import cProfile
+
+        profiler = cProfile.Profile()
+    _record({"name": "process_name", "ph": "M", "pid": os.getpid(), "args": {"name": tool}})
+    started = time.perf_counter_ns()
+    try:
+        if profiler is not None:
+            profiler.enable()
+        with span(tool, argv=sys.argv[1:]):
+            yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        _finish(tool, time.perf_counter_ns() - started, profiler)
+        _session = None
+
+
+def _peak_rss() -> str:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return ""
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return f", peak RSS {maxrss / 2**20 if sys.platform == 'darwin' else maxrss / 2**10:.1f} MiB"
+
+
+def _summary(wall_ns: int) -> list[str]:
+    stages: dict[str, list[float]] = {}
+    for ev in _events:
+        if ev["ph"] == "X":
+            s = stages.setdefault(ev["name"], [0, 0.0, 0.0])
+            s[0] += 1
+            s[1] += ev["dur"]
+            s[2] = max(s[2], ev["dur"])
+    lines = [f"{'stage':32} {'calls':>6} {'total ms':>10} {'max ms':>9}"]
+    for name, (calls, total, most) in sorted(stages.items(), key=lambda item: -item[1][1]):
+        lines.append(f"{name[:32]:32} {calls:6d} {total / 1000:10.1f} {most / 1000:9.1f}")
+    lines.append(f"wall {wall_ns / 1e6:.1f} ms (stage totals add up every process and thread){_peak_rss()}")
+    if _counters:
+        lines.append("counters: " + ", ".join(f"{k} {v:g}" for k, v in sorted(_counters.items())))
+    return lines
+
+
+def _finish(tool: str, wall_ns: int, profiler: Any) -> None:
+    out_dir = Path(os.environ.get(DIR_ENV) or DEFAULT_DIR)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    base = out_dir / f"{tool}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+    lines = _summary(wall_ns)
+
+    if "memory" in (FLAGS or ()):
+        import tracemalloc
+
+        current, peak = tracemalloc.get_traced_memory()
+        top = tracemalloc.take_snapshot().statistics("lineno")[:30]
+        tracemalloc.stop()
+        memory = Path(f"{base}.memory.txt")
+        memory.write_text(
+            f"peak {peak / 2**20:.1f} MiB, {current / 2**20:.1f} MiB still allocated at exit\n\n"
+            + "".join(f"{stat}\n" for stat in top),
+            encoding="utf-8",
+        )
+        lines.append(f"memory: peak {peak / 2**20:.1f} MiB of Python allocations, not counting Pillow's pixel buffers ({memory})")
+    if profiler is not None:
+        import pstats
+
+        prof = Path(f"{base}.prof")
+        profiler.dump_stats(prof)
+        with Path(f"{base}.profile.txt").open("w", encoding="utf-8") as f:
+            pstats.Stats(profiler, stream=f).sort_stats("cumulative").print_stats(40)
+        lines.append(f"profile: {prof} (top functions in {base.name}.profile.txt)")
+
+    trace = Path(f"{base}.trace.json")
+    doc = {
+        "traceEvents": _events,
+        "displayTimeUnit": "ms",
+        "otherData": {"tool": tool, "argv": sys.argv, "python": platform.python_version(), "flags": sorted(FLAGS or ())},
+    }
+    trace.write_text(json.dumps(doc, separators=(",", ":")), encoding="utf-8")
+    lines.insert(0, f"trace: {trace} ({len(_events)} events)")
+    print("\n".join(lines), file=sys.stderr)
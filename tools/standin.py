@@ -0,0 +1,243 @@
+"""Local HTTP stand-ins for the app's remote endpoints.
+
+A stand-in is one function from a request (path, query, headers) to a
+``Response``; ``serve`` runs it on a threaded ``http.server`` until Ctrl-C.
+Every 200 response gets a strong ``ETag`` (a hash of its body, unless the
+handler sets one) and is answered with 304 when the client's
+``If-None-Match`` matches. Bodies from 1 KiB are gzipped for clients that
+accept it. Each request is logged to stderr with its status, size and time.
+
+``Faults`` makes a stand-in behave like a bad network, to see how a client
+copes: added latency (with jitter), error statuses, requests that hang and
+then drop the connection, and bodies cut short. Faults are drawn from one
+seeded generator, so a run can be repeated. ``GET /_standin/stats`` is never
+faulted and returns what the server has answered so far.
+
+Nothing here is meant for production: it binds to 127.0.0.1 by default and
+serves whatever the handler returns.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Mapping
+from urllib.parse import parse_qsl, urlsplit
+
+JSON = "application/json; charset=utf-8"
+GZIP_MIN_BYTES = 1024
+STATS_PATH = "/_standin/stats"
+
+
+@dataclass
+class Response:
+    status: int
+    body: bytes = b""
+    content_type: str = JSON
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+def json_response(data: Any, status: int = 200, headers: dict[str, str] | None = None) -> Response:
+    body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return Response(status, body, JSON, dict(headers or {}))
+
+
+def file_response(path: Path, headers: dict[str, str] | None = None) -> Response:
+    content_type = JSON if path.suffix == ".json" else "application/octet-stream"
+    return Response(200, path.read_bytes(), content_type, dict(headers or {}))
+
+
+def not_found(what: str) -> Response:
+    return json_response({"error": f"not found: {what}"}, 404)
+
+
+# path, query, request headers
+Handler = Callable[[str, Mapping[str, str], Mapping[str, str]], Response]
+
+
+def etag(body: bytes) -> str:
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def _matches(if_none_match: str | None, tag: str) -> bool:
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or tag in (t.strip() for t in if_none_match.split(","))
+
+
+@dataclass(frozen=True)
+class Faults:
+    """Network trouble to inject; rates are per request, in [0, 1]."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    fail_rate: float = 0.0
+    fail_status: int = 503
+    hang_rate: float = 0.0
+    hang_s: float = 30.0
+    truncate_rate: float = 0.0
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        rates = (self.fail_rate, self.hang_rate, self.truncate_rate)
+        if any(not 0 <= r <= 1 for r in rates) or sum(rates) > 1:
+            raise ValueError("fault rates must be in [0, 1] and add up to at most 1")
+        if self.latency_ms < 0 or self.jitter_ms < 0 or self.hang_s < 0:
+            raise ValueError("latency, jitter and hang time cannot be negative")
+
+    @property
+    def active(self) -> bool:
+        return bool(self.latency_ms or self.jitter_ms or self.fail_rate or self.hang_rate or self.truncate_rate)
+
+
+def add_fault_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("fault injection")
+    group.add_argument("--latency-ms", type=float, default=0.0, help="delay before every response")
+    group.add_argument("--jitter-ms", type=float, default=0.0, help="extra random delay, uniform in [0, N]")
+    group.add_argument("--fail-rate", type=float, default=0.0, help="share of requests answered with --fail-status")
+    group.add_argument("--fail-status", type=int, default=503)
+    group.add_argument("--hang-rate", type=float, default=0.0,
+                       help="share of requests that get no answer and are dropped after --hang-s")
+    group.add_argument("--hang-s", type=float, default=30.0)
+    group.add_argument("--truncate-rate", type=float, default=0.0,
+                       help="share of requests whose body is cut in half")
+    group.add_argument("--seed", type=int, default=None, help="seed for the fault draws")
+
+
+def faults_from_args(args: argparse.Namespace) -> Faults:
+    try:
+        return Faults(
+            latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+            fail_rate=args.fail_rate, fail_status=args.fail_status,
+            hang_rate=args.hang_rate, hang_s=args.hang_s,
+            truncate_rate=args.truncate_rate, seed=args.seed,
+        )
+    except ValueError as e:
+        raise SystemExit(f"error: {e}")
+
+
+class _FaultDraws:
+    """Thread-safe draws of one ``Faults`` plus the server's counters."""
+
+    def __init__(self, faults: Faults) -> None:
+        self.faults = faults
+        self._rng = random.Random(faults.seed)
+        self._lock = threading.Lock()
+        self.stats: dict[str, int] = {}
+
+    def draw(self) -> tuple[float, str | None]:
+        """Delay in seconds and the fault to apply ("fail", "hang", "truncate" or None)."""
+        f = self.faults
+        with self._lock:
+            delay = f.latency_ms + (self._rng.uniform(0, f.jitter_ms) if f.jitter_ms else 0.0)
+            roll = self._rng.random()
+        fault = None
+        for kind, rate in (("fail", f.fail_rate), ("hang", f.hang_rate), ("truncate", f.truncate_rate)):
+            if roll < rate:
+                fault = kind
+                break
+            roll -= rate
+        return delay / 1000, fault
+
+    def record(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(sorted(self.stats.items()))
+
+
+def _request_handler(name: str, handle: Handler, draws: _FaultDraws) -> type[BaseHTTPRequestHandler]:
+    class RequestHandler(BaseHTTPRequestHandler):
+        server_version = f"{name}-standin"
+
+        def do_GET(self) -> None:
+            self._respond(send_body=True)
+
+        def do_HEAD(self) -> None:
+            self._respond(send_body=False)
+
+        def _respond(self, send_body: bool) -> None:
+            started = time.perf_counter()
+            url = urlsplit(self.path)
+            fault = None
+            if url.path == STATS_PATH:
+                response = json_response(draws.snapshot())
+            else:
+                delay, fault = draws.draw()
+                if delay:
+                    time.sleep(delay)
+                if fault == "hang":
+                    time.sleep(draws.faults.hang_s)
+                    self.close_connection = True
+                    draws.record("hang")
+                    self._log("dropped", 0, started)
+                    return
+                if fault == "fail":
+                    response = json_response({"error": "injected failure"}, draws.faults.fail_status)
+                else:
+                    try:
+                        response = handle(url.path, dict(parse_qsl(url.query)), self.headers)
+                    except Exception as e:  # a stand-in should report, not die
+                        response = json_response({"error": f"{type(e).__name__}: {e}"}, 500)
+            status, body = response.status, response.body
+            headers = {"Cache-Control": "no-cache", **response.headers}
+            if status == 200:
+                headers.setdefault("ETag", etag(body))
+                if _matches(self.headers.get("If-None-Match"), headers["ETag"]):
+                    status, body = 304, b""
+            if len(body) >= GZIP_MIN_BYTES and "gzip" in self.headers.get("Accept-Encoding", ""):
+                body = gzip.compress(body, mtime=0)
+                headers["Content-Encoding"] = "gzip"
+                headers["Vary"] = "Accept-Encoding"
+            self.send_response(status)
+            if status not in (204, 304):
+                headers["Content-Type"] = response.content_type
+            headers["Content-Length"] = str(len(body))
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            if fault == "truncate" and body:
+                # Content-Length promises the whole body; the client sees the connection close early.
+                body = body[: len(body) // 2]
+                self.close_connection = True
+            if send_body and body:
+                self.wfile.write(body)
+            if url.path != STATS_PATH:
+                draws.record("truncate" if fault == "truncate" and body else str(status))
+            self._log(status, len(body), started)
+
+        def _log(self, status: int | str, size: int, started: float) -> None:
+            ms = (time.perf_counter() - started) * 1000
+            print(f"{self.command} {self.path} {status} {size}B {ms:.1f}ms", file=sys.stderr)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass  # replaced by _log
+
+    return RequestHandler
+
+
+def serve(name: str, handle: Handler, host: str = "127.0.0.1", port: int = 8765, faults: Faults | None = None) -> None:
+    """Serve ``handle`` on ``host:port`` until interrupted."""
+    faults = faults or Faults()
+    server = ThreadingHTTPServer((host, port), _request_handler(name, handle, _FaultDraws(faults)))
+    server.daemon_threads = True
+    print(f"{name}: serving on http://{host}:{server.server_address[1]} (Ctrl-C to stop)", file=sys.stderr)
+    if faults.active:
+        print(f"{name}: injecting {faults}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
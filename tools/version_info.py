@@ -0,0 +1,365 @@
+"""Generate, sign and serve impostor.json, the app's version info.
+
+    python3 tools/version_info.py generate [--version 1.2.0] [--min-version 1.1.0] [--required] [--note TEXT ...]
+    python3 tools/version_info.py keygen [--key .cache/version_info.key]
+    python3 tools/version_info.py sign [--file FILE] [--key KEY]
+    python3 tools/version_info.py verify [--file FILE] (--public-key B64 | --key KEY)
+    python3 tools/version_info.py serve [--file FILE] [--port 8766] [--latency-ms N] [--fail-rate R] ...
+    python3 tools/version_info.py probe [--url URL] [--requests 20] [--timeout 5]
+
+``generate`` writes build/version/impostor.json in the format
+VersionCheckerService reads (lib/domain/models/app_version_info.dart): the
+version defaults to the one in pubspec.yaml and the store URLs are the ones
+ShareMomentService links to. ``fecha_publicacion`` is kept while the version
+does not change. The app forces the update on installs below
+``version_minima`` and offers it to the rest, so the minimum is kept from the
+current file unless ``--min-version`` moves it; ``--required`` raises it to
+the new version, forcing every older install to update.
+
+``keygen`` creates an Ed25519 key (needs ``cryptography``) and prints its
+public half; ``sign`` writes a detached signature of the file's exact bytes
+to impostor.json.sig and ``verify`` checks it. Keys and signatures are
+base64 of the raw 32/64 bytes. The private key lives outside the repo's
+tracked files (.cache/ by default) and must never be committed.
+
+``serve`` runs a local stand-in of the version endpoint (tools/standin.py):
+``GET /impostor.json`` with ``ETag``/304 and an ``X-Signature`` header when
+the file is signed, and ``GET /impostor.json.sig``. Point a debug build at
+it with ``--dart-define=VERSION_INFO_URL=http://<host>:8766/impostor.json``
+and use the fault injection flags to simulate a slow or broken network.
+
+``probe`` times what the app's startup check waits for against any URL:
+cold requests, conditional requests with the ETag of the first answer, and
+how many would hit the app's 5 s timeout. Run it against ``serve`` with and
+without faults, or against a closed port for the no-network case.
+
+Every command honours IMPOSTOR_TRACE (see tools/instrument.py).
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import datetime
+import http.client
+import json
+import os
+import re
+import statistics
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import instrument
+import standin
+
+ROOT = Path(__file__).resolve().parents[1]
+PUBSPEC = ROOT / "pubspec.yaml"
+OUT_FILE = ROOT / "build" / "version" / "impostor.json"
+KEY_FILE = ROOT / ".cache" / "version_info.key"
+
+APP = "impostor"
+# Same links as lib/app/share_moment_service.dart.
+STORE_URL_ANDROID = "https://play.google.com/store/apps/details?id=com.rgioia.impostorwords"
+STORE_URL_IOS = "https://apps.apple.com/ar/app/impostor-words-party-game/id6757995242"
+
+# VersionCheckerService._timeout
+APP_TIMEOUT_S = 5.0
+
+VERSION = re.compile(r"\d+(\.\d+)*")
+
+
+def pubspec_version() -> str:
+    match = re.search(r"^version:\s*([\d.]+)", PUBSPEC.read_text(encoding="utf-8"), re.MULTILINE)
+    if match is None:
+        raise SystemExit(f"error: no version in {PUBSPEC}")
+    return match.group(1)
+
+
+def dart_compare_versions(v1: str, v2: str) -> int:
+    """``VersionCheckerService._compareVersions``: negative, zero or positive."""
+    parts1 = [int(p) for p in v1.split(".")]
+    parts2 = [int(p) for p in v2.split(".")]
+    width = max(len(parts1), len(parts2))
+    parts1 += [0] * (width - len(parts1))
+    parts2 += [0] * (width - len(parts2))
+    return (parts1 > parts2) - (parts1 < parts2)
+
+
+def version_info(
+    version: str,
+    min_version: str,
+    required: bool,
+    notes: list[str],
+    today: str,
+    previous: dict | None = None,
+) -> dict:
+    """The impostor.json document; ``previous`` keeps the publish date of the same version."""
+    published = today
+    if previous is not None and previous.get("version") == version:
+        published = previous.get("fecha_publicacion", today)
+    return {
+        "app": APP,
+        "version": version,
+        "fecha_publicacion": published,
+        "ultima_actualizacion": today,
+        "requiere_actualizacion": required,
+        "version_minima": min_version,
+        "notas_actualizacion": notes,
+        "url_tienda_android": STORE_URL_ANDROID,
+        "url_tienda_ios": STORE_URL_IOS,
+    }
+
+
+def _ed25519():
+    try:
+        from cryptography.hazmat.primitives.asymmetric import ed25519
+    except ImportError:
+        raise SystemExit("Install cryptography: pip install cryptography")
+    return ed25519
+
+
+def _raw(key) -> bytes:
+    from cryptography.hazmat.primitives import serialization
+
+    if hasattr(key, "private_bytes"):
+        return key.private_bytes(serialization.Encoding.Raw, serialization.PrivateFormat.Raw,
+                                 serialization.NoEncryption())
+    return key.public_bytes(serialization.Encoding.Raw, serialization.PublicFormat.Raw)
+
+
+def load_private_key(path: Path):
+    if not path.is_file():
+        raise SystemExit(f"error: {path} does not exist; run `version_info.py keygen` first")
+    return _ed25519().Ed25519PrivateKey.from_private_bytes(base64.b64decode(path.read_text().strip()))
+
+
+def sig_path(file: Path) -> Path:
+    return file.with_name(file.name + ".sig")
+
+
+def verify_signature(data: bytes, signature_b64: str, public_key_b64: str) -> bool:
+    from cryptography.exceptions import InvalidSignature
+
+    key = _ed25519().Ed25519PublicKey.from_public_bytes(base64.b64decode(public_key_b64))
+    try:
+        key.verify(base64.b64decode(signature_b64), data)
+    except InvalidSignature:
+        return False
+    return True
+
+
+def cmd_generate(args: argparse.Namespace) -> int:
+    out = Path(args.out)
+    try:
+        previous = json.loads(out.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        previous = None
+    version = args.version or pubspec_version()
+    # The app forces the update (hard dialog) on installs below version_minima,
+    # so it never moves unless asked to.
+    if args.required:
+        if args.min_version and args.min_version != version:
+            print("error: --required sets the minimum to --version; drop --min-version", file=sys.stderr)
+            return 1
+        min_version = version
+    else:
+        min_version = args.min_version or (previous or {}).get("version_minima")
+    if min_version is None:
+        print(f"error: {out} has no version_minima to keep; pass --min-version", file=sys.stderr)
+        return 1
+    for v in (version, min_version):
+        if not VERSION.fullmatch(v):
+            print(f"error: {v!r} is not a version like 1.2.0", file=sys.stderr)
+            return 1
+    if dart_compare_versions(min_version, version) > 0:
+        print(f"error: minimum {min_version} is newer than version {version}", file=sys.stderr)
+        return 1
+    # Informational only; what the app acts on is version_minima.
+    required = dart_compare_versions(min_version, version) == 0
+    doc = version_info(version, min_version, required, args.note or [], args.date, previous)
+    text = json.dumps(doc, ensure_ascii=False, indent=2) + "\n"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(text, encoding="utf-8")
+    stale = sig_path(out)
+    if stale.exists():
+        stale.unlink()  # the old signature no longer matches
+    print(f"wrote {out.relative_to(ROOT) if out.is_relative_to(ROOT) else out}: {version}, "
+          f"forced update below {min_version}, optional below {version}, {len(text.encode())} bytes")
+    return 0
+
+
+def cmd_keygen(args: argparse.Namespace) -> int:
+    path = Path(args.key)
+    if path.exists() and not args.force:
+        print(f"error: {path} exists; pass --force to replace it", file=sys.stderr)
+        return 1
+    key = _ed25519().Ed25519PrivateKey.generate()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(base64.b64encode(_raw(key)).decode() + "\n")
+    print(f"private key: {path}")
+    print(f"public key:  {base64.b64encode(_raw(key.public_key())).decode()}")
+    return 0
+
+
+def cmd_sign(args: argparse.Namespace) -> int:
+    file = Path(args.file)
+    if not file.is_file():
+        print(f"error: {file} does not exist; run `version_info.py generate` first", file=sys.stderr)
+        return 1
+    key = load_private_key(Path(args.key))
+    signature = base64.b64encode(key.sign(file.read_bytes())).decode()
+    sig_path(file).write_text(signature + "\n")
+    print(f"signed {file.name}: {sig_path(file)}")
+    print(f"public key: {base64.b64encode(_raw(key.public_key())).decode()}")
+    return 0
+
+
+def cmd_verify(args: argparse.Namespace) -> int:
+    file = Path(args.file)
+    sig = sig_path(file)
+    if not file.is_file() or not sig.is_file():
+        print(f"error: need both {file} and {sig}", file=sys.stderr)
+        return 1
+    public = args.public_key or base64.b64encode(_raw(load_private_key(Path(args.key)).public_key())).decode()
+    if not verify_signature(file.read_bytes(), sig.read_text().strip(), public):
+        print(f"{file.name}: BAD signature", file=sys.stderr)
+        return 1
+    print(f"{file.name}: signature OK")
+    return 0
+
+
+def cmd_serve(args: argparse.Namespace) -> int:
+    file = Path(args.file)
+    if not file.is_file():
+        print(f"error: {file} does not exist; run `version_info.py generate` first", file=sys.stderr)
+        return 1
+    name = file.name
+    sig = sig_path(file)
+
+    def handle(path: str, query: dict[str, str], headers: object) -> standin.Response:
+        # Read on every request so a regenerated file is served without a restart.
+        if path == f"/{name}":
+            extra = {"X-Signature": sig.read_text().strip()} if sig.is_file() else {}
+            return standin.file_response(file, extra)
+        if path == f"/{sig.name}" and sig.is_file():
+            return standin.Response(200, sig.read_bytes(), "text/plain; charset=utf-8")
+        return standin.not_found(path)
+
+    standin.serve("version-info", handle, args.host, args.port, standin.faults_from_args(args))
+    return 0
+
+
+def _get(url: str, timeout: float, etag: str | None) -> tuple[str, float, str | None]:
+    """One request like the app's: outcome ("200", "304", "timeout", "error: ..."), seconds, ETag."""
+    request = urllib.request.Request(url, headers={"If-None-Match": etag} if etag else {})
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            body = response.read()
+            json.loads(body)
+            return str(response.status), time.perf_counter() - started, response.headers.get("ETag")
+    except urllib.error.HTTPError as e:
+        return str(e.code), time.perf_counter() - started, etag
+    except TimeoutError:
+        return "timeout", time.perf_counter() - started, None
+    except (urllib.error.URLError, http.client.HTTPException, ConnectionError, ValueError) as e:
+        reason = getattr(e, "reason", None) or type(e).__name__
+        if isinstance(reason, TimeoutError):
+            return "timeout", time.perf_counter() - started, None
+        return f"error: {reason}", time.perf_counter() - started, None
+
+
+def _report(label: str, results: list[tuple[str, float]], timeout: float) -> None:
+    outcomes: dict[str, int] = {}
+    for outcome, _ in results:
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    # What startup waits for: the request, capped by the app's timeout.
+    waits = sorted(min(seconds, timeout) * 1000 for _, seconds in results)
+    p95 = waits[min(len(waits) - 1, round(0.95 * (len(waits) - 1)))]
+    summary = ", ".join(f"{k} x{v}" for k, v in sorted(outcomes.items()))
+    print(f"  {label:<12} p50 {statistics.median(waits):7.1f} ms  p95 {p95:7.1f} ms  "
+          f"max {waits[-1]:7.1f} ms  {summary}")
+
+
+def cmd_probe(args: argparse.Namespace) -> int:
+    if args.requests < 1:
+        print("error: --requests must be at least 1", file=sys.stderr)
+        return 1
+    print(f"{args.url} ({args.requests} requests each, timeout {args.timeout:g} s)")
+    cold: list[tuple[str, float]] = []
+    etag = None
+    with instrument.span("cold requests", n=args.requests):
+        for _ in range(args.requests):
+            outcome, seconds, tag = _get(args.url, args.timeout, None)
+            cold.append((outcome, seconds))
+            etag = etag or tag
+    _report("cold", cold, args.timeout)
+    if etag is None:
+        print("  conditional  skipped: no request returned an ETag")
+        return 0
+    conditional: list[tuple[str, float]] = []
+    with instrument.span("conditional requests", n=args.requests):
+        for _ in range(args.requests):
+            outcome, seconds, _ = _get(args.url, args.timeout, etag)
+            conditional.append((outcome, seconds))
+    _report("conditional", conditional, args.timeout)
+    return 0
+
+
+@instrument.entrypoint
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_gen = sub.add_parser("generate", help="write impostor.json")
+    p_gen.add_argument("--version", help="latest version (default: pubspec.yaml)")
+    p_gen.add_argument("--min-version",
+                       help="installs below it must update (default: version_minima of the current file)")
+    p_gen.add_argument("--required", action="store_true",
+                       help="force every older install to update (minimum = --version)")
+    p_gen.add_argument("--note", action="append", help="release note (repeatable)")
+    p_gen.add_argument("--date", default=datetime.date.today().isoformat(), help="update date (YYYY-MM-DD)")
+    p_gen.add_argument("--out", default=str(OUT_FILE))
+    p_gen.set_defaults(func=cmd_generate)
+
+    p_key = sub.add_parser("keygen", help="create an Ed25519 signing key")
+    p_key.add_argument("--key", default=str(KEY_FILE))
+    p_key.add_argument("--force", action="store_true", help="replace an existing key")
+    p_key.set_defaults(func=cmd_keygen)
+
+    p_sign = sub.add_parser("sign", help="write the detached signature of impostor.json")
+    p_sign.add_argument("--file", default=str(OUT_FILE))
+    p_sign.add_argument("--key", default=str(KEY_FILE))
+    p_sign.set_defaults(func=cmd_sign)
+
+    p_verify = sub.add_parser("verify", help="check the signature of impostor.json")
+    p_verify.add_argument("--file", default=str(OUT_FILE))
+    p_verify.add_argument("--public-key", help="base64 public key (default: derived from --key)")
+    p_verify.add_argument("--key", default=str(KEY_FILE))
+    p_verify.set_defaults(func=cmd_verify)
+
+    p_serve = sub.add_parser("serve", help="serve impostor.json locally")
+    p_serve.add_argument("--file", default=str(OUT_FILE))
+    p_serve.add_argument("--host", default="127.0.0.1")
+    p_serve.add_argument("--port", type=int, default=8766)
+    standin.add_fault_arguments(p_serve)
+    p_serve.set_defaults(func=cmd_serve)
+
+    p_probe = sub.add_parser("probe", help="time the version check against a URL")
+    p_probe.add_argument("--url", default="http://127.0.0.1:8766/impostor.json")
+    p_probe.add_argument("--requests", type=int, default=20)
+    p_probe.add_argument("--timeout", type=float, default=APP_TIMEOUT_S, help="seconds, as in the app")
+    p_probe.set_defaults(func=cmd_probe)
+
+    args = parser.parse_args()
+    with instrument.span(args.command):
+        return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
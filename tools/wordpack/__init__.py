@@ -0,0 +1,21 @@
+"""Shared word pack tooling for the scripts in tools/."""
+
+from .model import DIFFICULTIES, Category, CategoryUpdate, WordEntry, words_from_lists, words_from_pairs
+from .packfile import BUILD_DIR, WORDS_DIR, PackFile, load_packs, pack_path
+from .stream import apply_updates, rewrite_pack
+
+__all__ = [
+    "DIFFICULTIES",
+    "Category",
+    "CategoryUpdate",
+    "WordEntry",
+    "words_from_lists",
+    "words_from_pairs",
+    "BUILD_DIR",
+    "WORDS_DIR",
+    "PackFile",
+    "apply_updates",
+    "load_packs",
+    "pack_path",
+    "rewrite_pack",
+]
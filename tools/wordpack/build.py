@@ -0,0 +1,99 @@
+"""Apply category manifests to the locale packs, one worker process per pack."""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from .cache import PackState, digest, file_digest
+from .manifest import Manifest, manifest_update
+from .model import CategoryUpdate
+from .packfile import pack_path
+from .stream import rewrite_pack
+
+
+@dataclass
+class PackResult:
+    locale: str
+    changed: list[str]
+    written: bool
+    # Human-readable notes on what was skipped or rebuilt and why (for --explain).
+    notes: list[str] = field(default_factory=list)
+    # New cache state, or None when nothing needs to be stored (dry run / full skip).
+    state: PackState | None = None
+
+
+def apply_locale(
+    locale: str,
+    manifests: list[Manifest],
+    dry_run: bool = False,
+    cached: PackState | None = None,
+) -> PackResult:
+    """Apply one pack's manifests and write it back only if a category changed.
+
+    With ``cached`` state, unchanged inputs are skipped: the whole pack when its
+    file and every manifest hash match, otherwise each category whose manifest
+    and JSON block both match.
+    """
+    path = pack_path(locale)
+    pack_hash = file_digest(path)
+    manifest_bytes = {m.category: m.path.read_bytes() for m in manifests}
+    manifest_hashes = {c: digest(b) for c, b in manifest_bytes.items()}
+    by_category = {m.category: m for m in manifests}
+
+    if (
+        cached is not None
+        and cached.pack_hash == pack_hash
+        and all(cached.categories.get(c, ("",))[0] == h for c, h in manifest_hashes.items())
+    ):
+        note = f"skip {locale}: pack file and {len(manifests)} manifests unchanged"
+        return PackResult(locale, [], False, [note])
+
+    notes: list[str] = []
+
+    def update_for(category: str, block: bytes | None) -> CategoryUpdate | None:
+        prev = cached.categories.get(category) if cached else None
+        block_hash = digest(block) if block is not None else None
+        if prev is not None and prev == (manifest_hashes[category], block_hash):
+            notes.append(f"skip {locale}/{category}: manifest and category block unchanged")
+            return None
+        if prev is None:
+            reason = "no cache entry"
+        elif prev[0] != manifest_hashes[category]:
+            reason = "manifest changed"
+        else:
+            reason = "category block edited outside the manifest"
+        notes.append(f"check {locale}/{category}: {reason}")
+        return manifest_update(by_category[category], json.loads(manifest_bytes[category]))
+
+    # The pack is streamed through: only changed categories are re-rendered
+    # and a pack with no changes is not written at all.
+    result = rewrite_pack(path, manifest_hashes, update_for, dry_run=dry_run)
+    if dry_run:
+        return PackResult(locale, result.changed, False, notes)
+    state = PackState(
+        locale,
+        result.pack_hash,
+        {c: (h, result.block_hashes[c]) for c, h in manifest_hashes.items()},
+    )
+    return PackResult(locale, result.changed, result.written, notes, state)
+
+
+def apply_manifests(
+    grouped: dict[str, list[Manifest]],
+    jobs: int | None = None,
+    dry_run: bool = False,
+    cached: dict[str, PackState] | None = None,
+) -> list[PackResult]:
+    """Apply ``{locale: manifests}``; packs are independent so they run in parallel."""
+    cached = cached or {}
+    workers = min(jobs or os.cpu_count() or 1, len(grouped))
+    if workers <= 1:
+        return [apply_locale(loc, ms, dry_run, cached.get(loc)) for loc, ms in grouped.items()]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(apply_locale, loc, ms, dry_run, cached.get(loc)) for loc, ms in grouped.items()
+        ]
+        return [f.result() for f in futures]
@@ -0,0 +1,103 @@
+"""Content-hash build cache for ``wordpacks.py apply`` (.cache/wordpacks.db).
+
+For every pack the cache stores the hash of the pack file, and for every
+manifest-managed category the hash of the manifest and of the category's JSON
+block as it was last written. A pack whose file and manifests all match is not
+parsed at all; inside a parsed pack, a category whose manifest and block both
+match is not re-read, re-validated or re-rendered.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .packfile import ROOT
+
+CACHE_PATH = ROOT / ".cache" / "wordpacks.db"
+
+# Bump when the meaning of a cached hash changes (e.g. rendering rules).
+CACHE_VERSION = "1"
+
+
+def hasher() -> "hashlib._Hash":
+    """Incremental form of ``digest``."""
+    return hashlib.blake2b(digest_size=16)
+
+
+def digest(data: bytes | str) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def file_digest(path: Path, chunk_size: int = 1 << 16) -> str:
+    """``digest`` of a file's bytes, read in chunks."""
+    h = hasher()
+    with path.open("rb") as f:
+        while chunk := f.read(chunk_size):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@dataclass
+class PackState:
+    locale: str
+    pack_hash: str
+    # category id -> (manifest hash, category block hash)
+    categories: dict[str, tuple[str, str]] = field(default_factory=dict)
+
+
+class BuildCache:
+    def __init__(self, path: Path = CACHE_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS packs (locale TEXT PRIMARY KEY, pack_hash TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS categories (
+                locale TEXT NOT NULL,
+                category TEXT NOT NULL,
+                manifest_hash TEXT NOT NULL,
+                block_hash TEXT NOT NULL,
+                PRIMARY KEY (locale, category)
+            );
+            """
+        )
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != CACHE_VERSION:
+            self.clear()
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (CACHE_VERSION,))
+            self.conn.commit()
+
+    def __enter__(self) -> "BuildCache":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.conn.close()
+
+    def clear(self) -> None:
+        self.conn.execute("DELETE FROM packs")
+        self.conn.execute("DELETE FROM categories")
+
+    def load(self, locale: str) -> PackState | None:
+        row = self.conn.execute("SELECT pack_hash FROM packs WHERE locale = ?", (locale,)).fetchone()
+        if row is None:
+            return None
+        cats = self.conn.execute(
+            "SELECT category, manifest_hash, block_hash FROM categories WHERE locale = ?", (locale,)
+        )
+        return PackState(locale, row[0], {c: (m, b) for c, m, b in cats})
+
+    def store(self, states: list[PackState]) -> None:
+        with self.conn:
+            for state in states:
+                self.conn.execute("INSERT OR REPLACE INTO packs VALUES (?, ?)", (state.locale, state.pack_hash))
+                self.conn.execute("DELETE FROM categories WHERE locale = ?", (state.locale,))
+                self.conn.executemany(
+                    "INSERT INTO categories VALUES (?, ?, ?, ?)",
+                    [(state.locale, c, m, b) for c, (m, b) in state.categories.items()],
+                )
@@ -0,0 +1,233 @@
+"""Word catalog: per-locale text report, one CSV and a SQLite catalog.
+
+Generated from assets/words/*.json (replaces the hand-kept
+palabras_por_categoria.txt). The SQLite file is both the queryable catalog
+and the incremental state::
+
+    categories(locale, id, display_name, position, hash, total, easy, medium, hard, section)
+    words(locale, category, position, difficulty, text, key)
+
+``hash`` is the digest of the category's JSON; ``section`` is its rendered
+text block. A category whose hash is unchanged keeps its rows and section,
+so only changed categories are re-rendered and re-inserted; a locale's text
+file and the CSV are only rewritten when their content differs. ``key`` is
+``validation.normalize_key`` (casefolded, accents stripped), so
+``SELECT * FROM words WHERE key = 'colon'`` finds "Colón" in every locale.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import sqlite3
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from .cache import digest
+from .model import DIFFICULTIES, Category
+from .validation import normalize_key
+
+CATALOG_DB = "catalog.db"
+CATALOG_CSV = "catalog.csv"
+# Bump when the section layout or the schema changes.
+CATALOG_VERSION = "1"
+
+RULE = "=" * 80
+DIFFICULTY_LABELS = {"easy": "FACIL", "medium": "MEDIO", "hard": "DIFICIL"}
+LOCALE_NAMES = {
+    "es-AR": "ARGENTINA",
+    "es-ES": "ESPAÑA",
+    "es-MX": "MÉXICO",
+    "es-UY": "URUGUAY",
+    "en-US": "ESTADOS UNIDOS",
+    "en-GB": "REINO UNIDO",
+    "en-AU": "AUSTRALIA",
+    "en-CA": "CANADÁ",
+    "pt-BR": "BRASIL",
+    "pt-PT": "PORTUGAL",
+}
+
+
+def category_hash(cat: Category) -> str:
+    return digest(json.dumps(cat.to_json(), ensure_ascii=False))
+
+
+def render_section(cat: Category) -> str:
+    lines = [RULE, f"{cat.display_name} ({cat.id})", RULE, f"Total: {len(cat.words)} palabras"]
+    for d in DIFFICULTIES:
+        words = [w.text for w in cat.words if w.difficulty == d]
+        lines.append("")
+        lines.append(f"  {DIFFICULTY_LABELS[d]} ({len(words)}):")
+        lines.extend(f"    - {text}" for text in words)
+    return "\n".join(lines) + "\n"
+
+
+def render_report(locale: str, sections: list[str], total_words: int) -> str:
+    name = LOCALE_NAMES.get(locale, locale)
+    head = [
+        RULE,
+        f"PALABRAS POR CATEGORIA - {name} ({locale})",
+        "Generado por tools/wordpacks.py catalog; no editar a mano.",
+        RULE,
+        "",
+        "",
+    ]
+    tail = [RULE, "RESUMEN TOTAL", RULE, f"Total de categorias: {len(sections)}", f"Total de palabras: {total_words}"]
+    return "\n".join(head) + "\n".join(sections) + "\n" + "\n".join(tail) + "\n"
+
+
+@dataclass
+class CatalogResult:
+    sections: int = 0
+    regenerated: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    files: list[str] = field(default_factory=list)
+
+
+class Catalog:
+    def __init__(self, out_dir: Path) -> None:
+        self.out_dir = out_dir
+        out_dir.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(out_dir / CATALOG_DB)
+        row = None
+        try:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        except sqlite3.OperationalError:
+            pass
+        if row is None or row[0] != CATALOG_VERSION:
+            self.conn.executescript(
+                """
+                DROP TABLE IF EXISTS meta;
+                DROP TABLE IF EXISTS categories;
+                DROP TABLE IF EXISTS words;
+                CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+                CREATE TABLE categories (
+                    locale TEXT NOT NULL,
+                    id TEXT NOT NULL,
+                    display_name TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    hash TEXT NOT NULL,
+                    total INTEGER NOT NULL,
+                    easy INTEGER NOT NULL,
+                    medium INTEGER NOT NULL,
+                    hard INTEGER NOT NULL,
+                    section TEXT NOT NULL,
+                    PRIMARY KEY (locale, id)
+                );
+                CREATE TABLE words (
+                    locale TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    difficulty TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    PRIMARY KEY (locale, category, position)
+                );
+                CREATE INDEX words_key ON words (key);
+                """
+            )
+            self.conn.execute("INSERT INTO meta VALUES ('version', ?)", (CATALOG_VERSION,))
+            self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "Catalog":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def update_locale(self, locale: str, categories: Iterable[Category], result: CatalogResult) -> None:
+        known = dict(self.conn.execute("SELECT id, hash FROM categories WHERE locale = ?", (locale,)))
+        seen = set()
+        for position, cat in enumerate(categories):
+            seen.add(cat.id)
+            result.sections += 1
+            h = category_hash(cat)
+            if known.get(cat.id) == h:
+                self.conn.execute(
+                    "UPDATE categories SET position = ? WHERE locale = ? AND id = ?", (position, locale, cat.id)
+                )
+                continue
+            counts = Counter(w.difficulty for w in cat.words)
+            self.conn.execute("DELETE FROM words WHERE locale = ? AND category = ?", (locale, cat.id))
+            self.conn.executemany(
+                "INSERT INTO words VALUES (?, ?, ?, ?, ?, ?)",
+                [(locale, cat.id, i, w.difficulty, w.text, normalize_key(w.text)) for i, w in enumerate(cat.words)],
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO categories VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    locale,
+                    cat.id,
+                    cat.display_name,
+                    position,
+                    h,
+                    len(cat.words),
+                    *(counts.get(d, 0) for d in DIFFICULTIES),
+                    render_section(cat),
+                ),
+            )
+            result.regenerated.append(f"{locale}/{cat.id}")
+        for cat_id in set(known) - seen:
+            self.conn.execute("DELETE FROM words WHERE locale = ? AND category = ?", (locale, cat_id))
+            self.conn.execute("DELETE FROM categories WHERE locale = ? AND id = ?", (locale, cat_id))
+            result.removed.append(f"{locale}/{cat_id}")
+        self.conn.commit()
+
+        rows = self.conn.execute(
+            "SELECT section, total FROM categories WHERE locale = ? ORDER BY position", (locale,)
+        ).fetchall()
+        text = render_report(locale, [r[0] for r in rows], sum(r[1] for r in rows))
+        if self._write(f"{locale}.txt", text):
+            result.files.append(f"{locale}.txt")
+
+    def drop_other_locales(self, locales: Iterable[str], result: CatalogResult) -> None:
+        keep = set(locales)
+        for (locale,) in self.conn.execute("SELECT DISTINCT locale FROM categories").fetchall():
+            if locale not in keep:
+                self.conn.execute("DELETE FROM words WHERE locale = ?", (locale,))
+                self.conn.execute("DELETE FROM categories WHERE locale = ?", (locale,))
+                (self.out_dir / f"{locale}.txt").unlink(missing_ok=True)
+                result.removed.append(locale)
+        self.conn.commit()
+
+    def write_csv(self, result: CatalogResult) -> None:
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerow(["locale", "category", "difficulty", "text", "key"])
+        writer.writerows(
+            self.conn.execute(
+                """
+                SELECT w.locale, w.category, w.difficulty, w.text, w.key
+                FROM words w JOIN categories c ON c.locale = w.locale AND c.id = w.category
+                ORDER BY w.locale, c.position, w.position
+                """
+            )
+        )
+        if self._write(CATALOG_CSV, buf.getvalue()):
+            result.files.append(CATALOG_CSV)
+
+    def find(self, query: str) -> list[tuple[str, str, str, str]]:
+        """Words whose normalized key contains ``query`` (normalized the same way), in every locale."""
+        pattern = "%" + normalize_key(query).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        return self.conn.execute(
+            """
+            SELECT w.locale, w.category, w.difficulty, w.text
+            FROM words w JOIN categories c ON c.locale = w.locale AND c.id = w.category
+            WHERE w.key LIKE ? ESCAPE '\\'
+            ORDER BY w.locale, c.position, w.position
+            """,
+            (pattern,),
+        ).fetchall()
+
+    def _write(self, name: str, text: str) -> bool:
+        path = self.out_dir / name
+        if path.exists() and path.read_text(encoding="utf-8") == text:
+            return False
+        path.write_text(text, encoding="utf-8", newline="\n")
+        return True
@@ -0,0 +1,426 @@
+"""Semantic diff between two versions of a pack, and the delta patch that turns one into the other.
+
+Both are built from hashed indexes (category id -> category, word text ->
+entry), so they take linear time in the size of the two packs.
+
+``diff_packs`` reports what an author changed: categories added, removed
+or renamed, and per category the words added or removed, the words that
+moved to another difficulty and the ``reveal_hint`` changes.
+
+``make_patch`` encodes the same change compactly, keys shortened and words
+written as ``[text, difficulty, hint?]`` like ``release.minify``::
+
+    {"f": 1, "l": "es-AR",
+     "from": {"v": 1, "h": "<sha256>"}, "to": {"v": 2, "h": "<sha256>"},
+     "c": [op, ...], "o": [id, ...]?}
+
+Each op changes one category:
+
+* ``{"i", "x": 1}`` removes it.
+* ``{"i", "n", "w": [row, ...]}`` adds it, or replaces it outright when it
+  has the same text twice.
+* ``{"i", "n"?, "r": [text, ...]?, "u": [row, ...]?, "p": [index, ...]?,
+  "a": [[position, row], ...]?}`` edits it. It renames it (``n``), drops the
+  words in ``r`` and replaces the words in ``u`` that have the same text. It
+  reorders what is left when ``p`` is given (old positions, in their new
+  order) and inserts the ``a`` rows at their final positions, ascending.
+
+Categories that are left keep their order, and new ones follow in patch
+order, unless ``o`` lists the final order. ``h`` is the SHA-256 of the pack
+as compact JSON (``content_hash``), which is what
+``jsonEncode(pack.toJson())`` gives in the app. A client applies a patch
+only to the pack whose hash is ``from.h`` and checks ``to.h`` afterwards.
+
+``publish`` keeps the released versions of a locale in one directory:
+``v<N>.json`` (compact full packs), ``<hash>.patch.json`` from every older
+version to the current one, and ``index.json`` listing them. ``update_for``
+picks what a client holding a given hash should download.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Mapping
+
+from .model import DIFFICULTIES
+from .packfile import ROOT, pack_path
+
+PATCH_FORMAT = 1
+
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def content_hash(pack_json: Mapping[str, Any]) -> str:
+    """SHA-256 of the pack as compact JSON: the same for every layout of the same content."""
+    return hashlib.sha256(_dumps(pack_json).encode("utf-8")).hexdigest()
+
+
+def _row(word: Mapping[str, Any]) -> list[Any]:
+    unknown = set(word) - {"text", "difficulty", "reveal_hint"}
+    if unknown:
+        raise ValueError(f"cannot encode keys {sorted(unknown)} of {word['text']!r}")
+    row: list[Any] = [word["text"], DIFFICULTIES.index(word["difficulty"])]
+    if "reveal_hint" in word:
+        row.append(word["reveal_hint"])
+    return row
+
+
+def _word(row: list[Any]) -> dict[str, Any]:
+    word = {"text": row[0], "difficulty": DIFFICULTIES[row[1]]}
+    if len(row) > 2:
+        word["reveal_hint"] = row[2]
+    return word
+
+
+def _by_text(words: list[Mapping[str, Any]]) -> dict[str, int] | None:
+    """``{text: position}``, or None if a text appears twice."""
+    index = {w["text"]: i for i, w in enumerate(words)}
+    return index if len(index) == len(words) else None
+
+
+def pack_at(rev: str, locale: str) -> dict[str, Any] | None:
+    """The pack of ``locale`` at git revision ``rev``, or None if it did not exist there."""
+    check = subprocess.run(["git", "rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}"], cwd=ROOT,
+                           capture_output=True, text=True)
+    if check.returncode != 0:
+        raise ValueError(f"unknown git revision {rev!r}")
+    rel = pack_path(locale).relative_to(ROOT).as_posix()
+    show = subprocess.run(["git", "show", f"{rev}:{rel}"], cwd=ROOT, capture_output=True)
+    return json.loads(show.stdout.decode("utf-8")) if show.returncode == 0 else None
+
+
+# --- semantic diff -----------------------------------------------------------------
+
+
+@dataclass
+class CategoryDiff:
+    id: str
+    renamed: tuple[str, str] | None = None
+    added: list[dict[str, Any]] = field(default_factory=list)
+    removed: list[dict[str, Any]] = field(default_factory=list)
+    moved: list[tuple[str, str, str]] = field(default_factory=list)  # text, old, new difficulty
+    hints: list[tuple[str, str | None, str | None]] = field(default_factory=list)  # text, old, new hint
+    reordered: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.renamed or self.added or self.removed or self.moved or self.hints or self.reordered)
+
+
+@dataclass
+class PackDiff:
+    locale: str
+    versions: tuple[int, int]
+    added: list[str] = field(default_factory=list)  # category ids
+    removed: list[str] = field(default_factory=list)
+    changed: list[CategoryDiff] = field(default_factory=list)
+    reordered: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed or self.reordered)
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "locale": self.locale,
+            "from": self.versions[0],
+            "to": self.versions[1],
+            "addedCategories": self.added,
+            "removedCategories": self.removed,
+            "categoryOrderChanged": self.reordered,
+            "categories": [
+                {
+                    "id": c.id,
+                    "renamed": list(c.renamed) if c.renamed else None,
+                    "added": c.added,
+                    "removed": c.removed,
+                    "difficulty": [{"text": t, "from": a, "to": b} for t, a, b in c.moved],
+                    "revealHint": [{"text": t, "from": a, "to": b} for t, a, b in c.hints],
+                    "reordered": c.reordered,
+                }
+                for c in self.changed
+            ],
+        }
+
+
+def diff_category(old: Mapping[str, Any], new: Mapping[str, Any]) -> CategoryDiff:
+    diff = CategoryDiff(new["id"])
+    if old["displayName"] != new["displayName"]:
+        diff.renamed = (old["displayName"], new["displayName"])
+    # Keyed by text; a text listed twice is diffed by its last entry.
+    old_words = {w["text"]: w for w in old["words"]}
+    new_words = {w["text"]: w for w in new["words"]}
+    diff.removed = [w for t, w in old_words.items() if t not in new_words]
+    for text, word in new_words.items():
+        before = old_words.get(text)
+        if before is None:
+            diff.added.append(word)
+            continue
+        if before["difficulty"] != word["difficulty"]:
+            diff.moved.append((text, before["difficulty"], word["difficulty"]))
+        if before.get("reveal_hint") != word.get("reveal_hint"):
+            diff.hints.append((text, before.get("reveal_hint"), word.get("reveal_hint")))
+    kept_old = [w["text"] for w in old["words"] if w["text"] in new_words]
+    kept_new = [w["text"] for w in new["words"] if w["text"] in old_words]
+    diff.reordered = kept_old != kept_new
+    return diff
+
+
+def diff_packs(old: Mapping[str, Any], new: Mapping[str, Any]) -> PackDiff:
+    result = PackDiff(new["locale"], (old["version"], new["version"]))
+    old_cats = {c["id"]: c for c in old["categories"]}
+    new_cats = {c["id"]: c for c in new["categories"]}
+    result.removed = [c for c in old_cats if c not in new_cats]
+    result.added = [c for c in new_cats if c not in old_cats]
+    for cat_id, cat in new_cats.items():
+        if cat_id in old_cats and old_cats[cat_id] != cat:
+            diff = diff_category(old_cats[cat_id], cat)
+            if diff:
+                result.changed.append(diff)
+    result.reordered = [c for c in old_cats if c in new_cats] != [c for c in new_cats if c in old_cats]
+    return result
+
+
+def format_diff(diff: PackDiff) -> list[str]:
+    """The diff as text, one change per line."""
+    lines = [f"{diff.locale}: version {diff.versions[0]} -> {diff.versions[1]}"]
+    lines += [f"  + category {c}" for c in diff.added]
+    lines += [f"  - category {c}" for c in diff.removed]
+    if diff.reordered:
+        lines.append("  ~ category order changed")
+    for c in diff.changed:
+        if c.renamed:
+            lines.append(f"  {c.id}: renamed {c.renamed[0]!r} -> {c.renamed[1]!r}")
+        lines += [f"  {c.id}: + {w['text']} ({w['difficulty']})" for w in c.added]
+        lines += [f"  {c.id}: - {w['text']} ({w['difficulty']})" for w in c.removed]
+        lines += [f"  {c.id}: {t}: {a} -> {b}" for t, a, b in c.moved]
+        lines += [f"  {c.id}: {t}: hint {a!r} -> {b!r}" for t, a, b in c.hints]
+        if c.reordered:
+            lines.append(f"  {c.id}: words reordered")
+    if not diff:
+        lines.append("  no changes")
+    return lines
+
+
+# --- delta patches ------------------------------------------------------------------
+
+
+def _category_op(old: Mapping[str, Any], new: Mapping[str, Any]) -> dict[str, Any]:
+    old_index = _by_text(old["words"])
+    new_index = _by_text(new["words"])
+    if old_index is None or new_index is None:
+        return {"i": new["id"], "n": new["displayName"], "w": [_row(w) for w in new["words"]]}
+    op: dict[str, Any] = {"i": new["id"]}
+    if old["displayName"] != new["displayName"]:
+        op["n"] = new["displayName"]
+    removed = [w["text"] for w in old["words"] if w["text"] not in new_index]
+    updated = [
+        _row(w) for w in new["words"]
+        if w["text"] in old_index and old["words"][old_index[w["text"]]] != w
+    ]
+    kept = [w["text"] for w in old["words"] if w["text"] in new_index]
+    kept_position = {text: i for i, text in enumerate(kept)}
+    order = [kept_position[w["text"]] for w in new["words"] if w["text"] in kept_position]
+    added = [[i, _row(w)] for i, w in enumerate(new["words"]) if w["text"] not in old_index]
+    if removed:
+        op["r"] = removed
+    if updated:
+        op["u"] = updated
+    if order != list(range(len(order))):
+        op["p"] = order
+    if added:
+        op["a"] = added
+    full = {"i": new["id"], "n": new["displayName"], "w": [_row(w) for w in new["words"]]}
+    return op if len(_dumps(op)) < len(_dumps(full)) else full
+
+
+def make_patch(old: Mapping[str, Any], new: Mapping[str, Any]) -> dict[str, Any]:
+    """The patch from ``old`` to ``new`` (pack JSON of the same locale)."""
+    if old["locale"] != new["locale"]:
+        raise ValueError(f"cannot patch {old['locale']} into {new['locale']}")
+    if new["version"] <= old["version"]:
+        raise ValueError(
+            f"{new['locale']}: version {new['version']} does not follow {old['version']}; bump \"version\" in the pack"
+        )
+    old_cats = {c["id"]: c for c in old["categories"]}
+    new_cats = {c["id"]: c for c in new["categories"]}
+    ops: list[dict[str, Any]] = [{"i": c, "x": 1} for c in old_cats if c not in new_cats]
+    for cat_id, cat in new_cats.items():
+        before = old_cats.get(cat_id)
+        if before is None:
+            ops.append({"i": cat_id, "n": cat["displayName"], "w": [_row(w) for w in cat["words"]]})
+        elif before != cat:
+            ops.append(_category_op(before, cat))
+    patch: dict[str, Any] = {
+        "f": PATCH_FORMAT,
+        "l": new["locale"],
+        "from": {"v": old["version"], "h": content_hash(old)},
+        "to": {"v": new["version"], "h": content_hash(new)},
+        "c": ops,
+    }
+    default = [c for c in old_cats if c in new_cats] + [c for c in new_cats if c not in old_cats]
+    if default != list(new_cats):
+        patch["o"] = list(new_cats)
+    return patch
+
+
+def _apply_op(cat: Mapping[str, Any], op: Mapping[str, Any]) -> dict[str, Any]:
+    if "w" in op:
+        return {"id": op["i"], "displayName": op["n"], "words": [_word(r) for r in op["w"]]}
+    removed = set(op.get("r", ()))
+    updated = {r[0]: _word(r) for r in op.get("u", ())}
+    kept = [updated.get(w["text"], w) for w in cat["words"] if w["text"] not in removed]
+    if "p" in op:
+        kept = [kept[i] for i in op["p"]]
+    words: list[dict[str, Any]] = []
+    rest = iter(kept)
+    for position, row in op.get("a", ()):
+        while len(words) < position:
+            words.append(next(rest))
+        words.append(_word(row))
+    words.extend(rest)
+    return {"id": cat["id"], "displayName": op.get("n", cat["displayName"]), "words": words}
+
+
+def apply_patch(old: Mapping[str, Any], patch: Mapping[str, Any]) -> dict[str, Any]:
+    """The pack ``patch`` turns ``old`` into; raises ValueError if it does not apply."""
+    if patch.get("f") != PATCH_FORMAT:
+        raise ValueError(f"unknown patch format {patch.get('f')!r}")
+    if old["locale"] != patch["l"] or content_hash(old) != patch["from"]["h"]:
+        raise ValueError(f"patch is for {patch['l']} {patch['from']['h'][:12]}, not this pack")
+    categories = {c["id"]: c for c in old["categories"]}
+    for op in patch["c"]:
+        if op.get("x"):
+            categories.pop(op["i"])
+        elif op["i"] in categories:
+            categories[op["i"]] = _apply_op(categories[op["i"]], op)
+        else:
+            categories[op["i"]] = _apply_op({"id": op["i"], "displayName": "", "words": []}, op)
+    order = patch.get("o", list(categories))
+    new = {"locale": old["locale"], "version": patch["to"]["v"], "categories": [categories[c] for c in order]}
+    if content_hash(new) != patch["to"]["h"]:
+        raise ValueError(f"{patch['l']}: patched pack does not match {patch['to']['h'][:12]}")
+    return new
+
+
+# --- published versions ---------------------------------------------------------------
+
+INDEX_NAME = "index.json"
+LOCALE = re.compile(r"[a-z]{2}-[A-Z]{2}")
+# Files ``publish`` writes; anything else in the directory is not served.
+FILE_NAME = re.compile(r"index\.json|v\d+\.json|[0-9a-f]{16}\.patch\.json")
+
+
+def pack_name(version: int) -> str:
+    return f"v{version}.json"
+
+
+def patch_name(from_hash: str) -> str:
+    return f"{from_hash[:16]}.patch.json"
+
+
+def published_versions(out_dir: Path) -> dict[str, dict[str, Any]]:
+    """Full packs already published in ``out_dir``, keyed by content hash."""
+    packs = {}
+    for path in sorted(out_dir.glob("v*.json")):
+        pack_json = json.loads(path.read_text(encoding="utf-8"))
+        packs[content_hash(pack_json)] = pack_json
+    return packs
+
+
+def publish(out_dir: Path, new: Mapping[str, Any], older: Mapping[str, Mapping[str, Any]]) -> tuple[dict[str, Any], list[str]]:
+    """Publish ``new`` with a patch from every older version into ``out_dir``.
+
+    ``older`` adds versions from elsewhere (e.g. git revisions) to the ones
+    already published there; every one of them stays published, so the next
+    version gets a patch from each. Returns the index and the names of the
+    files written.
+    """
+    new_hash = content_hash(new)
+    history = {**published_versions(out_dir), **older}
+    history.pop(new_hash, None)
+    for h, old in history.items():
+        if old["version"] >= new["version"]:
+            raise ValueError(
+                f"{new['locale']}: version {old['version']} ({h[:12]}) has other content than version"
+                f" {new['version']}; bump \"version\" in the pack"
+            )
+    files = {pack_name(new["version"]): _dumps(new)}
+    patches = []
+    for h, old in sorted(history.items(), key=lambda item: item[1]["version"]):
+        patch = make_patch(old, new)
+        if apply_patch(old, patch) != new:
+            raise ValueError(f"{new['locale']}: patch from version {old['version']} does not round-trip")
+        files[pack_name(old["version"])] = _dumps(old)
+        name = patch_name(h)
+        files[name] = _dumps(patch)
+        patches.append({"from": {"v": old["version"], "h": h}, "file": name, "bytes": len(files[name].encode("utf-8"))})
+    index = {
+        "locale": new["locale"],
+        "version": new["version"],
+        "hash": new_hash,
+        "pack": pack_name(new["version"]),
+        "bytes": len(files[pack_name(new["version"])].encode("utf-8")),
+        "patches": patches,
+    }
+    files[INDEX_NAME] = json.dumps(index, ensure_ascii=False, indent=2) + "\n"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    for name, text in files.items():
+        path = out_dir / name
+        if path.exists() and path.read_text(encoding="utf-8") == text:
+            continue
+        path.write_text(text, encoding="utf-8", newline="\n")
+        written.append(name)
+    for path in out_dir.glob("*.patch.json"):
+        if path.name not in files:
+            path.unlink()
+            written.append(f"-{path.name}")
+    return index, written
+
+
+def verify_published(out_dir: Path, new: Mapping[str, Any]) -> list[str]:
+    """Check that ``out_dir`` publishes ``new`` and that every patch in its index leads to it."""
+    index_path = out_dir / INDEX_NAME
+    if not index_path.exists():
+        return [f"missing {index_path}"]
+    index = json.loads(index_path.read_text(encoding="utf-8"))
+    problems = []
+    if index["hash"] != content_hash(new):
+        problems.append(f"published version {index['version']} is not the current pack")
+    history = published_versions(out_dir)
+    for entry in index["patches"]:
+        old = history.get(entry["from"]["h"])
+        path = out_dir / entry["file"]
+        if old is None or not path.exists():
+            problems.append(f"patch {entry['file']} or its version {entry['from']['v']} is missing")
+            continue
+        try:
+            if apply_patch(old, json.loads(path.read_text(encoding="utf-8"))) != new:
+                problems.append(f"patch {entry['file']} does not lead to the current pack")
+        except (KeyError, IndexError, ValueError, StopIteration) as e:
+            problems.append(f"patch {entry['file']}: {e}")
+    return problems
+
+
+def read_index(out_dir: Path) -> dict[str, Any] | None:
+    path = out_dir / INDEX_NAME
+    return json.loads(path.read_text(encoding="utf-8")) if path.is_file() else None
+
+
+def update_for(out_dir: Path, from_hash: str | None) -> tuple[str, Path | None]:
+    """What a client holding ``from_hash`` should fetch: ``("current", None)``, a patch or the full pack."""
+    index = read_index(out_dir)
+    if index is None:
+        raise ValueError(f"nothing published in {out_dir}")
+    if from_hash == index["hash"]:
+        return "current", None
+    for entry in index["patches"]:
+        if entry["from"]["h"] == from_hash:
+            return "patch", out_dir / entry["file"]
+    return "pack", out_dir / index["pack"]
@@ -0,0 +1,167 @@
+"""Precomputed draw index: the word pools of game_screen.dart ``_createSession``.
+
+For a specific category the game draws uniformly from the category's words of
+the selected difficulty, or from all its words when it has none of that
+difficulty; an unknown category id falls back to the first category. The
+Random category (``random``) draws from those pools concatenated over every
+other category, then from all of their words, then from the first non-random
+category. The index resolves all of that at build time::
+
+    {"locale", "version", "sourceHash",
+     "words": ["Obelisco", ...],                   every word, in pack order
+     "wordCategory": [0, 0, ...],                  category index of each word
+     "categories": [{"id", "displayName", "start", "count",
+                     "pools": {"easy": [offset, length], ...}}],
+     "random": {"easy": [offset, length], ...},
+     "order": [17, 18, 40, ...]}                   word indices of all pools
+
+A pool ``[offset, length]`` is ``order[offset:offset + length]``, so a draw is
+``words[order[offset + rand.nextInt(length)]]`` with no filtering and no
+allocation. A category's words are ``words[start:start + count]``.
+
+``verify_draws`` checks every (category, difficulty) pool, the Random pools
+and the unknown-category fallback against ``reference_pool``, a direct port
+of the Dart selection, as multisets: equal multisets under a uniform draw are
+equal distributions.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any
+
+from .cache import digest
+from .model import DIFFICULTIES
+
+RANDOM_CATEGORY = "random"
+# Any id that is not in the pack, to exercise the ``orElse: categories.first`` branch.
+UNKNOWN_CATEGORY = "\0unknown"
+
+
+def dart_difficulty(raw: Any) -> str:
+    """``WordEntry.fromJson``: lowercased, anything unknown is medium."""
+    name = raw.lower() if isinstance(raw, str) else "medium"
+    return name if name in DIFFICULTIES else "medium"
+
+
+def category_pool(pack_json: dict[str, Any], ci: int, difficulty: str) -> list[tuple[int, int]]:
+    """Words of category ``ci`` with ``difficulty``, or all of them when there are none."""
+    words = pack_json["categories"][ci]["words"]
+    filtered = [(ci, wi) for wi, w in enumerate(words) if dart_difficulty(w.get("difficulty")) == difficulty]
+    return filtered if filtered else [(ci, wi) for wi in range(len(words))]
+
+
+def reference_pool(pack_json: dict[str, Any], category_id: str, difficulty: str) -> list[tuple[int, int]]:
+    """Pool of ``(category index, word index within category)`` drawn by ``_createSession``."""
+    categories = pack_json["categories"]
+    if not categories:
+        return []
+    if category_id == RANDOM_CATEGORY:
+        real = [ci for ci, c in enumerate(categories) if c["id"] != RANDOM_CATEGORY]
+        pool = [entry for ci in real for entry in category_pool(pack_json, ci, difficulty)]
+        if not pool:
+            pool = [(ci, wi) for ci in real for wi in range(len(categories[ci]["words"]))]
+        if not pool:
+            fallback = real[0] if real else 0
+            pool = [(fallback, wi) for wi in range(len(categories[fallback]["words"]))]
+        return pool
+    ci = next((i for i, c in enumerate(categories) if c["id"] == category_id), 0)
+    return category_pool(pack_json, ci, difficulty)
+
+
+def build_draws(pack_json: dict[str, Any], source: str) -> dict[str, Any]:
+    categories = pack_json["categories"]
+    words: list[str] = []
+    word_category: list[int] = []
+    starts: list[int] = []
+    for ci, cat in enumerate(categories):
+        starts.append(len(words))
+        words.extend(w["text"] for w in cat["words"])
+        word_category.extend([ci] * len(cat["words"]))
+
+    order: list[int] = []
+
+    def append(indices: list[int]) -> list[int]:
+        offset = len(order)
+        order.extend(indices)
+        return [offset, len(indices)]
+
+    def flat(pool: list[tuple[int, int]]) -> list[int]:
+        return [starts[ci] + wi for ci, wi in pool]
+
+    real = [ci for ci, c in enumerate(categories) if c["id"] != RANDOM_CATEGORY]
+    pools: dict[int, dict[str, list[int]]] = {ci: {} for ci in range(len(categories))}
+    random: dict[str, list[int]] = {}
+    for d in DIFFICULTIES:
+        # Non-random categories back to back, so the Random pool is one slice over them.
+        run_start = len(order)
+        for ci in real:
+            pools[ci][d] = append(flat(category_pool(pack_json, ci, d)))
+        if len(order) > run_start:
+            random[d] = [run_start, len(order) - run_start]
+        else:
+            random[d] = append(flat(reference_pool(pack_json, RANDOM_CATEGORY, d)))
+        # Only reachable as the unknown-id fallback (``categories.first``).
+        for ci in range(len(categories)):
+            if ci not in real:
+                pools[ci][d] = append(flat(category_pool(pack_json, ci, d)))
+
+    return {
+        "locale": pack_json["locale"],
+        "version": pack_json["version"],
+        "sourceHash": digest(source),
+        "words": words,
+        "wordCategory": word_category,
+        "categories": [
+            {
+                "id": cat["id"],
+                "displayName": cat["displayName"],
+                "start": starts[ci],
+                "count": len(cat["words"]),
+                "pools": pools[ci],
+            }
+            for ci, cat in enumerate(categories)
+        ],
+        "random": random,
+        "order": order,
+    }
+
+
+def index_pool(index: dict[str, Any], category_id: str, difficulty: str) -> list[tuple[int, int]]:
+    """Pool the index yields, in the same ``(category, word within category)`` terms."""
+    if category_id == RANDOM_CATEGORY:
+        offset, length = index["random"][difficulty]
+    else:
+        cats = index["categories"]
+        cat = next((c for c in cats if c["id"] == category_id), cats[0] if cats else None)
+        if cat is None:
+            return []
+        offset, length = cat["pools"][difficulty]
+    pool = []
+    for wi in index["order"][offset : offset + length]:
+        ci = index["wordCategory"][wi]
+        pool.append((ci, wi - index["categories"][ci]["start"]))
+    return pool
+
+
+def verify_draws(index: dict[str, Any], pack_json: dict[str, Any], source: str) -> list[str]:
+    """Compare every pool of ``index`` with the game's selection; returns a list of problems."""
+    problems = []
+    if index.get("sourceHash") != digest(source):
+        problems.append("index was built from a different pack")
+    texts = [w["text"] for c in pack_json["categories"] for w in c["words"]]
+    if index["words"] != texts:
+        problems.append("word list differs from the pack")
+        return problems
+    ids = [c["id"] for c in pack_json["categories"]]
+    for category_id in dict.fromkeys([*ids, RANDOM_CATEGORY, UNKNOWN_CATEGORY]):
+        for d in DIFFICULTIES:
+            expected = Counter(reference_pool(pack_json, category_id, d))
+            actual = Counter(index_pool(index, category_id, d))
+            if expected != actual:
+                label = "unknown category" if category_id == UNKNOWN_CATEGORY else category_id
+                problems.append(
+                    f"{label}/{d}: index draws {sum(actual.values())} words, game draws {sum(expected.values())}"
+                    f" ({len(actual - expected)} extra, {len(expected - actual)} missing)"
+                )
+    return problems
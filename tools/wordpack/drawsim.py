@@ -0,0 +1,206 @@
+"""Vectorized simulator for the word-draw samplers (requires NumPy).
+
+A session is one evening: ``rounds`` draws from the same pool of ``n`` words.
+Sessions are simulated in batches, one row per session, for two samplers:
+
+``independent``
+    ``rand.nextInt(n)`` every round, as game_screen.dart draws today.
+``bag``
+    ``shufflebag`` in steady state: the session starts at a uniformly random
+    cursor of a random bag (state carried over from earlier evenings) and
+    later bags apply the no-back-to-back rule at the boundary.
+
+The outcome depends only on ``n``, so every distinct pool size is simulated
+once and shared by all pools of that size. ``check_reference`` runs the pure
+Python ``shufflebag.draw`` for a smaller number of sessions and checks the
+vectorized model reproduces its repeat rate; ``uniformity`` is a chi-square
+test of the word frequencies, over all draws and over the first draw of a
+session.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass
+
+import numpy as np
+
+from . import shufflebag
+
+SAMPLERS = ("independent", "bag")
+# Elements per generated batch; bounds memory at about 80 MB of int32.
+_BATCH_ELEMENTS = 20_000_000
+
+
+@dataclass
+class SamplerStats:
+    sessions: int
+    repeat_rate: float  # share of draws repeating a word already drawn that session
+    repeat_sessions: float  # share of sessions with at least one repeat
+    per_session: np.ndarray  # repeats per session, for standard errors
+    counts: np.ndarray  # draws per word
+    first_counts: np.ndarray  # first draw of a session, per word
+
+
+def _independent(rng: np.random.Generator, n: int, sessions: int, rounds: int) -> np.ndarray:
+    return rng.integers(0, n, size=(sessions, rounds), dtype=np.int32)
+
+
+def _prefixes(rng: np.random.Generator, n: int, sessions: int, length: int) -> np.ndarray:
+    """First ``length`` positions of a uniform permutation per row (partial Fisher-Yates).
+
+    Columns ``length:`` hold the remaining words, in no particular order.
+    """
+    perm = np.tile(np.arange(n, dtype=np.int32), (sessions, 1))
+    rows = np.arange(sessions)
+    for i in range(length):
+        j = i + rng.integers(0, n - i, size=sessions)
+        head = perm[rows, i].copy()
+        perm[rows, i] = perm[rows, j]
+        perm[rows, j] = head
+    return perm
+
+
+def _bag(rng: np.random.Generator, n: int, sessions: int, rounds: int) -> np.ndarray:
+    if n == 1:
+        return np.zeros((sessions, rounds), dtype=np.int32)
+    if n <= rounds:
+        return _bag_full(rng, n, sessions, rounds)
+    # Pools larger than a session: at most two bags, and only their first
+    # ``rounds`` positions matter, so skip shuffling the rest.
+    start = rng.integers(0, n, size=sessions)
+    first_len = np.minimum(rounds, n - start)
+    # The tail of bag 0 from ``start`` is itself a uniform ordered sample.
+    tail = _prefixes(rng, n, sessions, rounds)[:, :rounds]
+    nxt = _prefixes(rng, n, sessions, rounds)
+    crossing = np.nonzero(first_len < rounds)[0]
+    last = tail[crossing, first_len[crossing] - 1]
+    clash = crossing[nxt[crossing, 0] == last]
+    if clash.size:
+        # Same rule as _bag_full: swap with a uniform later position; positions
+        # past the shuffled prefix hold a uniformly random remaining word.
+        k = rng.integers(1, n, size=clash.size)
+        inside = k < rounds
+        rows, cols = clash[inside], k[inside]
+        first = nxt[rows, 0].copy()
+        nxt[rows, 0] = nxt[rows, cols]
+        nxt[rows, cols] = first
+        rows = clash[~inside]
+        nxt[rows, 0] = nxt[rows, rounds + rng.integers(0, n - rounds, size=rows.size)]
+    both = np.concatenate([tail, nxt[:, :rounds]], axis=1)
+    t = np.arange(rounds)
+    cols = np.where(t < first_len[:, None], t, rounds + t - first_len[:, None])
+    return np.take_along_axis(both, cols, axis=1)
+
+
+def _bag_full(rng: np.random.Generator, n: int, sessions: int, rounds: int) -> np.ndarray:
+    bags = (n - 1 + rounds) // n + 1
+    perms = rng.permuted(np.broadcast_to(np.arange(n, dtype=np.int32), (sessions, bags, n)), axis=2)
+    for b in range(1, bags):
+        # Uniform over permutations whose first word is not the previous bag's last:
+        # swap a clash with a uniformly chosen later position.
+        clash = np.nonzero(perms[:, b, 0] == perms[:, b - 1, n - 1])[0]
+        if clash.size:
+            k = rng.integers(1, n, size=clash.size)
+            first = perms[clash, b, 0].copy()
+            perms[clash, b, 0] = perms[clash, b, k]
+            perms[clash, b, k] = first
+    flat = perms.reshape(sessions, bags * n)
+    start = rng.integers(0, n, size=(sessions, 1))
+    return np.take_along_axis(flat, start + np.arange(rounds), axis=1)
+
+
+_GENERATORS = {"independent": _independent, "bag": _bag}
+
+
+def simulate(sampler: str, n: int, sessions: int, rounds: int, seed: int = 0) -> SamplerStats:
+    rng = np.random.default_rng(seed)
+    generate = _GENERATORS[sampler]
+    if sampler == "independent":
+        width = rounds
+    else:
+        width = ((n - 1 + rounds) // n + 1) * n if n <= rounds else 2 * n
+    batch = max(1, _BATCH_ELEMENTS // width)
+    per_session = np.empty(sessions, dtype=np.int32)
+    counts = np.zeros(n, dtype=np.int64)
+    first_counts = np.zeros(n, dtype=np.int64)
+    for lo in range(0, sessions, batch):
+        hi = min(sessions, lo + batch)
+        draws = generate(rng, n, hi - lo, rounds)
+        ordered = np.sort(draws, axis=1)
+        per_session[lo:hi] = (ordered[:, 1:] == ordered[:, :-1]).sum(axis=1)
+        counts += np.bincount(draws.ravel(), minlength=n)
+        first_counts += np.bincount(draws[:, 0], minlength=n)
+    return SamplerStats(
+        sessions=sessions,
+        repeat_rate=float(per_session.sum()) / (sessions * rounds),
+        repeat_sessions=float(np.count_nonzero(per_session)) / sessions,
+        per_session=per_session,
+        counts=counts,
+        first_counts=first_counts,
+    )
+
+
+def reference_repeats(n: int, sessions: int, rounds: int, seed: int = 0) -> np.ndarray:
+    """Repeats per session from the pure Python bag.
+
+    One continuous chain; sessions are separated by a random number of
+    unobserved draws (other evenings) so each starts at a uniform cursor.
+    """
+    rng = random.Random(seed)
+    state = None
+    out = np.empty(sessions, dtype=np.int32)
+    for s in range(sessions):
+        for _ in range(rng.randrange(n)):
+            _, state = shufflebag.draw(state, n, lambda: rng.getrandbits(32))
+        seen = set()
+        repeats = 0
+        for _ in range(rounds):
+            index, state = shufflebag.draw(state, n, lambda: rng.getrandbits(32))
+            repeats += index in seen
+            seen.add(index)
+        out[s] = repeats
+    return out
+
+
+def check_reference(n: int, stats: SamplerStats, rounds: int, sessions: int = 2000, seed: int = 0) -> str | None:
+    """``None`` if the vectorized bag agrees with ``shufflebag`` (within 5 standard errors)."""
+    ref = reference_repeats(n, sessions, rounds, seed)
+    sim = stats.per_session
+    diff = abs(ref.mean() - sim.mean())
+    se = math.sqrt(ref.var() / ref.size + sim.var() / sim.size)
+    if diff > 5 * se + 1e-9:
+        return f"n={n}: reference {ref.mean() / rounds:.4%} vs simulated {sim.mean() / rounds:.4%} repeats per draw"
+    return None
+
+
+def chi_square_p(counts: np.ndarray) -> float:
+    """Upper-tail p-value of a chi-square test against uniform (Wilson-Hilferty approximation)."""
+    k = counts.size
+    if k < 2:
+        return 1.0
+    total = counts.sum()
+    expected = total / k
+    stat = float(((counts - expected) ** 2).sum() / expected)
+    df = k - 1
+    z = ((stat / df) ** (1 / 3) - (1 - 2 / (9 * df))) / math.sqrt(2 / (9 * df))
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def uniformity(stats: SamplerStats, alpha: float = 1e-3) -> list[str]:
+    problems = []
+    n = stats.counts.size
+    for label, counts in (("all draws", stats.counts), ("first draw", stats.first_counts)):
+        p = chi_square_p(counts)
+        if p < alpha:
+            problems.append(f"n={n}: {label} not uniform (chi-square p={p:.2e})")
+    return problems
+
+
+def state_bytes(pool_sizes: list[int]) -> dict[str, int]:
+    """Persisted bytes for a set of pools: bag state vs a seen-words bitset."""
+    return {
+        "bag": shufflebag.STATE_BYTES * len(pool_sizes),
+        "bitset": sum((n + 7) // 8 for n in pool_sizes),
+    }
@@ -0,0 +1,131 @@
+"""Per-locale, per-category word manifests (tools/manifests/<locale>/<category>.json).
+
+A manifest is the source of truth for one category of one pack::
+
+    {
+      "displayName": "Bandas de Música",
+      "expect": {"easy": 40, "medium": 40, "hard": 40},
+      "easy": ["Soda Stereo", ...],
+      "medium": [...],
+      "hard": [{"text": "Almendra", "reveal_hint": "..."}, ...]
+    }
+
+``displayName`` and ``expect`` are optional; a manifest with ``expect`` must
+also have unique texts across difficulties. Words are plain strings or objects
+with ``text`` plus extra keys that are copied verbatim into the pack entry.
+
+Categories whose words are not grouped by difficulty use an ordered list
+instead of the three difficulty keys::
+
+    {"displayName": "Objetos", "words": [{"text": "Mate", "difficulty": "easy"}, ...]}
+"""
+
+from __future__ import annotations
+
+import json
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .model import DIFFICULTIES, Category, CategoryUpdate, WordEntry
+
+MANIFESTS_DIR = Path(__file__).resolve().parents[1] / "manifests"
+
+
+@dataclass(frozen=True)
+class Manifest:
+    locale: str
+    category: str
+    path: Path
+
+    def read(self) -> dict[str, Any]:
+        return json.loads(self.path.read_text(encoding="utf-8"))
+
+
+def discover_manifests(
+    root: Path = MANIFESTS_DIR, locales: list[str] | None = None
+) -> dict[str, list[Manifest]]:
+    """Return manifests grouped by locale, sorted by category id."""
+    grouped: dict[str, list[Manifest]] = {}
+    for path in sorted(root.glob("*/*.json")):
+        locale = path.parent.name
+        if locales and locale not in locales:
+            continue
+        grouped.setdefault(locale, []).append(Manifest(locale, path.stem, path))
+    return grouped
+
+
+def _entry(item: str | dict[str, Any], difficulty: str) -> WordEntry:
+    if isinstance(item, str):
+        return WordEntry(item, difficulty)
+    extra = {k: v for k, v in item.items() if k != "text"}
+    return WordEntry(item["text"], difficulty, extra)
+
+
+def manifest_update(manifest: Manifest, data: dict[str, Any] | None = None) -> CategoryUpdate:
+    """Turn a manifest into a CategoryUpdate, enforcing ``expect`` counts and uniqueness if set."""
+    if data is None:
+        data = manifest.read()
+    name = f"{manifest.locale}/{manifest.category}"
+    unknown = set(data) - {"displayName", "expect", "words", *DIFFICULTIES}
+    if unknown:
+        raise ValueError(f"{name}: unknown manifest keys {sorted(unknown)}")
+
+    if "words" in data:
+        if any(diff in data for diff in DIFFICULTIES):
+            raise ValueError(f"{name}: use either 'words' or per-difficulty lists, not both")
+        words = [WordEntry.from_json(item) for item in data["words"]]
+    else:
+        words = [_entry(item, diff) for diff in DIFFICULTIES for item in data.get(diff, [])]
+
+    expect = data.get("expect")
+    if expect:
+        counts = Counter(w.difficulty for w in words)
+        for diff, expected in expect.items():
+            got = counts[diff]
+            if got != expected:
+                raise ValueError(f"{name}: {diff} must be {expected} items, got {got}")
+        dups = [t for t, n in Counter(w.text for w in words).items() if n > 1]
+        if dups:
+            raise ValueError(f"{name}: duplicates across difficulties: {dups[:20]}")
+
+    return CategoryUpdate(manifest.category, words, data.get("displayName"))
+
+
+def category_manifest(category: Category, expect: dict[str, int] | None = None) -> dict[str, Any]:
+    """Inverse of ``manifest_update``: the manifest dict describing ``category``."""
+    data: dict[str, Any] = {"displayName": category.display_name}
+    if expect:
+        data["expect"] = expect
+    order = [DIFFICULTIES.index(w.difficulty) if w.difficulty in DIFFICULTIES else -1 for w in category.words]
+    if order != sorted(order) or -1 in order:
+        data["words"] = [w.to_json() for w in category.words]
+        return data
+    for diff in DIFFICULTIES:
+        items = [
+            {"text": w.text, **w.extra} if w.extra else w.text
+            for w in category.words
+            if w.difficulty == diff
+        ]
+        if items:
+            data[diff] = items
+    return data
+
+
+def dump_manifest(data: dict[str, Any]) -> str:
+    """Serialize a manifest with one word per line."""
+    lines = ["{"]
+    keys = list(data)
+    for i, key in enumerate(keys):
+        comma = "," if i < len(keys) - 1 else ""
+        value = data[key]
+        if isinstance(value, list):
+            items = [f"    {json.dumps(v, ensure_ascii=False)}" for v in value]
+            lines.append(f"  {json.dumps(key)}: [")
+            lines.append(",\n".join(items))
+            lines.append(f"  ]{comma}")
+        else:
+            lines.append(f"  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)}{comma}")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
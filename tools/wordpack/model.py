@@ -0,0 +1,72 @@
+"""In-memory model of a word pack (assets/words/<locale>.json).
+
+Mirrors lib/domain/models/word_pack.dart: a pack holds categories, a category
+holds words, a word has a text, a difficulty and optional extra keys such as
+``reveal_hint``. ``to_json`` keeps the key order used by the Dart ``toJson``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping
+
+DIFFICULTIES = ("easy", "medium", "hard")
+
+
+@dataclass
+class WordEntry:
+    text: str
+    difficulty: str
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> "WordEntry":
+        extra = {k: v for k, v in data.items() if k not in ("text", "difficulty")}
+        return cls(text=data["text"], difficulty=data.get("difficulty", "medium"), extra=extra)
+
+    def to_json(self) -> dict[str, Any]:
+        return {"text": self.text, "difficulty": self.difficulty, **self.extra}
+
+
+@dataclass
+class Category:
+    id: str
+    display_name: str
+    words: list[WordEntry]
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> "Category":
+        return cls(
+            id=data["id"],
+            display_name=data["displayName"],
+            words=[WordEntry.from_json(w) for w in data["words"]],
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "displayName": self.display_name,
+            "words": [w.to_json() for w in self.words],
+        }
+
+
+@dataclass
+class CategoryUpdate:
+    """Replacement contents for one category. ``display_name=None`` keeps the current one."""
+
+    id: str
+    words: list[WordEntry]
+    display_name: str | None = None
+
+
+def words_from_lists(lists: Mapping[str, Iterable[str]]) -> list[WordEntry]:
+    """Build entries from ``{"easy": [...], "medium": [...], "hard": [...]}``, in difficulty order."""
+    words: list[WordEntry] = []
+    for diff in DIFFICULTIES:
+        words.extend(WordEntry(text, diff) for text in lists.get(diff, ()))
+    return words
+
+
+def words_from_pairs(pairs: Iterable[tuple[str, str]]) -> list[WordEntry]:
+    """Build entries from ``(text, difficulty)`` pairs, keeping their order."""
+    return [WordEntry(text, diff) for text, diff in pairs]
@@ -0,0 +1,141 @@
+"""Near-duplicate index over word entries.
+
+Every entry is reduced to the trigram set of its base key (see
+``validation.normalize_key`` / ``base_key``: casefolded, accents and a
+trailing "(...)" qualifier removed), so "Los Cafres (Argentina)" and
+"Los Cafres", or "Piriápolis" and "Piriapolis", end up with identical or
+very similar sets.
+
+Similar pairs are found with a prefix-filtered set-similarity join
+(AllPairs): trigrams are ordered rarest first and only the first
+``|x| - ceil(t * |x|) + 1`` of each set is indexed, which is enough to find
+every pair with Jaccard >= t. Records are probed in increasing size so the
+length filter ``|y| >= t * |x|`` prunes the rest. The result is exact, not
+sampled, and the number of verified pairs stays close to the number of real
+matches instead of growing quadratically with the word count.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from .model import Category
+from .validation import base_key, normalize_key
+
+SCOPES = ("category", "pack", "all")
+
+
+@dataclass(frozen=True)
+class IndexedWord:
+    locale: str
+    category: str
+    text: str
+    key: str
+
+    def to_json(self) -> dict[str, str]:
+        return {"locale": self.locale, "category": self.category, "text": self.text}
+
+
+def trigrams(key: str) -> frozenset[str]:
+    padded = f" {key} "
+    if len(padded) < 3:
+        return frozenset([padded])
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+
+class NearDuplicateIndex:
+    def __init__(self, words: Iterable[IndexedWord]) -> None:
+        self.words: list[IndexedWord] = []
+        seen: set[tuple[str, str, str]] = set()
+        for w in words:
+            # Exact repeats of a text in one category are the validator's job.
+            ident = (w.locale, w.category, w.key)
+            if ident not in seen:
+                seen.add(ident)
+                self.words.append(w)
+        self.sets = [trigrams(base_key(w.key)) for w in self.words]
+
+    @classmethod
+    def from_packs(cls, packs: dict[str, Iterable[Category]]) -> "NearDuplicateIndex":
+        return cls(
+            IndexedWord(locale, cat.id, w.text, normalize_key(w.text))
+            for locale, cats in packs.items()
+            for cat in cats
+            for w in cat.words
+        )
+
+    def _group(self, word: IndexedWord, scope: str) -> tuple[str, ...]:
+        if scope == "category":
+            return (word.locale, word.category)
+        if scope == "pack":
+            return (word.locale,)
+        return ()
+
+    def pairs(self, threshold: float = 0.7, scope: str = "category") -> list[tuple[int, int, float]]:
+        """All ``(i, j, similarity)`` with Jaccard >= threshold inside the same scope group."""
+        if scope not in SCOPES:
+            raise ValueError(f"scope must be one of {SCOPES}")
+        freq = Counter(g for s in self.sets for g in s)
+        ordered = [sorted(s, key=lambda g: (freq[g], g)) for s in self.sets]
+        groups = [self._group(w, scope) for w in self.words]
+
+        index: dict[tuple[tuple[str, ...], str], list[int]] = defaultdict(list)
+        found: list[tuple[int, int, float]] = []
+        for i in sorted(range(len(self.words)), key=lambda k: len(ordered[k])):
+            size = len(ordered[i])
+            prefix = size - math.ceil(threshold * size) + 1
+            candidates: set[int] = set()
+            for g in ordered[i][:prefix]:
+                bucket = index[(groups[i], g)]
+                candidates.update(j for j in bucket if len(ordered[j]) >= threshold * size)
+                bucket.append(i)
+            for j in candidates:
+                sim = jaccard(self.sets[i], self.sets[j])
+                if sim >= threshold:
+                    found.append((min(i, j), max(i, j), sim))
+        return found
+
+    def clusters(self, threshold: float = 0.7, scope: str = "category") -> list[dict[str, Any]]:
+        """Connected components of the similarity graph, largest first, with pair scores."""
+        pairs = self.pairs(threshold, scope)
+        parent = list(range(len(self.words)))
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for i, j, _ in pairs:
+            parent[find(i)] = find(j)
+
+        members: dict[int, list[int]] = {}
+        edges: dict[int, list[tuple[int, int, float]]] = defaultdict(list)
+        for i, j, sim in pairs:
+            edges[find(i)].append((i, j, sim))
+        for root in edges:
+            members[root] = sorted({k for i, j, _ in edges[root] for k in (i, j)})
+
+        out = []
+        for root, idxs in members.items():
+            scored = sorted(edges[root], key=lambda e: -e[2])
+            out.append(
+                {
+                    "words": [self.words[k].to_json() for k in idxs],
+                    "pairs": [
+                        {"a": self.words[i].text, "b": self.words[j].text, "similarity": round(sim, 3)}
+                        for i, j, sim in scored
+                    ],
+                    "maxSimilarity": round(scored[0][2], 3),
+                }
+            )
+        out.sort(key=lambda c: (-len(c["words"]), -c["maxSimilarity"]))
+        return out
@@ -0,0 +1,360 @@
+"""Base pack per language plus regional overlays, resolved back byte-for-byte.
+
+The regional packs of a language (en-US/en-GB/en-AU/en-CA, ...) repeat
+categories such as ``anime`` word for word. ``build_overlays`` puts each
+shared category into one base pack per language and reduces every locale to
+an overlay against it. Layout under ``<out>/<language>/``::
+
+    base.json          {"language", "version", "categories": [{"id", "displayName", "words"}]}
+    <locale>.json      {"locale", "base", "version", "layout", "sourceHash", "categories": [entry, ...]}
+
+The overlay lists the locale's categories in pack order. Base categories it
+leaves out are removed. Each entry is one of:
+
+* ``{"id"}``: the base category unchanged.
+* ``{"id", "edits": [{"at", "remove", "add"}], "displayName"?}``: the base
+  category with ``remove`` words dropped at base position ``at`` and ``add``
+  inserted there (edits in increasing ``at`` order), and optionally renamed.
+  Only used when it keeps at least ``MIN_KEPT`` of the base words.
+* ``{"id", "displayName", "words"}``: a category of the locale's own, added or
+  in place of the base one.
+
+A category goes into the base from the locale whose version makes base plus
+overlays smallest, preferring the language's default locale, or stays out
+when no locale shares it. ``layout`` records how the pack file is formatted
+(``packfile.STYLES``), so ``resolve_text`` reproduces assets/words/<locale>.json
+exactly and ``verify_overlays`` compares bytes, not just JSON.
+
+Shared content is edited once: change base.json (or an overlay) and
+``resolve_language`` gives the new text of every pack that it changes.
+"""
+
+from __future__ import annotations
+
+import difflib
+import json
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+from .cache import digest
+from .packfile import STYLES, PackFile, detect_style
+
+BASE_NAME = "base.json"
+# Same defaults as WordPackRepository._languageFallback.
+LANGUAGE_DEFAULTS = {"es": "es-AR", "en": "en-US", "pt": "pt-BR"}
+# An edited base category must keep at least this share of the base words;
+# below it the locale's own list is clearer to edit, even if a little larger.
+MIN_KEPT = 0.5
+_CATEGORY_INDENT = "    "
+_CATEGORY_SEPARATOR = ",\n" + _CATEGORY_INDENT
+
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _size(data: Any) -> int:
+    return len(_dumps(data).encode("utf-8"))
+
+
+def language_of(locale: str) -> str:
+    return locale.split("-")[0]
+
+
+def _header(locale: str, version: int) -> str:
+    head = json.dumps({"locale": locale, "version": version}, ensure_ascii=False, indent=2)[:-2]
+    return head + ',\n  "categories": [\n' + _CATEGORY_INDENT
+
+
+def _footer(final_newline: bool) -> str:
+    return "\n  ]\n}" + ("\n" if final_newline else "")
+
+
+def pack_layout(pack: PackFile, pack_json: Mapping[str, Any] | None = None) -> dict[str, Any]:
+    """The ``layout`` of a pack: its category style and whether the file ends in a newline.
+
+    Raises ValueError for a pack that ``render_pack`` cannot reproduce (mixed
+    or hand-formatted categories, another header), since its overlay would
+    not resolve to the same bytes.
+    """
+    categories = (pack_json if pack_json is not None else json.loads(pack.text))["categories"]
+    blocks = [pack.block_text(c) for c in pack.categories]
+    style = detect_style(categories[0], blocks[0], _CATEGORY_INDENT) if blocks else None
+    if style is None or any(STYLES[style](cat, _CATEGORY_INDENT) != block for cat, block in zip(categories, blocks)):
+        raise ValueError(f"{pack.path}: categories are not all in one packfile layout")
+    layout = {"style": style, "finalNewline": pack.text.endswith("\n")}
+    frame = _header(pack.locale, pack.version) + _CATEGORY_SEPARATOR.join(blocks) + _footer(layout["finalNewline"])
+    if frame != pack.text:
+        raise ValueError(f"{pack.path}: header or separators differ from the {style} layout")
+    return layout
+
+
+def render_pack(pack_json: Mapping[str, Any], layout: Mapping[str, Any]) -> str:
+    render = STYLES[layout["style"]]
+    body = _CATEGORY_SEPARATOR.join(render(cat, _CATEGORY_INDENT) for cat in pack_json["categories"])
+    return _header(pack_json["locale"], pack_json["version"]) + body + _footer(layout["finalNewline"])
+
+
+# --- overlap index ----------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class CategoryOverlap:
+    """How much of one category the locales of a language share."""
+
+    language: str
+    id: str
+    locales: tuple[str, ...]  # locales that have the category
+    words: int  # distinct entries over those locales
+    shared: int  # entries in at least two of them
+    everywhere: int  # entries in all of them
+
+
+def overlap_index(packs: Mapping[str, Mapping[str, Any]]) -> list[CategoryOverlap]:
+    """Cross-locale overlap of every (language, category), by exact word entry."""
+    holders: dict[tuple[str, str], dict[str, set[str]]] = defaultdict(dict)
+    for locale, pack_json in sorted(packs.items()):
+        for cat in pack_json["categories"]:
+            holders[(language_of(locale), cat["id"])][locale] = {_dumps(w) for w in cat["words"]}
+    rows = []
+    for (language, cat_id), by_locale in holders.items():
+        seen: dict[str, int] = defaultdict(int)
+        for entries in by_locale.values():
+            for key in entries:
+                seen[key] += 1
+        rows.append(CategoryOverlap(
+            language=language,
+            id=cat_id,
+            locales=tuple(sorted(by_locale)),
+            words=len(seen),
+            shared=sum(1 for n in seen.values() if n > 1),
+            everywhere=sum(1 for n in seen.values() if n == len(by_locale)),
+        ))
+    return rows
+
+
+# --- building and resolving ------------------------------------------------------
+
+
+class _Version:
+    """One locale's version of a category, with the compact JSON of each word computed once."""
+
+    __slots__ = ("cat", "keys", "size")
+
+    def __init__(self, cat: Mapping[str, Any]) -> None:
+        self.cat = cat
+        self.keys = [_dumps(w) for w in cat["words"]]
+        self.size = _own_size(cat, self.keys)
+
+
+def _own_size(cat: Mapping[str, Any], keys: list[str]) -> int:
+    """``_size`` of the category as an own entry, from the sizes of its words."""
+    empty = _size({"id": cat["id"], "displayName": cat["displayName"], "words": []})
+    return empty + sum(len(k.encode("utf-8")) for k in keys) + max(len(keys) - 1, 0)
+
+
+def _entry(base: _Version | None, version: _Version) -> tuple[dict[str, Any], int]:
+    """The smallest overlay entry that turns ``base`` (or nothing) into ``version``, and its size."""
+    cat = version.cat
+    own = {"id": cat["id"], "displayName": cat["displayName"], "words": cat["words"]}
+    if base is None:
+        return own, version.size
+    entry: dict[str, Any] = {"id": cat["id"]}
+    if base.cat["displayName"] != cat["displayName"]:
+        entry["displayName"] = cat["displayName"]
+    old, new = base.keys, version.keys
+    if old != new:
+        # An upper bound on the words a diff can keep; most regional lists share next to nothing.
+        if sum((Counter(old) & Counter(new)).values()) < MIN_KEPT * len(old):
+            return own, version.size
+        edits = []
+        kept = 0
+        for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, old, new, autojunk=False).get_opcodes():
+            if tag == "equal":
+                kept += i2 - i1
+            else:
+                edits.append({"at": i1, "remove": i2 - i1, "add": cat["words"][j1:j2]})
+        if kept < MIN_KEPT * len(old):
+            return own, version.size
+        entry["edits"] = edits
+    size = _size(entry)
+    return (entry, size) if size < version.size else (own, version.size)
+
+
+def apply_entry(base: Mapping[str, Any] | None, entry: Mapping[str, Any]) -> dict[str, Any]:
+    """The category an overlay entry stands for."""
+    if "words" in entry:
+        return {"id": entry["id"], "displayName": entry["displayName"], "words": list(entry["words"])}
+    if base is None:
+        raise ValueError(f"overlay entry {entry['id']!r} refers to a category the base does not have")
+    words: list[Any] = []
+    pos = 0
+    for edit in entry.get("edits", ()):
+        if edit["at"] < pos or edit["at"] + edit["remove"] > len(base["words"]):
+            raise ValueError(f"overlay entry {entry['id']!r}: edit at {edit['at']} is out of order or range")
+        words.extend(base["words"][pos : edit["at"]])
+        words.extend(edit["add"])
+        pos = edit["at"] + edit["remove"]
+    words.extend(base["words"][pos:])
+    return {"id": entry["id"], "displayName": entry.get("displayName", base["displayName"]), "words": words}
+
+
+def _pick_base(language: str, versions: Mapping[str, _Version]) -> str | None:
+    """Locale whose version minimizes base plus overlay bytes, or None to keep it out of the base."""
+    def cost(candidate: str | None) -> int:
+        base = versions[candidate] if candidate else None
+        return (base.size if base else 0) + sum(_entry(base, v)[1] for v in versions.values())
+
+    default = LANGUAGE_DEFAULTS.get(language)
+    candidates = sorted(versions, key=lambda loc: (loc != default, loc)) if len(versions) > 1 else []
+    return min([*candidates, None], key=cost)
+
+
+def build_overlays(
+    packs: Mapping[str, PackFile], parsed: Mapping[str, dict[str, Any]] | None = None
+) -> dict[str, tuple[dict[str, Any], dict[str, dict[str, Any]]]]:
+    """``{language: (base, {locale: overlay})}`` for the given packs.
+
+    ``parsed`` may hold the packs' JSON when the caller has it already.
+    """
+    by_language: dict[str, dict[str, PackFile]] = defaultdict(dict)
+    for locale, pack in sorted(packs.items()):
+        by_language[language_of(locale)][locale] = pack
+    result = {}
+    for language, members in by_language.items():
+        layouts = {}
+        versions: dict[str, dict[str, _Version]] = {}
+        for locale, pack in members.items():
+            pack_json = parsed[locale] if parsed is not None else json.loads(pack.text)
+            layouts[locale] = pack_layout(pack, pack_json)
+            versions[locale] = {c["id"]: _Version(c) for c in pack_json["categories"]}
+        base_versions: dict[str, _Version] = {}
+        for cat_id in dict.fromkeys(cat_id for cats in versions.values() for cat_id in cats):
+            holders = {loc: cats[cat_id] for loc, cats in versions.items() if cat_id in cats}
+            source = _pick_base(language, holders)
+            if source is not None:
+                base_versions[cat_id] = holders[source]
+        base = {
+            "language": language,
+            "version": max(p.version for p in members.values()),
+            "categories": [v.cat for v in base_versions.values()],
+        }
+        overlays = {}
+        for locale, pack in members.items():
+            overlays[locale] = {
+                "locale": pack.locale,
+                "base": language,
+                "version": pack.version,
+                "layout": layouts[locale],
+                "sourceHash": digest(pack.text),
+                "categories": [_entry(base_versions.get(c), v)[0] for c, v in versions[locale].items()],
+            }
+        result[language] = (base, overlays)
+    return result
+
+
+def resolve(base: Mapping[str, Any], overlay: Mapping[str, Any]) -> dict[str, Any]:
+    """The pack JSON an overlay stands for."""
+    if overlay["base"] != base["language"]:
+        raise ValueError(f"{overlay['locale']}: overlay is for base {overlay['base']!r}, not {base['language']!r}")
+    in_base = {c["id"]: c for c in base["categories"]}
+    return {
+        "locale": overlay["locale"],
+        "version": overlay["version"],
+        "categories": [apply_entry(in_base.get(e["id"]), e) for e in overlay["categories"]],
+    }
+
+
+def resolve_text(base: Mapping[str, Any], overlay: Mapping[str, Any]) -> str:
+    """The pack file an overlay stands for, formatted as ``overlay["layout"]`` says."""
+    return render_pack(resolve(base, overlay), overlay["layout"])
+
+
+# --- files -----------------------------------------------------------------------
+
+
+def overlay_files(base: Mapping[str, Any], overlays: Mapping[str, Mapping[str, Any]]) -> dict[str, str]:
+    """``{file name: text}`` of one language directory."""
+    files = {BASE_NAME: _dumps(base) + "\n"}
+    for locale, overlay in overlays.items():
+        files[f"{locale}.json"] = _dumps(overlay) + "\n"
+    return files
+
+
+def write_overlays(out_dir: Path, files: Mapping[str, str]) -> list[str]:
+    """Write changed files of a language directory, delete overlays of removed locales.
+
+    Returns the names of files that were written or deleted.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    touched: list[str] = []
+    for name, text in files.items():
+        path = out_dir / name
+        if path.exists() and path.read_text(encoding="utf-8") == text:
+            continue
+        path.write_text(text, encoding="utf-8", newline="\n")
+        touched.append(name)
+    for path in out_dir.glob("*.json"):
+        if path.name not in files:
+            path.unlink()
+            touched.append(f"-{path.name}")
+    return touched
+
+
+def load_language(out_dir: Path) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Read ``(base, {locale: overlay})`` back from a language directory."""
+    base = json.loads((out_dir / BASE_NAME).read_text(encoding="utf-8"))
+    overlays = {}
+    for path in sorted(out_dir.glob("*.json")):
+        if path.name != BASE_NAME:
+            overlays[path.stem] = json.loads(path.read_text(encoding="utf-8"))
+    return base, overlays
+
+
+def resolve_language(out_dir: Path, packs: Mapping[str, PackFile]) -> dict[str, str]:
+    """Resolve an edited language directory: ``{locale: new pack text}`` for packs that change.
+
+    Raises ValueError if a pack changed since its overlay was built (its hash
+    is not ``sourceHash``), since writing the overlay back would undo that change.
+    """
+    base, overlays = load_language(out_dir)
+    changed = {}
+    for locale, overlay in overlays.items():
+        pack = packs.get(locale)
+        if pack is None:
+            raise ValueError(f"{out_dir / (locale + '.json')}: no pack for {locale} in assets/words")
+        text = resolve_text(base, overlay)
+        if text == pack.text:
+            continue
+        if digest(pack.text) != overlay["sourceHash"]:
+            raise ValueError(f"{locale}: the pack changed since its overlay was built; rebuild the overlays first")
+        changed[locale] = text
+    return changed
+
+
+def verify_overlays(out_dir: Path, packs: Iterable[PackFile]) -> list[str]:
+    """Check that the overlays in ``out_dir`` resolve to exactly these packs; returns problems."""
+    if not (out_dir / BASE_NAME).exists():
+        return [f"missing {out_dir / BASE_NAME}"]
+    base, overlays = load_language(out_dir)
+    problems = []
+    for pack in packs:
+        overlay = overlays.pop(pack.locale, None)
+        if overlay is None:
+            problems.append(f"missing overlay {pack.locale}.json")
+            continue
+        try:
+            text = resolve_text(base, overlay)
+        except (KeyError, ValueError) as e:
+            problems.append(f"{pack.locale}: {e}")
+            continue
+        if text != pack.text:
+            if json.loads(text) == json.loads(pack.text):
+                problems.append(f"{pack.locale}: resolves to the same words but a different layout")
+            else:
+                problems.append(f"{pack.locale}: resolves to a different pack")
+    if overlays:
+        problems.append(f"stale overlays: {sorted(overlays)}")
+    return problems
@@ -0,0 +1,147 @@
+"""Compact binary encoding of a word pack (``.wpk``). Spec: docs/WORD_PACK_FORMAT.md.
+
+All integers are little-endian. Strings are stored once in a UTF-8 string
+table and referenced by index; difficulties are one byte each; categories
+point at a contiguous range of the word arrays.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from typing import Any, Iterable
+
+from .model import DIFFICULTIES, Category
+
+MAGIC = b"WPK1"
+NO_STRING = 0xFFFFFFFF
+
+# magic, format flags, pack version, category count, word count, string count,
+# string data length, locale string index, crc32 of everything after the header.
+_HEADER = struct.Struct("<4sHHIIIIII")
+_CATEGORY = struct.Struct("<IIII")  # id, displayName, first word, word count
+
+FLAG_HINTS = 0x0001  # word_hint array present
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.index: dict[str, int] = {}
+        self.strings: list[str] = []
+
+    def add(self, value: str) -> int:
+        idx = self.index.get(value)
+        if idx is None:
+            idx = self.index[value] = len(self.strings)
+            self.strings.append(value)
+        return idx
+
+
+def encode(locale: str, version: int, categories: Iterable[Category]) -> bytes:
+    table = _StringTable()
+    locale_idx = table.add(locale)
+    cat_rows: list[tuple[int, int, int, int]] = []
+    texts: list[int] = []
+    hints: list[int] = []
+    diffs = bytearray()
+
+    for cat in categories:
+        cat_rows.append((table.add(cat.id), table.add(cat.display_name), len(texts), len(cat.words)))
+        for w in cat.words:
+            if w.difficulty not in DIFFICULTIES:
+                raise ValueError(f"{locale}/{cat.id}: unknown difficulty {w.difficulty!r} for {w.text!r}")
+            unknown = set(w.extra) - {"reveal_hint"}
+            if unknown:
+                raise ValueError(f"{locale}/{cat.id}: cannot encode keys {sorted(unknown)} of {w.text!r}")
+            texts.append(table.add(w.text))
+            hint = w.extra.get("reveal_hint")
+            hints.append(NO_STRING if hint is None else table.add(hint))
+            diffs.append(DIFFICULTIES.index(w.difficulty))
+
+    flags = FLAG_HINTS if any(h != NO_STRING for h in hints) else 0
+    encoded = [s.encode("utf-8") for s in table.strings]
+    offsets = [0]
+    for e in encoded:
+        offsets.append(offsets[-1] + len(e))
+    data = b"".join(encoded)
+
+    body = bytearray()
+    body += struct.pack(f"<{len(offsets)}I", *offsets)
+    body += data
+    body += b"\0" * (-len(body) % 4)
+    for row in cat_rows:
+        body += _CATEGORY.pack(*row)
+    body += struct.pack(f"<{len(texts)}I", *texts)
+    if flags & FLAG_HINTS:
+        body += struct.pack(f"<{len(hints)}I", *hints)
+    body += diffs
+
+    header = _HEADER.pack(
+        MAGIC,
+        flags,
+        version,
+        len(cat_rows),
+        len(texts),
+        len(table.strings),
+        len(data),
+        locale_idx,
+        zlib.crc32(body),
+    )
+    return header + bytes(body)
+
+
+def decode(blob: bytes) -> dict[str, Any]:
+    """Decode a ``.wpk`` blob back into the pack's JSON structure."""
+    (magic, flags, version, n_cats, n_words, n_strings, data_len, locale_idx, crc) = _HEADER.unpack_from(blob)
+    if magic != MAGIC:
+        raise ValueError(f"not a word pack (magic {magic!r})")
+    body = memoryview(blob)[_HEADER.size :]
+    if zlib.crc32(body) != crc:
+        raise ValueError("word pack checksum mismatch")
+
+    pos = 0
+    offsets = struct.unpack_from(f"<{n_strings + 1}I", body, pos)
+    pos += 4 * (n_strings + 1)
+    data = bytes(body[pos : pos + data_len])
+    strings = [data[offsets[i] : offsets[i + 1]].decode("utf-8") for i in range(n_strings)]
+    pos += data_len + (-(4 * (n_strings + 1) + data_len) % 4)
+
+    cat_rows = [_CATEGORY.unpack_from(body, pos + i * _CATEGORY.size) for i in range(n_cats)]
+    pos += n_cats * _CATEGORY.size
+    texts = struct.unpack_from(f"<{n_words}I", body, pos)
+    pos += 4 * n_words
+    hints: tuple[int, ...] = (NO_STRING,) * n_words
+    if flags & FLAG_HINTS:
+        hints = struct.unpack_from(f"<{n_words}I", body, pos)
+        pos += 4 * n_words
+    diffs = body[pos : pos + n_words]
+
+    categories = []
+    for id_idx, name_idx, first, count in cat_rows:
+        words = []
+        for k in range(first, first + count):
+            word: dict[str, Any] = {"text": strings[texts[k]], "difficulty": DIFFICULTIES[diffs[k]]}
+            if hints[k] != NO_STRING:
+                word["reveal_hint"] = strings[hints[k]]
+            words.append(word)
+        categories.append({"id": strings[id_idx], "displayName": strings[name_idx], "words": words})
+    return {"locale": strings[locale_idx], "version": version, "categories": categories}
+
+
+def verify(blob: bytes, pack_json: dict[str, Any]) -> list[str]:
+    """Compare a decoded blob with the JSON pack; returns a list of differences (empty if equal)."""
+    try:
+        decoded = decode(blob)
+    except (ValueError, struct.error) as e:
+        return [str(e)]
+    problems = []
+    for key in ("locale", "version"):
+        if decoded[key] != pack_json[key]:
+            problems.append(f"{key}: {decoded[key]!r} != {pack_json[key]!r}")
+    ours, theirs = decoded["categories"], pack_json["categories"]
+    if len(ours) != len(theirs):
+        problems.append(f"category count: {len(ours)} != {len(theirs)}")
+    for a, b in zip(ours, theirs):
+        if a != b:
+            problems.append(f"category {b.get('id')!r} differs")
+    return problems
@@ -0,0 +1,256 @@
+"""Format-preserving reader/writer for word pack JSON files.
+
+A pack is loaded once: the text is parsed with ``json`` for the data and
+scanned once (linear, no backtracking) for the byte span of every category
+object. Updates replace only the spans of the categories that changed; the
+rest of the file is copied through untouched. Changed categories are rendered
+in the same layout they had before, so diffs stay limited to the edited words.
+``stream.rewrite_pack`` does the same rewrite without holding the pack in
+memory; ``wordpacks.py apply`` goes through it.
+
+Three layouts exist in assets/words today:
+
+* ``expanded`` – ``json.dump(..., indent=2)`` (es-AR, en-US)
+* ``line``     – one compact ``{"text": ..., "difficulty": ...}`` per line (es-UY)
+* ``dense``    – one line per difficulty run, no spaces (en-AU, es-ES, pt-BR, ...)
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from .model import Category, CategoryUpdate
+
+ROOT = Path(__file__).resolve().parents[2]
+WORDS_DIR = ROOT / "assets" / "words"
+# Derived artifacts (packed, minified, sharded ...) are generated here, not committed.
+BUILD_DIR = ROOT / "build" / "wordpacks"
+
+_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]')
+_DEFAULT_SEPARATOR = ",\n    "
+
+
+def _render_expanded(cat: dict[str, Any], indent: str) -> str:
+    return json.dumps(cat, ensure_ascii=False, indent=2).replace("\n", "\n" + indent)
+
+
+def _render_line(cat: dict[str, Any], indent: str) -> str:
+    lines = ["{"]
+    for key, value in cat.items():
+        if key != "words":
+            lines.append(f"{indent}  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)},")
+    words = cat["words"]
+    if words:
+        lines.append(f'{indent}  "words": [')
+        lines.append(",\n".join(f"{indent}    {json.dumps(w, ensure_ascii=False)}" for w in words))
+        lines.append(f"{indent}  ]")
+    else:
+        lines.append(f'{indent}  "words": []')
+    lines.append(indent + "}")
+    return "\n".join(lines)
+
+
+def _render_dense(cat: dict[str, Any], indent: str) -> str:
+    head = {k: v for k, v in cat.items() if k != "words"}
+    head_json = json.dumps(head, ensure_ascii=False, separators=(",", ":"))[:-1]
+    runs: list[list[dict[str, Any]]] = []
+    last_diff = None
+    for w in cat["words"]:
+        if runs and w.get("difficulty") == last_diff:
+            runs[-1].append(w)
+        else:
+            runs.append([w])
+            last_diff = w.get("difficulty")
+    if not runs:
+        return head_json + ',"words":[]}'
+    lines = [
+        indent + "  " + ",".join(json.dumps(w, ensure_ascii=False, separators=(",", ":")) for w in run)
+        for run in runs
+    ]
+    return head_json + ',"words":[\n' + ",\n".join(lines) + "\n" + indent + "]}"
+
+
+STYLES: dict[str, Callable[[dict[str, Any], str], str]] = {
+    "expanded": _render_expanded,
+    "line": _render_line,
+    "dense": _render_dense,
+}
+
+
+def scan_category_spans(text: str) -> list[tuple[int, int]]:
+    """Return ``(start, end)`` offsets of each object in the top-level ``categories`` array."""
+    spans: list[tuple[int, int]] = []
+    depth = 0
+    key_seen = False
+    in_categories = False
+    start = 0
+    for m in _TOKEN.finditer(text):
+        tok = m.group()
+        if tok[0] == '"':
+            if depth == 1 and tok == '"categories"':
+                key_seen = True
+            continue
+        if tok == "{" or tok == "[":
+            if depth == 1 and key_seen and tok == "[":
+                in_categories = True
+                key_seen = False
+            elif in_categories and depth == 2 and tok == "{":
+                start = m.start()
+            depth += 1
+        else:
+            depth -= 1
+            if in_categories:
+                if depth == 2 and tok == "}":
+                    spans.append((start, m.end()))
+                elif depth == 1:
+                    in_categories = False
+    return spans
+
+
+def _line_indent(text: str, offset: int) -> str:
+    return text[text.rfind("\n", 0, offset) + 1 : offset]
+
+
+def detect_style(cat: dict[str, Any], original: str, indent: str) -> str | None:
+    for name, render in STYLES.items():
+        if render(cat, indent) == original:
+            return name
+    return None
+
+
+class PackFile:
+    """One locale pack: parsed categories indexed by id plus the source layout."""
+
+    def __init__(self, path: Path, text: str) -> None:
+        self.path = path
+        self._index(text)
+
+    def _index(self, text: str) -> None:
+        self.text = text
+        data = json.loads(text)
+        self.locale: str = data["locale"]
+        self.version: int = data["version"]
+
+        spans = scan_category_spans(text)
+        raw_categories = data["categories"]
+        if len(spans) != len(raw_categories):
+            raise ValueError(
+                f"{self.path}: found {len(spans)} category spans, expected {len(raw_categories)}"
+            )
+
+        self.categories: dict[str, Category] = {}
+        self._order: list[str] = []
+        self._spans: dict[str, tuple[int, int]] = {}
+        self._indent: dict[str, str] = {}
+        for (start, end), raw in zip(spans, raw_categories):
+            cat_id = raw["id"]
+            self.categories[cat_id] = Category.from_json(raw)
+            self._order.append(cat_id)
+            self._spans[cat_id] = (start, end)
+            self._indent[cat_id] = _line_indent(text, start)
+        # Layouts are detected lazily, only for categories that get re-rendered.
+        self._styles: dict[str, str | None] = {}
+        self._dirty: set[str] = set()
+
+    @classmethod
+    def load(cls, path: str | Path) -> "PackFile":
+        path = Path(path)
+        return cls(path, path.read_text(encoding="utf-8"))
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._dirty)
+
+    def block_text(self, cat_id: str) -> str:
+        """Source text of a category object as it is currently on disk."""
+        start, end = self._spans[cat_id]
+        return self.text[start:end]
+
+    def _original_style(self, cat_id: str) -> str | None:
+        if cat_id not in self._styles:
+            start, end = self._spans[cat_id]
+            original = self.text[start:end]
+            self._styles[cat_id] = detect_style(json.loads(original), original, self._indent[cat_id])
+        return self._styles[cat_id]
+
+    def _style_for(self, cat_id: str) -> str:
+        if cat_id in self._spans:
+            style = self._original_style(cat_id)
+            if style:
+                return style
+        # Hand-formatted or new category: follow the layout of the rest of the file.
+        detected = Counter(self._original_style(c) for c in self._spans)
+        detected.pop(None, None)
+        return detected.most_common(1)[0][0] if detected else "expanded"
+
+    def set_category(self, update: CategoryUpdate) -> bool:
+        """Replace a category's words (and optionally displayName). Returns True if anything changed."""
+        current = self.categories.get(update.id)
+        display_name = update.display_name
+        if display_name is None:
+            display_name = current.display_name if current else update.id
+        new = Category(id=update.id, display_name=display_name, words=list(update.words))
+        if current is not None and current.to_json() == new.to_json():
+            return False
+        if current is None:
+            self._order.append(update.id)
+        self.categories[update.id] = new
+        self._dirty.add(update.id)
+        return True
+
+    def apply(self, updates: Iterable[CategoryUpdate]) -> list[str]:
+        return [u.id for u in updates if self.set_category(u)]
+
+    def render(self) -> str:
+        if not self._dirty:
+            return self.text
+        spans = [self._spans[c] for c in self._order if c in self._spans]
+        if not spans:
+            raise ValueError(f"{self.path}: pack has no categories to anchor the layout")
+        header = self.text[: spans[0][0]]
+        footer = self.text[spans[-1][1] :]
+        separator = self.text[spans[0][1] : spans[1][0]] if len(spans) > 1 else _DEFAULT_SEPARATOR
+
+        parts: list[str] = [header]
+        last = len(self._order) - 1
+        for i, cat_id in enumerate(self._order):
+            if cat_id in self._dirty:
+                indent = self._indent.get(cat_id, _line_indent(self.text, spans[0][0]))
+                parts.append(STYLES[self._style_for(cat_id)](self.categories[cat_id].to_json(), indent))
+            else:
+                start, end = self._spans[cat_id]
+                parts.append(self.text[start:end])
+            if i < last:
+                nxt = self._order[i + 1]
+                if cat_id in self._spans and nxt in self._spans:
+                    parts.append(self.text[self._spans[cat_id][1] : self._spans[nxt][0]])
+                else:
+                    parts.append(separator)
+        parts.append(footer)
+        return "".join(parts)
+
+    def save(self) -> bool:
+        """Write the pack back if any category changed. Returns True if the file was written."""
+        if not self._dirty:
+            return False
+        text = self.render()
+        self.path.write_text(text, encoding="utf-8", newline="\n")
+        self._index(text)
+        return True
+
+
+def pack_path(locale: str) -> Path:
+    return WORDS_DIR / f"{locale}.json"
+
+
+def load_packs(locales: Iterable[str] | None = None) -> dict[str, PackFile]:
+    """Load packs keyed by locale (all of assets/words when ``locales`` is None)."""
+    if locales is None:
+        paths = sorted(WORDS_DIR.glob("*.json"))
+    else:
+        paths = [pack_path(loc) for loc in locales]
+    return {p.stem: PackFile.load(p) for p in paths}
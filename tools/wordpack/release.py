@@ -0,0 +1,93 @@
+"""Minified release variant of a pack plus a precomputed index.
+
+The minified pack shortens every key and stores each word as an array::
+
+    {"l": "es-AR", "v": 1, "c": [{"i": "lugares", "n": "Lugares", "w": [["Obelisco", 0], ...]}]}
+
+where the second element is the difficulty (0 easy, 1 medium, 2 hard) and an
+optional third element is the ``reveal_hint``.
+
+The index holds what WordPackValidator computes at startup: per-category and
+per-difficulty counts, the ``trim().toLowerCase()`` dedupe key of every word
+and the resulting validation report. ``clean`` is true when the report has no
+blocking issues and no warnings, i.e. when the runtime validation can be
+skipped for this exact source (``sourceHash``).
+"""
+
+from __future__ import annotations
+
+import json
+from collections import Counter
+from typing import Any, Iterable
+
+from .cache import digest
+from .model import DIFFICULTIES, Category
+from .validation import dart_trim, validate_pack
+
+
+def minify(pack_json: dict[str, Any]) -> dict[str, Any]:
+    """Raises ``ValueError`` for a word the minified form cannot hold as is:
+    extra keys, or a difficulty other than easy/medium/hard (which the app
+    reads as medium, so the release pack would not round-trip)."""
+    locale = pack_json["locale"]
+    categories = []
+    for cat in pack_json["categories"]:
+        words = []
+        for w in cat["words"]:
+            where = f"{locale}/{cat['id']}: {w['text']!r}"
+            unknown = set(w) - {"text", "difficulty", "reveal_hint"}
+            if unknown:
+                raise ValueError(f"{where}: cannot minify keys {sorted(unknown)}")
+            if w.get("difficulty") not in DIFFICULTIES:
+                raise ValueError(
+                    f"{where}: difficulty {w.get('difficulty')!r} is not one of {', '.join(DIFFICULTIES)}"
+                    " (the app reads it as medium)"
+                )
+            row: list[Any] = [w["text"], DIFFICULTIES.index(w["difficulty"])]
+            if "reveal_hint" in w:
+                row.append(w["reveal_hint"])
+            words.append(row)
+        categories.append({"i": cat["id"], "n": cat["displayName"], "w": words})
+    return {"l": pack_json["locale"], "v": pack_json["version"], "c": categories}
+
+
+def expand(mini: dict[str, Any]) -> dict[str, Any]:
+    """Inverse of ``minify``."""
+    categories = []
+    for cat in mini["c"]:
+        words = []
+        for row in cat["w"]:
+            word = {"text": row[0], "difficulty": DIFFICULTIES[row[1]]}
+            if len(row) > 2:
+                word["reveal_hint"] = row[2]
+            words.append(word)
+        categories.append({"id": cat["i"], "displayName": cat["n"], "words": words})
+    return {"locale": mini["l"], "version": mini["v"], "categories": categories}
+
+
+def dumps_min(data: dict[str, Any]) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def build_index(locale: str, version: int, categories: Iterable[Category], source: str) -> dict[str, Any]:
+    categories = list(categories)
+    report = validate_pack(locale, categories)
+    cats = []
+    for cat in categories:
+        counts = Counter(w.difficulty for w in cat.words)
+        cats.append(
+            {
+                "id": cat.id,
+                "total": len(cat.words),
+                "counts": {d: counts.get(d, 0) for d in DIFFICULTIES},
+                "keys": [dart_trim(w.text).lower() for w in cat.words],
+            }
+        )
+    return {
+        "locale": locale,
+        "version": version,
+        "sourceHash": digest(source),
+        "clean": not (report.has_blocking_issues or report.has_warnings),
+        "validation": report.to_json(),
+        "categories": cats,
+    }
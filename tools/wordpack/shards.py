@@ -0,0 +1,112 @@
+"""Split a pack into a category manifest plus one shard per category.
+
+Layout under ``<out>/<locale>/``::
+
+    manifest.json      {"locale", "version", "sourceHash",
+                        "categories": [{"id", "displayName", "count", "counts", "shard", "hash"}]}
+    <category>.json    the category object exactly as in the pack (``WordCategory.fromJson`` input)
+
+The manifest is enough to render the category picker; a shard is loaded
+only when its category is played. ``verify_shards`` reassembles the shards in
+manifest order and checks the result against the source pack.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from .cache import digest
+from .model import DIFFICULTIES
+
+MANIFEST_NAME = "manifest.json"
+
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def build_shards(pack_json: dict[str, Any], source: str) -> tuple[dict[str, Any], dict[str, str]]:
+    """Return ``(manifest, {file name: shard text})`` for one pack."""
+    shards: dict[str, str] = {}
+    entries = []
+    for cat in pack_json["categories"]:
+        name = f"{cat['id']}.json"
+        if name == MANIFEST_NAME or name in shards:
+            raise ValueError(f"{pack_json['locale']}: cannot shard category id {cat['id']!r}")
+        text = _dumps(cat)
+        shards[name] = text
+        counts = Counter(w.get("difficulty") for w in cat["words"])
+        entries.append(
+            {
+                "id": cat["id"],
+                "displayName": cat["displayName"],
+                "count": len(cat["words"]),
+                "counts": {d: counts.get(d, 0) for d in DIFFICULTIES},
+                "shard": name,
+                "hash": digest(text),
+            }
+        )
+    manifest = {
+        "locale": pack_json["locale"],
+        "version": pack_json["version"],
+        "sourceHash": digest(source),
+        "categories": entries,
+    }
+    return manifest, shards
+
+
+def write_shards(out_dir: Path, manifest: dict[str, Any], shards: dict[str, str]) -> list[str]:
+    """Write changed shards and the manifest, delete shards of removed categories.
+
+    Returns the names of files that were written or deleted.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    touched: list[str] = []
+    files = {**shards, MANIFEST_NAME: json.dumps(manifest, ensure_ascii=False, indent=2) + "\n"}
+    for name, text in files.items():
+        path = out_dir / name
+        if path.exists() and path.read_text(encoding="utf-8") == text:
+            continue
+        path.write_text(text, encoding="utf-8", newline="\n")
+        touched.append(name)
+    for path in out_dir.glob("*.json"):
+        if path.name not in files:
+            path.unlink()
+            touched.append(f"-{path.name}")
+    return touched
+
+
+def verify_shards(out_dir: Path, pack_json: dict[str, Any], source: str) -> list[str]:
+    """Check a shard directory against the pack; returns a list of problems (empty if in sync)."""
+    manifest_path = out_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        return [f"missing {manifest_path}"]
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    problems = []
+    if manifest.get("sourceHash") != digest(source):
+        problems.append("manifest was built from a different pack")
+    categories = []
+    for entry in manifest["categories"]:
+        path = out_dir / entry["shard"]
+        if not path.exists():
+            problems.append(f"missing shard {entry['shard']}")
+            continue
+        text = path.read_text(encoding="utf-8")
+        if digest(text) != entry["hash"]:
+            problems.append(f"shard {entry['shard']} does not match its manifest hash")
+        cat = json.loads(text)
+        if cat["id"] != entry["id"] or cat["displayName"] != entry["displayName"]:
+            problems.append(f"shard {entry['shard']} id/displayName differ from the manifest")
+        if len(cat["words"]) != entry["count"]:
+            problems.append(f"shard {entry['shard']} has {len(cat['words'])} words, manifest says {entry['count']}")
+        categories.append(cat)
+    rebuilt = {"locale": manifest["locale"], "version": manifest["version"], "categories": categories}
+    if not problems and rebuilt != pack_json:
+        problems.append("reassembled shards differ from the pack")
+    extra = {p.name for p in out_dir.glob("*.json")} - {MANIFEST_NAME} - {e["shard"] for e in manifest["categories"]}
+    if extra:
+        problems.append(f"stale shards: {sorted(extra)}")
+    return problems
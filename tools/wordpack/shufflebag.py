@@ -0,0 +1,125 @@
+"""Reference shuffle-bag sampler for word draws.
+
+Instead of an independent ``rand.nextInt(length)`` per round, each pool
+(locale, category, difficulty, as resolved by ``draws``) is consumed as a bag:
+a permutation of the pool is played to the end before any word comes back.
+Only the bag's permutation seed and the cursor are persisted::
+
+    BagState(seed=u32, cursor=u16, size=u16)  ->  8 bytes ("<IHH")
+
+The permutation is a Fisher-Yates shuffle driven by mulberry32, which needs
+nothing beyond 32-bit integer arithmetic, so a Dart port can reproduce
+``permutation(size, seed)`` exactly from the stored state. A new bag takes a
+fresh seed from the caller's entropy source (``Random.secure()`` in the app);
+seeds whose first word equals the last word of the previous bag are
+rejected, so bags never repeat a word back to back. A state whose ``size``
+no longer matches the pool (the pack changed) starts a new bag.
+
+Every word appears exactly once per bag, so long-run frequencies are exactly
+uniform; ``drawsim`` measures the repeat rate and checks uniformity at scale.
+"""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable
+
+_STATE = struct.Struct("<IHH")
+MAX_POOL = 0xFFFF
+_MASK = 0xFFFFFFFF
+
+
+def mulberry32(seed: int) -> Callable[[], int]:
+    """mulberry32: 32-bit state, 32-bit output, portable bit-for-bit to Dart."""
+    state = seed & _MASK
+
+    def next_u32() -> int:
+        nonlocal state
+        state = (state + 0x6D2B79F5) & _MASK
+        z = state
+        z = ((z ^ (z >> 15)) * (z | 1)) & _MASK
+        z ^= (z + ((z ^ (z >> 7)) * (z | 61))) & _MASK
+        return (z ^ (z >> 14)) & _MASK
+
+    return next_u32
+
+
+def _below(next_u32: Callable[[], int], bound: int) -> int:
+    """Uniform integer in ``[0, bound)`` without modulo bias (rejection)."""
+    threshold = (2**32 - bound) % bound
+    while True:
+        r = next_u32()
+        if r >= threshold:
+            return r % bound
+
+
+@lru_cache(maxsize=256)
+def permutation(size: int, seed: int) -> tuple[int, ...]:
+    """Fisher-Yates shuffle of ``range(size)`` seeded with ``seed``."""
+    perm = list(range(size))
+    rng = mulberry32(seed)
+    for i in range(size - 1, 0, -1):
+        j = _below(rng, i + 1)
+        perm[i], perm[j] = perm[j], perm[i]
+    return tuple(perm)
+
+
+@dataclass(frozen=True)
+class BagState:
+    seed: int
+    cursor: int
+    size: int
+
+    def to_bytes(self) -> bytes:
+        return _STATE.pack(self.seed, self.cursor, self.size)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BagState":
+        return cls(*_STATE.unpack(data))
+
+
+STATE_BYTES = _STATE.size
+
+
+def new_bag(size: int, entropy: Callable[[], int], avoid_first: int | None = None) -> BagState:
+    """Start a bag; with ``avoid_first`` set, reject seeds that would repeat that word first."""
+    if not 0 < size <= MAX_POOL:
+        raise ValueError(f"pool size {size} out of range 1..{MAX_POOL}")
+    while True:
+        seed = entropy() & _MASK
+        if avoid_first is None or size == 1 or permutation(size, seed)[0] != avoid_first:
+            return BagState(seed, 0, size)
+
+
+def draw(state: BagState | None, size: int, entropy: Callable[[], int]) -> tuple[int, BagState]:
+    """Return ``(index into the pool, next state)``."""
+    if state is None or state.size != size or state.cursor > size:
+        state = new_bag(size, entropy)
+    perm = permutation(size, state.seed)
+    if state.cursor == size:
+        state = new_bag(size, entropy, avoid_first=perm[-1])
+        perm = permutation(size, state.seed)
+    return perm[state.cursor], BagState(state.seed, state.cursor + 1, size)
+
+
+class ShuffleBag:
+    """Per-pool bag states keyed by ``locale/category/difficulty``, as the app would persist them."""
+
+    def __init__(self, entropy: Callable[[], int]) -> None:
+        self.entropy = entropy
+        self.states: dict[str, BagState] = {}
+
+    def draw(self, key: str, size: int) -> int:
+        index, self.states[key] = draw(self.states.get(key), size, self.entropy)
+        return index
+
+    def dump(self) -> dict[str, bytes]:
+        return {key: state.to_bytes() for key, state in self.states.items()}
+
+    @classmethod
+    def load(cls, data: dict[str, bytes], entropy: Callable[[], int]) -> "ShuffleBag":
+        bag = cls(entropy)
+        bag.states = {key: BagState.from_bytes(raw) for key, raw in data.items()}
+        return bag
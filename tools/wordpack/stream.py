@@ -0,0 +1,299 @@
+"""Streaming, format-preserving rewrite of a word pack file.
+
+``PackFile`` holds the whole text and the parsed pack in memory. This module
+reads the file in fixed-size chunks instead and never decodes more than one
+category object at a time. It uses the same token scan as
+``scan_category_spans``, but over bytes: JSON punctuation is ASCII and every
+byte of a multi-byte UTF-8 sequence is >= 0x80, so nothing needs decoding to
+find the spans.
+
+The file is cut into segments whose concatenation is the file itself::
+
+    text       header, up to the first category (streamed in pieces)
+    category   one object of the ``categories`` array
+    separator  what sits between two categories (``,\\n    ``)
+    end        empty marker right after the last category
+    text       the footer
+
+``rewrite_pack`` copies every segment through byte-for-byte except the
+categories an update actually changes, which are rendered in the layout they
+already had (see ``packfile.STYLES``); new categories are appended after the
+last one in the layout of their neighbour. The output file is only opened
+when the first change is found (the unchanged prefix is copied from the
+source then) and replaces the pack atomically, so a run that changes
+nothing writes nothing. Memory is bounded by the largest category, not by
+the size of the pack.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Iterator, Mapping
+
+from .cache import digest, hasher
+from .model import Category, CategoryUpdate
+from .packfile import STYLES, detect_style, pack_path
+
+CHUNK_SIZE = 1 << 16
+
+# A complete string, a bracket, or a lone quote: a string that continues past
+# the end of the buffer, to be scanned again once more bytes are read.
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]|"')
+_DEFAULT_SEPARATOR = b",\n    "
+
+# ``update_for(category_id, block)`` returns the update for a category, or None
+# to leave it alone. ``block`` is the category's bytes on disk, or None for a
+# category that is not in the pack yet.
+UpdateFor = Callable[[str, "bytes | None"], "CategoryUpdate | None"]
+
+
+def scan_segments(fp: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[str, bytes]]:
+    """Yield ``(kind, data)`` segments of a pack file, see the module docstring."""
+    buf = b""
+    start = pos = 0  # start of the unemitted bytes in ``buf``, scan position
+    acc = bytearray()  # current category or separator, from earlier chunks
+    mode = "text"  # "text", "category" or "gap" (after a category)
+    depth = 0
+    key_seen = in_categories = False
+    while True:
+        m = _TOKEN.search(buf, pos)
+        if m is None or m.group() == b'"':
+            # Everything before ``scan_from`` is scanned; keep the rest and read more.
+            scan_from = len(buf) if m is None else m.start()
+            piece = buf[start:scan_from]
+            if mode == "text":
+                if piece:
+                    yield "text", piece
+            else:
+                acc += piece
+            chunk = fp.read(chunk_size)
+            if not chunk:
+                if m is not None:
+                    raise ValueError("unterminated string at end of file")
+                if mode != "text" or depth:
+                    raise ValueError("truncated pack: unbalanced brackets at end of file")
+                return
+            buf = buf[scan_from:] + chunk
+            start = pos = 0
+            continue
+
+        tok = m.group()
+        pos = m.end()
+        if tok[0] == 0x22:  # '"'
+            if depth == 1 and tok == b'"categories"':
+                key_seen = True
+        elif tok in (b"{", b"["):
+            if depth == 1 and key_seen and tok == b"[":
+                in_categories = True
+                key_seen = False
+            elif in_categories and depth == 2 and tok == b"{":
+                before = buf[start : m.start()]
+                if mode == "gap":
+                    yield "separator", bytes(acc) + before
+                    acc.clear()
+                elif before:
+                    yield "text", before
+                mode = "category"
+                start = m.start()
+            depth += 1
+        else:
+            depth -= 1
+            if in_categories:
+                if depth == 2 and tok == b"}":
+                    yield "category", bytes(acc) + buf[start:pos]
+                    acc.clear()
+                    mode = "gap"
+                    start = pos
+                elif depth == 1:
+                    in_categories = False
+                    yield "end", b""
+                    if mode == "gap":
+                        # What followed the last category belongs to the footer.
+                        if acc:
+                            yield "text", bytes(acc)
+                            acc.clear()
+                        mode = "text"
+
+
+def _indent_after(indent: bytes, data: bytes) -> bytes:
+    """Trailing spaces and tabs of ``indent + data``: the indent of whatever follows."""
+    stripped = data.rstrip(b" \t")
+    return data[len(stripped) :] if stripped else indent + data
+
+
+@dataclass
+class RewriteResult:
+    changed: list[str] = field(default_factory=list)
+    written: bool = False
+    # Digest of the pack as it is after the rewrite (same as ``cache.digest``).
+    pack_hash: str = ""
+    # Digest of the block of every category ``update_for`` was asked about.
+    block_hashes: dict[str, str] = field(default_factory=dict)
+
+
+class _Output:
+    """Hashes everything written; opens the temporary file on the first change."""
+
+    def __init__(self, path: Path, dry_run: bool) -> None:
+        self.path = path
+        self.dry_run = dry_run
+        self.hash = hasher()
+        self.copied = 0  # bytes of the source passed through so far
+        self.fp: BinaryIO | None = None
+        self.tmp: str | None = None
+
+    def copy(self, data: bytes) -> None:
+        self.hash.update(data)
+        self.copied += len(data)
+        if self.fp is not None:
+            self.fp.write(data)
+
+    def replace(self, data: bytes, source_len: int) -> None:
+        if self.fp is None and not self.dry_run:
+            fd, self.tmp = tempfile.mkstemp(prefix=f".{self.path.name}.", dir=self.path.parent)
+            self.fp = os.fdopen(fd, "wb")
+            with self.path.open("rb") as src:
+                _copy_prefix(src, self.fp, self.copied)
+        self.hash.update(data)
+        self.copied += source_len
+        if self.fp is not None:
+            self.fp.write(data)
+
+    def commit(self) -> bool:
+        if self.fp is None:
+            return False
+        self.fp.close()
+        shutil.copymode(self.path, self.tmp)
+        os.replace(self.tmp, self.path)
+        self.fp = self.tmp = None
+        return True
+
+    def abort(self) -> None:
+        if self.fp is not None:
+            self.fp.close()
+            os.unlink(self.tmp)
+            self.fp = self.tmp = None
+
+
+def _copy_prefix(src: BinaryIO, dst: BinaryIO, n: int, chunk_size: int = CHUNK_SIZE) -> None:
+    while n > 0:
+        data = src.read(min(n, chunk_size))
+        if not data:
+            raise ValueError(f"{src.name} changed while it was being rewritten")
+        dst.write(data)
+        n -= len(data)
+
+
+def _updated(raw: dict, update: CategoryUpdate | None) -> Category | None:
+    """The category after ``update``, or None when it leaves it as it is."""
+    if update is None:
+        return None
+    current = Category.from_json(raw)
+    display_name = current.display_name if update.display_name is None else update.display_name
+    new = Category(id=update.id, display_name=display_name, words=list(update.words))
+    return None if new.to_json() == current.to_json() else new
+
+
+def _render(cat: Category, style: str, indent: bytes) -> bytes:
+    return STYLES[style](cat.to_json(), indent.decode("utf-8")).encode("utf-8")
+
+
+def _detect(raw: dict, block: bytes, indent: bytes) -> str | None:
+    return detect_style(raw, block.decode("utf-8"), indent.decode("utf-8"))
+
+
+def rewrite_pack(
+    path: Path,
+    ids: Iterable[str],
+    update_for: UpdateFor,
+    dry_run: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+) -> RewriteResult:
+    """Stream ``path`` through, replacing the categories in ``ids`` that ``update_for`` changes.
+
+    ``update_for`` is called once per id: in file order for categories in the
+    pack, then with ``block=None`` for the ones that are not, which are
+    appended. With ``dry_run`` nothing is written but the result (changes and
+    hashes) is the same.
+    """
+    wanted = dict.fromkeys(ids)
+    asked = set(wanted)
+    result = RewriteResult()
+    out = _Output(path, dry_run)
+    line = b""  # indent of the next category
+    separator = None
+    # Last category seen, to lay out hand-formatted or new categories like it.
+    previous: tuple[dict, bytes, bytes] | None = None
+    try:
+        with path.open("rb") as fp:
+            for kind, data in scan_segments(fp, chunk_size):
+                if kind == "category":
+                    raw = json.loads(data)
+                    cat_id = raw["id"]
+                    indent = line
+                    new = None
+                    if cat_id in wanted:
+                        del wanted[cat_id]
+                        new = _updated(raw, update_for(cat_id, data))
+                    if new is None:
+                        out.copy(data)
+                        block = data
+                    else:
+                        style = _detect(raw, data, indent)
+                        if style is None:
+                            style = (_detect(*previous) if previous else None) or "expanded"
+                        block = _render(new, style, indent)
+                        out.replace(block, len(data))
+                        result.changed.append(cat_id)
+                    if cat_id in asked:
+                        result.block_hashes[cat_id] = digest(block)
+                    previous = (raw, data, indent)
+                    line = _indent_after(line, data)
+                    continue
+                if kind == "end":
+                    for cat_id in list(wanted):
+                        update = update_for(cat_id, None)
+                        if update is None:
+                            continue
+                        if previous is None:
+                            raise ValueError(f"{path}: pack has no categories to anchor the layout")
+                        raw, data, indent = previous
+                        display_name = update.id if update.display_name is None else update.display_name
+                        cat = Category(id=update.id, display_name=display_name, words=list(update.words))
+                        block = _render(cat, _detect(raw, data, indent) or "expanded", indent)
+                        out.replace((separator or _DEFAULT_SEPARATOR) + block, 0)
+                        result.changed.append(cat_id)
+                        result.block_hashes[cat_id] = digest(block)
+                    wanted.clear()
+                    continue
+                if kind == "separator" and separator is None:
+                    separator = data
+                out.copy(data)
+                line = _indent_after(line, data)
+        if wanted:
+            raise ValueError(f"{path}: no categories array")
+        result.written = out.commit()
+    finally:
+        out.abort()
+    result.pack_hash = out.hash.hexdigest()
+    return result
+
+
+def apply_updates(updates: Mapping[str, Iterable[CategoryUpdate]]) -> list[Path]:
+    """Apply ``{locale: [CategoryUpdate, ...]}``, streaming each pack through once.
+
+    Returns the paths that were actually rewritten.
+    """
+    written: list[Path] = []
+    for locale, cat_updates in updates.items():
+        by_id = {u.id: u for u in cat_updates}
+        path = pack_path(locale)
+        if rewrite_pack(path, by_id, lambda cat_id, _block: by_id[cat_id]).written:
+            written.append(path)
+    return written
@@ -0,0 +1,199 @@
+"""Build-time port of lib/domain/validation/word_pack_validation.dart, plus extra checks.
+
+``validate_pack`` reproduces ``WordPackValidator.validate()`` exactly (Dart
+``trim()`` whitespace, UTF-16 length, ``toLowerCase()`` duplicates, the
+20-word small-category threshold). ``analyze_packs`` adds checks the app does
+not run, all driven by precomputed normalized keys and hash lookups so a run
+over every pack is linear in the number of words:
+
+* accent/case duplicates ("Pokémon" vs "pokemon") inside a category
+* near duplicates that only differ by a parenthesised qualifier
+  ("Kapanga" vs "Kapanga (Argentina)")
+* the same word in several categories of one pack
+* difficulty balance quotas per category
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+from .model import DIFFICULTIES, Category
+
+# Characters removed by Dart's String.trim().
+_DART_WHITESPACE = (
+    "\u0009\u000a\u000b\u000c\u000d\u0020\u0085\u00a0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000\ufeff"
+)
+_QUALIFIER = re.compile(r"\s*\([^()]*\)\s*$")
+_SPACES = re.compile(r"\s+")
+
+SMALL_CATEGORY_THRESHOLD = 20
+
+
+def dart_trim(text: str) -> str:
+    """Dart ``String.trim()``."""
+    return text.strip(_DART_WHITESPACE)
+
+
+def _dart_length(text: str) -> int:
+    """``String.length`` in Dart counts UTF-16 code units."""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def normalize_key(text: str) -> str:
+    """Case- and accent-insensitive key: casefold, strip combining marks, collapse spaces."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _SPACES.sub(" ", stripped).strip()
+
+
+def base_key(key: str) -> str:
+    """Normalized key without a trailing parenthesised qualifier."""
+    return _QUALIFIER.sub("", key) or key
+
+
+@dataclass
+class ValidationReport:
+    """Same fields as the Dart ``WordPackValidationReport``."""
+
+    locale: str
+    duplicate_words_by_category: dict[str, list[str]] = field(default_factory=dict)
+    short_words_by_category: dict[str, list[str]] = field(default_factory=dict)
+    small_category_counts: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def has_blocking_issues(self) -> bool:
+        return bool(self.short_words_by_category or self.duplicate_words_by_category)
+
+    @property
+    def has_warnings(self) -> bool:
+        return bool(self.small_category_counts)
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "locale": self.locale,
+            "duplicateWordsByCategory": self.duplicate_words_by_category,
+            "shortWordsByCategory": self.short_words_by_category,
+            "smallCategoryCounts": self.small_category_counts,
+            "hasBlockingIssues": self.has_blocking_issues,
+            "hasWarnings": self.has_warnings,
+        }
+
+
+def validate_pack(locale: str, categories: Iterable[Category]) -> ValidationReport:
+    """Exact port of ``WordPackValidator.validate()``."""
+    report = ValidationReport(locale)
+    for category in categories:
+        seen: set[str] = set()
+        duplicates: list[str] = []
+        short: list[str] = []
+        for entry in category.words:
+            trimmed = dart_trim(entry.text)
+            if _dart_length(trimmed) < 2:
+                short.append(entry.text)
+                continue
+            normalized = trimmed.lower()
+            if normalized in seen:
+                duplicates.append(entry.text)
+            else:
+                seen.add(normalized)
+        if duplicates:
+            report.duplicate_words_by_category[category.id] = duplicates
+        if short:
+            report.short_words_by_category[category.id] = short
+        if len(category.words) < SMALL_CATEGORY_THRESHOLD:
+            report.small_category_counts[category.id] = len(category.words)
+    return report
+
+
+@dataclass(frozen=True)
+class BalanceQuota:
+    """Each difficulty needs at least ``min_per_difficulty`` words and at most ``max_share`` of the category."""
+
+    min_per_difficulty: int = 10
+    max_share: float = 0.5
+
+
+def analyze_pack(
+    locale: str,
+    categories: Iterable[Category],
+    quota: BalanceQuota = BalanceQuota(),
+    skip_cross_category: Iterable[str] = ("random",),
+) -> dict[str, Any]:
+    """Dart report plus the extra checks, as a JSON-ready dict."""
+    categories = list(categories)
+    accent_dups: dict[str, list[list[str]]] = {}
+    near_dups: dict[str, list[list[str]]] = {}
+    balance: dict[str, dict[str, Any]] = {}
+    by_key: dict[str, list[tuple[str, str]]] = {}
+    skip = set(skip_cross_category)
+
+    for category in categories:
+        texts_by_key: dict[str, list[str]] = {}
+        for entry in category.words:
+            texts_by_key.setdefault(normalize_key(entry.text), []).append(entry.text)
+
+        # Same key but different spellings (exact repeats are already in the Dart report).
+        groups = [sorted(set(t)) for t in texts_by_key.values() if len(set(t)) > 1]
+        if groups:
+            accent_dups[category.id] = groups
+
+        keys_by_base: dict[str, list[str]] = {}
+        for key in texts_by_key:
+            keys_by_base.setdefault(base_key(key), []).append(key)
+        groups = [
+            sorted(texts_by_key[k][0] for k in keys)
+            for keys in keys_by_base.values()
+            if len(keys) > 1
+        ]
+        if groups:
+            near_dups[category.id] = groups
+
+        if category.id not in skip:
+            for key, texts in texts_by_key.items():
+                by_key.setdefault(key, []).append((category.id, texts[0]))
+
+        counts = Counter(w.difficulty for w in category.words)
+        total = len(category.words)
+        violations = []
+        for diff in DIFFICULTIES:
+            n = counts.get(diff, 0)
+            if n < quota.min_per_difficulty:
+                violations.append(f"{diff}: {n} < {quota.min_per_difficulty}")
+            if total and n / total > quota.max_share:
+                violations.append(f"{diff}: {n}/{total} > {quota.max_share:.0%}")
+        if violations:
+            balance[category.id] = {"counts": {d: counts.get(d, 0) for d in DIFFICULTIES}, "violations": violations}
+
+    cross = [
+        {"key": key, "entries": [{"category": c, "text": t} for c, t in hits]}
+        for key, hits in by_key.items()
+        if len(hits) > 1
+    ]
+
+    return {
+        "dart": validate_pack(locale, categories).to_json(),
+        "accentDuplicates": accent_dups,
+        "nearDuplicates": near_dups,
+        "crossCategoryCollisions": cross,
+        "balance": balance,
+    }
+
+
+def analyze_packs(packs: dict[str, Iterable[Category]], quota: BalanceQuota = BalanceQuota()) -> dict[str, Any]:
+    """Run ``analyze_pack`` over ``{locale: categories}`` and add a summary."""
+    results = {locale: analyze_pack(locale, cats, quota) for locale, cats in packs.items()}
+    summary = {
+        "packs": len(results),
+        "blocking": sorted(loc for loc, r in results.items() if r["dart"]["hasBlockingIssues"]),
+        "accentDuplicates": sum(len(g) for r in results.values() for g in r["accentDuplicates"].values()),
+        "nearDuplicates": sum(len(g) for r in results.values() for g in r["nearDuplicates"].values()),
+        "crossCategoryCollisions": sum(len(r["crossCategoryCollisions"]) for r in results.values()),
+        "balanceViolations": sum(len(r["balance"]) for r in results.values()),
+    }
+    return {"summary": summary, "packs": results}
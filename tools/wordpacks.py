@@ -0,0 +1,615 @@
+"""Word pack build tool.
+
+    python3 tools/wordpacks.py apply [--locale es-AR] [--jobs N] [--dry-run] [--explain] [--no-cache]
+    python3 tools/wordpacks.py extract es-AR marcas random [--expect 40]
+    python3 tools/wordpacks.py validate [--locale es-AR] [--output report.json] [--strict]
+    python3 tools/wordpacks.py near-dups [--threshold 0.7] [--scope category|pack|all]
+    python3 tools/wordpacks.py pack [--locale es-AR] [--out DIR] [--check]
+    python3 tools/wordpacks.py release [--locale es-AR] [--out DIR]
+    python3 tools/wordpacks.py shard [--locale es-AR] [--out DIR] [--check]
+    python3 tools/wordpacks.py draws [--locale es-AR] [--out DIR] [--check]
+    python3 tools/wordpacks.py simulate-draws [--sessions N] [--rounds 30] [--seed 0]
+    python3 tools/wordpacks.py catalog [--locale es-AR] [--out DIR] [--find TEXT]
+    python3 tools/wordpacks.py overlay [--language es] [--out DIR] [--check | --apply]
+    python3 tools/wordpacks.py diff [--locale es-AR] [--from REV] [--to REV] [--json]
+    python3 tools/wordpacks.py delta [--locale es-AR] [--from REV ...] [--out DIR] [--check]
+    python3 tools/wordpacks.py serve [--dir DIR] [--host 127.0.0.1] [--port 8765] [--latency-ms N ...]
+
+``apply`` rewrites assets/words/<locale>.json from tools/manifests/<locale>/*.json,
+touching only packs whose categories actually changed. Inputs whose hashes
+match .cache/wordpacks.db are not parsed, validated or written again;
+``--explain`` prints what was skipped and why. ``extract`` seeds manifests
+from the current packs. ``validate`` runs the app's WordPackValidator rules
+plus near-duplicate, cross-category and difficulty balance checks over the
+packs and prints a JSON report. ``near-dups`` clusters similar entries
+("Los Cafres" / "Los Cafres (Argentina)") with their similarity scores.
+``pack`` emits the binary .wpk encoding (docs/WORD_PACK_FORMAT.md) of each
+pack into build/wordpacks/packed and verifies it round-trips to the JSON.
+``release`` writes minified, key-shortened packs plus a precomputed
+validation index into build/wordpacks/release and reports the byte savings.
+``shard`` splits each pack into a category manifest plus one file per
+category under build/wordpacks/shards/<locale> and checks both layouts agree.
+``draws`` writes the precomputed (category, difficulty) draw pools of each
+pack to build/wordpacks/draws and checks they match game_screen.dart.
+``simulate-draws`` (needs NumPy) compares per-evening repeat rates of the
+current independent draws with the shuffle bag (wordpack/shufflebag.py) for
+every pool of every pack, checks the bag is uniform and agrees with its
+reference implementation, and reports the persisted state size.
+``catalog`` writes a per-locale text report, catalog.csv and a SQLite
+catalog (catalog.db) of every word into build/wordpacks/catalog, re-rendering
+only categories that changed since the last run; ``--find`` searches the
+catalog across locales by accent- and case-insensitive key.
+``overlay`` indexes the words the locales of each language share and writes
+one base pack per language plus an overlay per locale (wordpack/overlay.py)
+into build/wordpacks/overlay/<language>, checking every overlay resolves to
+its pack byte for byte. To edit shared content once, change base.json there
+and run ``overlay --apply``: the packs it changes are rewritten and the
+overlays rebuilt.
+``diff`` prints what changed in each pack between two git revisions (default:
+HEAD and the working tree): categories added, removed or renamed, words
+added or removed, difficulty moves and hint changes (wordpack/delta.py).
+``delta`` publishes each pack's current version into
+build/wordpacks/delta/<locale> with a compact patch from every version
+published before (and from ``--from`` revisions); a pack whose content
+changed needs a higher "version". ``serve`` runs a local stand-in of the
+update endpoint over that directory (tools/standin.py):
+``GET /<locale>/update?from=<hash>`` answers 204 when the client is current,
+else the patch from its version or the full pack. Its fault injection
+flags (``--latency-ms``, ``--fail-rate``, ``--hang-rate``...) simulate a bad
+network.
+
+Every command honours IMPOSTOR_TRACE (see tools/instrument.py): set it to
+time the command and write a trace to build/trace/.
+"""
+
+import argparse
+import json
+import sys
+import time
+import zlib
+
+from collections import Counter
+from pathlib import Path
+
+import instrument
+import standin
+from wordpack import BUILD_DIR, DIFFICULTIES, WORDS_DIR, load_packs
+from wordpack import delta, draws, overlay, packed, release, shards
+from wordpack.catalog import Catalog, CatalogResult
+from wordpack.build import apply_manifests
+from wordpack.cache import BuildCache
+from wordpack.neardup import SCOPES, NearDuplicateIndex
+from wordpack.packfile import ROOT
+from wordpack.validation import BalanceQuota, analyze_packs
+from wordpack.manifest import MANIFESTS_DIR, category_manifest, discover_manifests, dump_manifest
+
+
+def cmd_apply(args: argparse.Namespace) -> int:
+    started = time.perf_counter()
+    with instrument.span("discover manifests"):
+        grouped = discover_manifests(locales=args.locale)
+    if not grouped:
+        print("no manifests found", file=sys.stderr)
+        return 1
+    with BuildCache() as cache:
+        cached = {} if args.no_cache else {loc: s for loc in grouped if (s := cache.load(loc))}
+        try:
+            with instrument.span("apply manifests", locales=len(grouped)):
+                results = apply_manifests(grouped, jobs=args.jobs, dry_run=args.dry_run, cached=cached)
+        except ValueError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 1
+        cache.store([r.state for r in results if r.state is not None])
+    total = sum(len(ms) for ms in grouped.values())
+    for r in results:
+        if args.explain:
+            for note in r.notes:
+                print(note)
+        if r.changed:
+            verb = "would update" if args.dry_run else "updated"
+            print(f"{verb} {r.locale}: {', '.join(r.changed)}")
+    written = sum(r.written for r in results)
+    instrument.count("packs written", written)
+    instrument.count("packs unchanged", len(results) - written)
+    elapsed = time.perf_counter() - started
+    print(f"{total} categories in {len(results)} packs, {written} packs written ({elapsed:.2f}s)")
+    return 0
+
+
+def cmd_extract(args: argparse.Namespace) -> int:
+    pack = load_packs([args.locale])[args.locale]
+    categories = args.categories or list(pack.categories)
+    expect = None
+    if args.expect:
+        expect = {"easy": args.expect, "medium": args.expect, "hard": args.expect}
+    out_dir = MANIFESTS_DIR / args.locale
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for cat_id in categories:
+        if cat_id not in pack.categories:
+            print(f"{args.locale}: unknown category {cat_id}", file=sys.stderr)
+            return 1
+        path = out_dir / f"{cat_id}.json"
+        path.write_text(
+            dump_manifest(category_manifest(pack.categories[cat_id], expect)),
+            encoding="utf-8",
+            newline="\n",
+        )
+        print("wrote", path)
+    return 0
+
+
+def cmd_validate(args: argparse.Namespace) -> int:
+    packs = load_packs(args.locale)
+    quota = BalanceQuota(args.min_per_difficulty, args.max_share)
+    report = analyze_packs({loc: p.categories.values() for loc, p in packs.items()}, quota)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="\n") as f:
+            f.write(text + "\n")
+        print(json.dumps(report["summary"], ensure_ascii=False))
+    else:
+        print(text)
+    return 1 if args.strict and report["summary"]["blocking"] else 0
+
+
+def cmd_near_dups(args: argparse.Namespace) -> int:
+    packs = load_packs(args.locale)
+    index = NearDuplicateIndex.from_packs({loc: p.categories.values() for loc, p in packs.items()})
+    clusters = index.clusters(args.threshold, args.scope)
+    report = {
+        "threshold": args.threshold,
+        "scope": args.scope,
+        "words": len(index.words),
+        "clusters": clusters,
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+def cmd_pack(args: argparse.Namespace) -> int:
+    out_dir = Path(args.out)
+    failures = 0
+    for locale, pack in load_packs(args.locale).items():
+        target = out_dir / f"{locale}.wpk"
+        pack_json = json.loads(pack.text)
+        if args.check:
+            if not target.exists():
+                print(f"{locale}: missing {target}")
+                failures += 1
+                continue
+            blob = target.read_bytes()
+        else:
+            blob = packed.encode(pack.locale, pack.version, pack.categories.values())
+        problems = packed.verify(blob, pack_json)
+        if problems:
+            failures += 1
+            print(f"{locale}: round-trip mismatch: {'; '.join(problems[:5])}")
+            continue
+        if not args.check:
+            out_dir.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(blob)
+        json_size = len(pack.text.encode("utf-8"))
+        print(f"{locale}: {json_size} -> {len(blob)} bytes ({len(blob) / json_size:.0%}), round-trip ok")
+    return 1 if failures else 0
+
+
+def cmd_release(args: argparse.Namespace) -> int:
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    total_before = total_after = 0
+    print(f"{'locale':<8}{'json':>9}{'min':>9}{'saved':>8}{'index':>9}  clean")
+    for locale, pack in load_packs(args.locale).items():
+        pack_json = json.loads(pack.text)
+        try:
+            mini = release.minify(pack_json)
+        except ValueError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 1
+        if release.expand(mini) != pack_json:
+            print(f"{locale}: minified pack does not round-trip", file=sys.stderr)
+            return 1
+        min_text = release.dumps_min(mini)
+        index = release.build_index(pack.locale, pack.version, pack.categories.values(), pack.text)
+        index_text = release.dumps_min(index)
+        (out_dir / f"{locale}.min.json").write_text(min_text, encoding="utf-8", newline="\n")
+        (out_dir / f"{locale}.index.json").write_text(index_text, encoding="utf-8", newline="\n")
+
+        before = len(pack.text.encode("utf-8"))
+        after = len(min_text.encode("utf-8"))
+        total_before += before
+        total_after += after
+        print(
+            f"{locale:<8}{before:>9}{after:>9}{1 - after / before:>8.0%}"
+            f"{len(index_text.encode('utf-8')):>9}  {'yes' if index['clean'] else 'no'}"
+        )
+    print(f"{'total':<8}{total_before:>9}{total_after:>9}{1 - total_after / total_before:>8.0%}")
+    return 0
+
+
+def cmd_shard(args: argparse.Namespace) -> int:
+    out_root = Path(args.out)
+    failures = 0
+    for locale, pack in load_packs(args.locale).items():
+        pack_json = json.loads(pack.text)
+        out_dir = out_root / locale
+        if not args.check:
+            manifest, files = shards.build_shards(pack_json, pack.text)
+            touched = shards.write_shards(out_dir, manifest, files)
+            print(f"{locale}: {len(files)} shards, {len(touched)} files changed")
+        problems = shards.verify_shards(out_dir, pack_json, pack.text)
+        if problems:
+            failures += 1
+            print(f"{locale}: out of sync: {'; '.join(problems[:5])}")
+        elif args.check:
+            print(f"{locale}: in sync")
+    return 1 if failures else 0
+
+
+def cmd_draws(args: argparse.Namespace) -> int:
+    out_dir = Path(args.out)
+    failures = 0
+    for locale, pack in load_packs(args.locale).items():
+        pack_json = json.loads(pack.text)
+        target = out_dir / f"{locale}.draws.json"
+        if args.check:
+            if not target.exists():
+                print(f"{locale}: missing {target}")
+                failures += 1
+                continue
+            index = json.loads(target.read_text(encoding="utf-8"))
+        else:
+            index = draws.build_draws(pack_json, pack.text)
+        problems = draws.verify_draws(index, pack_json, pack.text)
+        if problems:
+            failures += 1
+            print(f"{locale}: draw index differs from the game: {'; '.join(problems[:5])}")
+            continue
+        if not args.check:
+            out_dir.mkdir(parents=True, exist_ok=True)
+            target.write_text(release.dumps_min(index), encoding="utf-8", newline="\n")
+        sizes = " ".join(f"{d}={index['random'][d][1]}" for d in DIFFICULTIES)
+        print(f"{locale}: {len(index['categories'])} categories, random pool {sizes}, matches the game")
+    return 1 if failures else 0
+
+
+def cmd_simulate_draws(args: argparse.Namespace) -> int:
+    try:
+        from wordpack import drawsim
+    except ImportError:
+        print("simulate-draws needs NumPy: pip install numpy", file=sys.stderr)
+        return 1
+    started = time.perf_counter()
+    pools: dict[str, list[int]] = {}
+    for locale, pack in load_packs(args.locale).items():
+        pack_json = json.loads(pack.text)
+        ids = [c["id"] for c in pack_json["categories"] if c["id"] != draws.RANDOM_CATEGORY]
+        pools[locale] = [
+            len(draws.reference_pool(pack_json, cat_id, d))
+            for cat_id in [*ids, draws.RANDOM_CATEGORY]
+            for d in DIFFICULTIES
+        ]
+    sizes = sorted({n for ns in pools.values() for n in ns if n})
+    stats = {}
+    problems = []
+    for n in sizes:
+        for sampler in drawsim.SAMPLERS:
+            stats[sampler, n] = drawsim.simulate(sampler, n, args.sessions, args.rounds, args.seed)
+        problems += drawsim.uniformity(stats["bag", n])
+        mismatch = drawsim.check_reference(n, stats["bag", n], args.rounds, seed=args.seed)
+        if mismatch:
+            problems.append(mismatch)
+
+    print(f"{args.sessions} evenings of {args.rounds} rounds per pool size ({len(sizes)} sizes)")
+    print(f"{'locale':<8}{'pools':>6}{'sizes':>10}  {'repeats/draw':>19}  {'evenings w/ repeat':>19}  {'state bytes':>14}")
+    print(f"{'':<8}{'':>6}{'':>10}  {'indep':>9}{'bag':>10}  {'indep':>9}{'bag':>10}  {'bag':>6}{'bitset':>8}")
+    for locale, ns in pools.items():
+        ns = [n for n in ns if n]
+        row = {}
+        for sampler in drawsim.SAMPLERS:
+            row[sampler] = (
+                sum(stats[sampler, n].repeat_rate for n in ns) / len(ns),
+                sum(stats[sampler, n].repeat_sessions for n in ns) / len(ns),
+            )
+        state = drawsim.state_bytes(ns)
+        print(
+            f"{locale:<8}{len(ns):>6}{f'{min(ns)}-{max(ns)}':>10}  "
+            f"{row['independent'][0]:>9.2%}{row['bag'][0]:>10.2%}  "
+            f"{row['independent'][1]:>9.2%}{row['bag'][1]:>10.2%}  "
+            f"{state['bag']:>6}{state['bitset']:>8}"
+        )
+    for problem in problems:
+        print(f"FAIL {problem}")
+    print(f"bag sampler {'uniform and matches the reference' if not problems else 'FAILED'}"
+          f" ({time.perf_counter() - started:.1f}s)")
+    return 1 if problems else 0
+
+
+def cmd_catalog(args: argparse.Namespace) -> int:
+    started = time.perf_counter()
+    with Catalog(Path(args.out)) as catalog:
+        if args.find:
+            rows = catalog.find(args.find)
+            for locale, category, difficulty, text in rows:
+                print(f"{locale:<7}{category:<22}{difficulty:<8}{text}")
+            print(f"{len(rows)} matches")
+            return 0
+        result = CatalogResult()
+        packs = load_packs(args.locale)
+        for locale, pack in packs.items():
+            catalog.update_locale(locale, pack.categories.values(), result)
+        if not args.locale:
+            catalog.drop_other_locales(packs, result)
+        catalog.write_csv(result)
+    for name in result.regenerated:
+        print(f"regenerated {name}")
+    for name in result.removed:
+        print(f"removed {name}")
+    elapsed = time.perf_counter() - started
+    print(
+        f"{result.sections} sections in {len(packs)} packs, {len(result.regenerated)} regenerated, "
+        f"{len(result.files)} files written ({elapsed:.2f}s)"
+    )
+    return 0
+
+
+def cmd_overlay(args: argparse.Namespace) -> int:
+    out_root = Path(args.out)
+    packs = {
+        locale: pack for locale, pack in load_packs().items()
+        if not args.language or overlay.language_of(locale) in args.language
+    }
+    if args.apply:
+        written = {}
+        try:
+            for language in sorted({overlay.language_of(loc) for loc in packs}):
+                if (out_root / language / overlay.BASE_NAME).exists():
+                    written.update(overlay.resolve_language(out_root / language, packs))
+        except (KeyError, ValueError) as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 1
+        for locale, text in written.items():
+            packs[locale].path.write_text(text, encoding="utf-8", newline="\n")
+            print(f"updated {packs[locale].path.relative_to(ROOT)}")
+        packs = load_packs(packs)
+    pack_index = {loc: json.loads(p.text) for loc, p in packs.items()}
+    try:
+        with instrument.span("build overlays"):
+            built = overlay.build_overlays(packs, pack_index)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    failures = 0
+    totals = [0, 0, 0, 0]
+    for language, (base, overlays) in built.items():
+        out_dir = out_root / language
+        files = overlay.overlay_files(base, overlays)
+        if not args.check:
+            touched = overlay.write_overlays(out_dir, files)
+            print(f"{language}: {len(files)} files, {len(touched)} changed")
+        for row in overlay.overlap_index({loc: pack_index[loc] for loc in overlays}):
+            if row.shared:
+                print(f"  {row.id:<18} {row.shared:>4} of {row.words} entries shared, "
+                      f"{row.everywhere} in all {len(row.locales)} locales")
+        ids = [c["id"] for c in base["categories"]]
+        print(f"  {'base':<8}{len(files[overlay.BASE_NAME].encode('utf-8')):>9}  {', '.join(ids) or '-'}")
+        for locale, ov in overlays.items():
+            kinds = Counter("own" if "words" in e else "edited" if len(e) > 1 else "inherited" for e in ov["categories"])
+            print(f"  {locale:<8}{len(files[f'{locale}.json'].encode('utf-8')):>9}  "
+                  + ", ".join(f"{n} {kind}" for kind, n in sorted(kinds.items())))
+            compact = release.dumps_min(pack_index[locale]).encode("utf-8")
+            totals[0] += len(compact)
+            totals[2] += len(zlib.compress(compact))
+        for text in files.values():
+            totals[1] += len(text.encode("utf-8"))
+            totals[3] += len(zlib.compress(text.encode("utf-8")))
+        problems = overlay.verify_overlays(out_dir, (packs[loc] for loc in overlays))
+        if problems:
+            failures += 1
+            print(f"{language}: out of sync: {'; '.join(problems[:5])}")
+        else:
+            print(f"{language}: {len(overlays)} overlays resolve to their packs byte for byte")
+    if totals[0]:
+        print(f"compact JSON: packs {totals[0]} -> base + overlays {totals[1]} ({1 - totals[1] / totals[0]:.1%} saved), "
+              f"deflated {totals[2]} -> {totals[3]} ({1 - totals[3] / totals[2]:.1%} saved)")
+    return 1 if failures else 0
+
+
+def _revision_packs(rev: str | None, locales: list[str] | None) -> dict[str, dict]:
+    """Pack JSON by locale at a git revision, or in the working tree when ``rev`` is None."""
+    if rev is None:
+        return {loc: json.loads(p.text) for loc, p in load_packs(locales).items()}
+    packs = {}
+    for locale in locales or [p.stem for p in sorted(WORDS_DIR.glob("*.json"))]:
+        pack_json = delta.pack_at(rev, locale)
+        if pack_json is not None:
+            packs[locale] = pack_json
+    return packs
+
+
+def cmd_diff(args: argparse.Namespace) -> int:
+    try:
+        old = _revision_packs(args.from_rev, args.locale)
+        new = _revision_packs(args.to_rev, args.locale)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    report = []
+    for locale in sorted(old.keys() | new.keys()):
+        if locale not in old or locale not in new:
+            print(f"{locale}: {'added' if locale in new else 'removed'}")
+            continue
+        diff = delta.diff_packs(old[locale], new[locale])
+        report.append(diff.to_json())
+        if not args.json:
+            print("\n".join(delta.format_diff(diff)))
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+def cmd_delta(args: argparse.Namespace) -> int:
+    out_root = Path(args.out)
+    failures = 0
+    try:
+        revisions = [_revision_packs(rev, args.locale) for rev in args.from_rev or ()]
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    for locale, pack in load_packs(args.locale).items():
+        new = json.loads(pack.text)
+        out_dir = out_root / locale
+        if not args.check:
+            older = {delta.content_hash(p[locale]): p[locale] for p in revisions if locale in p}
+            try:
+                index, written = delta.publish(out_dir, new, older)
+            except ValueError as e:
+                print(f"error: {e}", file=sys.stderr)
+                return 1
+            patches = ", ".join(f"v{e['from']['v']} {e['bytes']} B" for e in index["patches"]) or "none"
+            print(f"{locale}: v{index['version']} {index['bytes']} B, patches from {patches}; {len(written)} files changed")
+        problems = delta.verify_published(out_dir, new)
+        if problems:
+            failures += 1
+            print(f"{locale}: out of sync: {'; '.join(problems[:5])}")
+        elif args.check:
+            print(f"{locale}: in sync")
+    return 1 if failures else 0
+
+
+def cmd_serve(args: argparse.Namespace) -> int:
+    root = Path(args.dir)
+    if not root.is_dir():
+        print(f"error: {root} does not exist; run `wordpacks.py delta` first", file=sys.stderr)
+        return 1
+
+    def handle(path: str, query: dict[str, str], headers: object) -> standin.Response:
+        parts = [p for p in path.split("/") if p]
+        if not parts:
+            return standin.json_response({
+                loc.name: {k: index[k] for k in ("version", "hash", "bytes")}
+                for loc in sorted(root.iterdir())
+                if (index := delta.read_index(loc)) is not None
+            })
+        out_dir = root / parts[0]
+        if len(parts) != 2 or not delta.LOCALE.fullmatch(parts[0]) or delta.read_index(out_dir) is None:
+            return standin.not_found(path)
+        if parts[1] == "update":
+            kind, file = delta.update_for(out_dir, query.get("from"))
+            if file is None:
+                return standin.Response(204)
+            return standin.file_response(file, {"X-Pack-Update": kind})
+        file = out_dir / parts[1]
+        if not delta.FILE_NAME.fullmatch(parts[1]) or not file.is_file():
+            return standin.not_found(path)
+        return standin.file_response(file)
+
+    standin.serve("wordpacks", handle, args.host, args.port, standin.faults_from_args(args))
+    return 0
+
+
+@instrument.entrypoint
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_apply = sub.add_parser("apply", help="apply manifests to assets/words")
+    p_apply.add_argument("--locale", action="append", help="limit to a locale (repeatable)")
+    p_apply.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    p_apply.add_argument("--dry-run", action="store_true", help="report changes without writing")
+    p_apply.add_argument("--explain", action="store_true", help="print what was skipped and why")
+    p_apply.add_argument("--no-cache", action="store_true", help="ignore .cache/wordpacks.db")
+    p_apply.set_defaults(func=cmd_apply)
+
+    p_extract = sub.add_parser("extract", help="write manifests from the current packs")
+    p_extract.add_argument("locale")
+    p_extract.add_argument("categories", nargs="*", help="category ids (default: all)")
+    p_extract.add_argument("--expect", type=int, help="required word count per difficulty")
+    p_extract.set_defaults(func=cmd_extract)
+
+    p_validate = sub.add_parser("validate", help="validate packs and print a JSON report")
+    p_validate.add_argument("--locale", action="append", help="limit to a locale (repeatable)")
+    p_validate.add_argument("--output", help="write the full report here and print only the summary")
+    p_validate.add_argument("--min-per-difficulty", type=int, default=BalanceQuota.min_per_difficulty)
+    p_validate.add_argument("--max-share", type=float, default=BalanceQuota.max_share)
+    p_validate.add_argument("--strict", action="store_true", help="exit 1 if a pack has blocking issues")
+    p_validate.set_defaults(func=cmd_validate)
+
+    p_near = sub.add_parser("near-dups", help="cluster near-duplicate words")
+    p_near.add_argument("--locale", action="append", help="limit to a locale (repeatable)")
+    p_near.add_argument("--threshold", type=float, default=0.7, help="minimum trigram Jaccard similarity")
+    p_near.add_argument("--scope", choices=SCOPES, default="category", help="compare words within this group")
+    p_near.set_defaults(func=cmd_near_dups)
+
+    p_pack = sub.add_parser("pack", help="emit and verify the binary .wpk packs")
+    p_pack.add_argument("--locale", action="append", help="limit to a locale (repeatable)")
+    p_pack.add_argument("--out", default=str(BUILD_DIR / "packed"), help="output directory")
+    p_pack.add_argument("--check", action="store_true", help="only verify existing .wpk files")
+    p_pack.set_defaults(func=cmd_pack)
+
+    p_release = sub.add_parser("release", help="emit minified packs and validation indexes")
+    p_release.add_argument("--locale", action="append", help="limit to a locale (repeatable)")
+    p_release.add_argument("--out", default=str(BUILD_DIR / "release"), help="output directory")
+    p_release.set_defaults(func=cmd_release)
+
+    p_shard = sub.add_parser("shard", help="split packs into a manifest plus per-category shards")
+    p_shard.add_argument("--locale", action="append", help="limit to a locale (repeatable)")
+    p_shard.add_argument("--out", default=str(BUILD_DIR / "shards"), help="output directory")
+    p_shard.add_argument("--check", action="store_true", help="only verify existing shards")
+    p_shard.set_defaults(func=cmd_shard)
+
+    p_draws = sub.add_parser("draws", help="emit precomputed draw pools and check them against the game")
+    p_draws.add_argument("--locale", action="append", help="limit to a locale (repeatable)")
+    p_draws.add_argument("--out", default=str(BUILD_DIR / "draws"), help="output directory")
+    p_draws.add_argument("--check", action="store_true", help="only verify existing indexes")
+    p_draws.set_defaults(func=cmd_draws)
+
+    p_sim = sub.add_parser("simulate-draws", help="simulate repeat rates of independent draws vs the shuffle bag")
+    p_sim.add_argument("--locale", action="append", help="limit to a locale (repeatable)")
+    p_sim.add_argument("--sessions", type=int, default=200_000, help="simulated evenings per pool size")
+    p_sim.add_argument("--rounds", type=int, default=30, help="rounds per evening")
+    p_sim.add_argument("--seed", type=int, default=0)
+    p_sim.set_defaults(func=cmd_simulate_draws)
+
+    p_catalog = sub.add_parser("catalog", help="write the text/CSV/SQLite word catalog")
+    p_catalog.add_argument("--locale", action="append", help="limit to a locale (repeatable)")
+    p_catalog.add_argument("--out", default=str(BUILD_DIR / "catalog"), help="output directory")
+    p_catalog.add_argument("--find", help="search the catalog instead of updating it")
+    p_catalog.set_defaults(func=cmd_catalog)
+
+    p_overlay = sub.add_parser("overlay", help="emit a base pack per language plus regional overlays")
+    p_overlay.add_argument("--language", action="append", help="limit to a language such as es (repeatable)")
+    p_overlay.add_argument("--out", default=str(BUILD_DIR / "overlay"), help="output directory")
+    mode = p_overlay.add_mutually_exclusive_group()
+    mode.add_argument("--check", action="store_true", help="only verify existing overlays")
+    mode.add_argument("--apply", action="store_true", help="write edited overlays back to assets/words first")
+    p_overlay.set_defaults(func=cmd_overlay)
+
+    p_diff = sub.add_parser("diff", help="show what changed in the packs between two git revisions")
+    p_diff.add_argument("--locale", action="append", help="limit to a locale (repeatable)")
+    p_diff.add_argument("--from", dest="from_rev", default="HEAD", help="old revision (default: HEAD)")
+    p_diff.add_argument("--to", dest="to_rev", help="new revision (default: the working tree)")
+    p_diff.add_argument("--json", action="store_true", help="print the diff as JSON")
+    p_diff.set_defaults(func=cmd_diff)
+
+    p_delta = sub.add_parser("delta", help="publish the packs with delta patches from older versions")
+    p_delta.add_argument("--locale", action="append", help="limit to a locale (repeatable)")
+    p_delta.add_argument("--from", dest="from_rev", action="append", help="also patch from this git revision (repeatable)")
+    p_delta.add_argument("--out", default=str(BUILD_DIR / "delta"), help="output directory")
+    p_delta.add_argument("--check", action="store_true", help="only verify the published versions")
+    p_delta.set_defaults(func=cmd_delta)
+
+    p_serve = sub.add_parser("serve", help="serve the published packs and patches locally")
+    p_serve.add_argument("--dir", default=str(BUILD_DIR / "delta"), help="directory written by delta")
+    p_serve.add_argument("--host", default="127.0.0.1")
+    p_serve.add_argument("--port", type=int, default=8765)
+    standin.add_fault_arguments(p_serve)
+    p_serve.set_defaults(func=cmd_serve)
+
+    args = parser.parse_args()
+    with instrument.span(args.command):
+        return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())